@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+name: session_cache
+type: aggregate
+short_description: Deletes the cached iDRAC and OpenManage Enterprise sessions at the end of the playbook.
+description:
+  - The iDRAC and OpenManage Enterprise modules reuse their X-Auth-Token sessions across tasks and forks
+    when the environment variable C(OMAM_SESSION_CACHE_DIR) is set.
+  - This plugin deletes the sessions stored in C(OMAM_SESSION_CACHE_DIR) on their hosts and clears the cache
+    once the playbook completes.
+version_added: "9.10.0"
+options:
+  session_cache_dir:
+    description:
+      - Directory of the session cache, the same directory as C(OMAM_SESSION_CACHE_DIR) of the modules.
+    type: path
+    env:
+      - name: OMAM_SESSION_CACHE_DIR
+requirements:
+  - "python >= 3.9.6"
+author:
+  - "Rajshekar P(@rajshekarp87)"
+notes:
+  - Enable this plugin with I(callbacks_enabled) in the [defaults] section of C(ansible.cfg).
+  - Sessions which cannot be deleted are removed from the cache and expire on their host.
+"""
+
+from ansible.plugins.callback import CallbackBase
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import SessionCache
+
+
+class CallbackModule(CallbackBase):
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "dellemc.openmanage.session_cache"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def v2_playbook_on_stats(self, stats):
+        cache_dir = self.get_option("session_cache_dir")
+        if not cache_dir:
+            return
+        count = SessionCache(cache_dir).purge()
+        self._display.vvv("Deleted {0} cached session(s) from {1}.".format(count, cache_dir))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options:
+  hosts:
+    type: list
+    elements: dict
+    description:
+      - List of iDRACs queried concurrently from a single task instead of I(idrac_ip).
+      - The options of a host override the top level options of the task, hosts without
+        credentials use I(idrac_user) and I(idrac_password).
+      - The results are returned in I(hosts), the task fails only when none of the hosts could be queried.
+      - I(hosts) is mutually exclusive with I(idrac_ip).
+    version_added: 9.10.0
+    suboptions:
+      idrac_ip:
+        type: str
+        required: true
+        description: iDRAC IP Address.
+      idrac_user:
+        type: str
+        description: iDRAC username of the host.
+      idrac_password:
+        type: str
+        description: iDRAC user password of the host.
+        aliases: ['idrac_pwd']
+      idrac_port:
+        type: int
+        description: iDRAC port of the host.
+      timeout:
+        type: int
+        description: The socket level timeout in seconds for the host.
+  max_workers:
+    type: int
+    description:
+      - Maximum number of hosts of I(hosts) queried in parallel.
+      - C(1) queries the hosts one after the other.
+    default: 8
+    version_added: 9.10.0
+'''
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.4.0
-# Copyright (C) 2022-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -76,22 +76,33 @@ options:
     description: To include group variables in the inventory source.
     type: dict
     required: false
+  max_workers:
+    description:
+    - Maximum number of groups for which the devices and the sub groups are retrieved in parallel.
+    - C(1) retrieves the groups one after the other.
+    type: int
+    default: 8
+    version_added: 9.10.0
+extends_documentation_fragment:
+  - inventory_cache
 requirements:
   - "python >= 3.9.6"
 author:
   - "Felix Stephen (@felixs88)"
 notes:
   - Run this plugin on a system that has direct access to Dell OpenManage Enterprise.
+  - A single X-Auth-Token session is created on OpenManage Enterprise for each inventory run.
+  - Set I(cache=true) to reuse the retrieved groups and hosts until I(cache_timeout) expires.
 """
 
-from ansible.plugins.inventory import BaseInventoryPlugin
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination, run_concurrently
 
 GROUP_API = "GroupService/Groups"
 
 
-class InventoryModule(BaseInventoryPlugin):
+class InventoryModule(BaseInventoryPlugin, Cacheable):
 
     NAME = "dellemc.openmanage.ome_inventory"
 
@@ -99,16 +110,23 @@ class InventoryModule(BaseInventoryPlugin):
         super(InventoryModule, self).__init__()
         self.config = None
 
-    def _get_connection_resp(self):
+    def _get_module_params(self):
         port = self.get_option("port") if "port" in self.config else 443
         validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
         module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
                          "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
         if "ca_path" in self.config:
             module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
+        if "timeout" in self.config:
+            module_params.update({"timeout": self.get_option("timeout")})
+        return module_params
+
+    def _get_connection_resp(self):
+        with RestOME(self._get_module_params(), req_session=True) as ome:
             all_group_data = get_all_data_with_pagination(ome, GROUP_API)
-        return all_group_data
+            group_data = self._filter_groups(all_group_data.get("report_list", []))
+            group_tree = self._get_group_tree(ome, group_data)
+        return group_tree
 
     def _set_host_vars(self, host):
         self.inventory.set_variable(host, "idrac_ip", host)
@@ -136,73 +154,81 @@ class InventoryModule(BaseInventoryPlugin):
             dev_host = mgmt["DeviceManagement"][0]["NetworkAddress"]
         return dev_host
 
-    def _get_all_devices(self, device_uri):
+    def _get_all_devices(self, ome, device_uri):
         device_host = []
         device_host_uri = device_uri.strip("/api/")
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {
-            "hostname": self.get_option("hostname"),
-            "username": self.get_option("username"),
-            "password": self.get_option("password"),
-            "port": port,
-            "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            device_resp = get_all_data_with_pagination(ome, device_host_uri)
-            device_data = device_resp.get("report_list", [])
-            if device_data is not None:
-                for mgmt in device_data:
-                    if (len(mgmt["DeviceManagement"]) != 0):
-                        device_host.append(self._get_device_host(mgmt))
+        device_resp = get_all_data_with_pagination(ome, device_host_uri)
+        device_data = device_resp.get("report_list", [])
+        if device_data is not None:
+            for mgmt in device_data:
+                if (len(mgmt["DeviceManagement"]) != 0):
+                    device_host.append(self._get_device_host(mgmt))
         return device_host
 
-    def _set_child_group(self, group_data):
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
-                         "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            for gdata in group_data:
-                group_name = gdata["Name"]
-                subgroup_uri = gdata["SubGroups@odata.navigationLink"].strip("/api/")
-                sub_group = get_all_data_with_pagination(ome, subgroup_uri)
-                gdata = sub_group.get("report_list", [])
-                if gdata:
-                    self._add_group_data(gdata)
-                    self._add_child_group_data(group_name, gdata)
-
-    def _add_child_group_data(self, group_name, gdata):
-        for child_name in gdata:
-            self.inventory.add_child(group_name, child_name["Name"])
-
-    def _add_group_data(self, group_data):
-        visible_gdata = list(filter(lambda d: d.get("Visible") in [False], group_data))
-        if visible_gdata:
-            for gp in visible_gdata:
-                group_data.remove(gp)
-        for gdata in group_data:
-            self._set_group_vars(gdata["Name"])
-            device_ip = self._get_all_devices(gdata["AllLeafDevices@odata.navigationLink"])
-            for hst in device_ip:
-                self.inventory.add_host(host=hst, group=gdata["Name"])
-                self._set_host_vars(hst)
-        self._set_child_group(group_data)
-
-    def _populate(self, all_group_data):
-        group_data = all_group_data.get("report_list", [])
+    def _get_group_details(self, ome, gdata):
+        device_host = self._get_all_devices(ome, gdata["AllLeafDevices@odata.navigationLink"])
+        subgroup_uri = gdata["SubGroups@odata.navigationLink"].strip("/api/")
+        sub_group = get_all_data_with_pagination(ome, subgroup_uri)
+        return device_host, sub_group.get("report_list") or []
+
+    def _get_group_tree(self, ome, group_data):
+        """
+        Walks the groups one level at a time, the devices and the sub groups of all the groups
+        in a level are retrieved in parallel.
+        :return: dict, group name mapped to its hosts and visible child group names.
+        """
+        group_tree = {}
+        max_workers = self.get_option("max_workers")
+        level = group_data
+        while level:
+            visible_groups, seen = [], set()
+            for gdata in level:
+                if gdata.get("Visible") is not False and gdata["Name"] not in group_tree and gdata["Name"] not in seen:
+                    seen.add(gdata["Name"])
+                    visible_groups.append(gdata)
+            group_details = run_concurrently(lambda gdata: self._get_group_details(ome, gdata),
+                                             visible_groups, max_workers)
+            level = []
+            for gdata, (device_host, sub_groups) in zip(visible_groups, group_details):
+                visible_sub_groups = [sub for sub in sub_groups if sub.get("Visible") is not False]
+                group_tree[gdata["Name"]] = {"hosts": device_host,
+                                             "children": [sub["Name"] for sub in visible_sub_groups]}
+                level.extend(visible_sub_groups)
+        return group_tree
+
+    def _filter_groups(self, group_data):
         group_name = str(self.get_option("ome_group_name")) if "ome_group_name" in self.config else None
         if group_name is not None:
             group_data = list(filter(lambda d: d.get("Name").lower() in [group_name.lower()], group_data))
         elif group_name is None:
             group_data = list(filter(lambda d: d.get("Name") in ["All Devices"], group_data))
-        self._add_group_data(group_data)
+        return group_data
+
+    def _populate(self, group_tree):
+        for group_name, gdata in group_tree.items():
+            self._set_group_vars(group_name)
+            for hst in gdata["hosts"]:
+                self.inventory.add_host(host=hst, group=group_name)
+                self._set_host_vars(hst)
+        for group_name, gdata in group_tree.items():
+            for child_name in gdata["children"]:
+                self.inventory.add_child(group_name, child_name)
 
     def parse(self, inventory, loader, path, cache=True):
         super(InventoryModule, self).parse(inventory, loader, path, cache)
         self.config = self._read_config_data(path)
-        all_group_data = self._get_connection_resp()
-        self._populate(all_group_data)
+        cache_key = self.get_cache_key(path)
+        user_cache_setting = self.get_option("cache")
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
+        group_tree = None
+        if attempt_to_read_cache:
+            try:
+                group_tree = self._cache[cache_key]
+            except KeyError:
+                cache_needs_update = True
+        if group_tree is None:
+            group_tree = self._get_connection_resp()
+        if cache_needs_update:
+            self._cache[cache_key] = group_tree
+        self._populate(group_tree)
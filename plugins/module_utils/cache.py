@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import binascii
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from ansible.module_utils import urls
+from ansible.module_utils.common.text.converters import to_bytes
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_ome_version
+
+CACHE_DIR_ENV = "OMAM_CACHE_DIR"
+CACHE_TTL_ENV = "OMAM_CACHE_TTL"
+CACHE_MAX_SIZE_ENV = "OMAM_CACHE_MAX_SIZE"
+DEFAULT_CACHE_TTL = 86400
+DEFAULT_CACHE_MAX_SIZE = 256
+CACHE_FILE_SUFFIX = ".json"
+LOCK_FILE = ".lock"
+SESSION_CACHE_DIR_ENV = "OMAM_SESSION_CACHE_DIR"
+SESSION_CACHE_TTL_ENV = "OMAM_SESSION_CACHE_TTL"
+DEFAULT_SESSION_CACHE_TTL = 1800
+SESSION_KEY_ITERATIONS = 10000
+
+
+def _get_int_env(name, default):
+    try:
+        return max(int(os.environ.get(name, default)), 0)
+    except ValueError:
+        return default
+
+
+class ResponseCache(object):
+    """
+    On-disk cache for reference data which only changes when the appliance is upgraded.
+    Entries are stored as one JSON file each, named after the SHA-256 hash of the key, so
+    they are shared by all the module runs and forks using the same directory.
+    Files are written to a temporary file and renamed, readers never see a partial entry.
+    Entries expire after the TTL and the least recently used ones are removed when the
+    directory grows over the size limit.
+    """
+
+    def __init__(self, cache_dir=None, ttl=DEFAULT_CACHE_TTL, max_size=DEFAULT_CACHE_MAX_SIZE * 1024 * 1024):
+        """
+        :param cache_dir: directory of the cache, None disables the cache
+        :param ttl: seconds after which an entry expires, 0 disables the cache
+        :param max_size: maximum size in bytes of all the entries
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_size = max_size
+
+    @classmethod
+    def from_env(cls):
+        """Returns the cache configured with OMAM_CACHE_DIR, OMAM_CACHE_TTL and OMAM_CACHE_MAX_SIZE."""
+        return cls(os.environ.get(CACHE_DIR_ENV) or None,
+                   ttl=_get_int_env(CACHE_TTL_ENV, DEFAULT_CACHE_TTL),
+                   max_size=_get_int_env(CACHE_MAX_SIZE_ENV, DEFAULT_CACHE_MAX_SIZE) * 1024 * 1024)
+
+    @property
+    def enabled(self):
+        return bool(self.cache_dir) and self.ttl > 0
+
+    @staticmethod
+    def _digest(key):
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, self._digest(key) + CACHE_FILE_SUFFIX)
+
+    def get(self, key):
+        """
+        Returns the data stored for the key or None when it is missing or expired.
+        :param key: JSON serializable list identifying the data
+        """
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path) as cache_file:
+                entry = json.load(cache_file)
+            if entry.get("key") != json.loads(json.dumps(key)) or time.time() - entry["created"] > self.ttl:
+                return None
+            os.utime(path, None)
+            return entry["data"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def set(self, key, data):
+        """
+        Stores the data for the key. Errors writing the cache are ignored, the cache is
+        only an optimization.
+        :param key: JSON serializable list identifying the data
+        :param data: JSON serializable data
+        :raises TypeError: when the key or the data is not JSON serializable
+        """
+        if not self.enabled:
+            return
+        content = json.dumps({"key": key, "created": time.time(), "data": data})
+        tmp_path = None
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, mode=0o700)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as tmp_file:
+                tmp_file.write(content)
+            os.replace(tmp_path, self._path(key))
+            tmp_path = None
+            self.evict()
+        except OSError:
+            pass
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def evict(self):
+        """Removes the expired entries, then the least recently used ones until the size limit is met."""
+        with open(os.path.join(self.cache_dir, LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            entries, total, now = [], 0, time.time()
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(CACHE_FILE_SUFFIX):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                    if now - stat.st_mtime > self.ttl:
+                        self._remove_entry(path)
+                        continue
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            for dummy, size, path in sorted(entries):
+                if total <= self.max_size:
+                    break
+                try:
+                    self._remove_entry(path)
+                except OSError:
+                    pass
+                total -= size
+
+    def _remove_entry(self, path):
+        """Removes an entry dropped by evict."""
+        os.remove(path)
+
+    def remove(self, key):
+        """Removes the entry of the key."""
+        if not self.enabled:
+            return
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def entries(self):
+        """Yields the path and the content of every entry, expired ones included."""
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return
+        for name in sorted(os.listdir(self.cache_dir)):
+            if not name.endswith(CACHE_FILE_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                with open(path) as cache_file:
+                    yield path, json.load(cache_file)
+            except (OSError, ValueError):
+                continue
+
+    def get_or_fetch(self, key, fetch):
+        """Returns the data stored for the key, calls fetch and stores its result when there is none."""
+        data = self.get(key)
+        if data is None:
+            data = fetch()
+            self.set(key, data)
+        return data
+
+
+def get_ome_cached(rest_obj, name, fetch):
+    """
+    Returns OpenManage Enterprise reference data from the cache configured with OMAM_CACHE_DIR.
+    The data is kept per appliance host, port and version, so it is fetched again after the
+    appliance is upgraded. Without OMAM_CACHE_DIR the data is always fetched.
+    :param rest_obj: RestOME object
+    :param name: name of the data, usually the URI it is read from
+    :param fetch: callable returning JSON serializable data
+    """
+    cache = ResponseCache.from_env()
+    if not cache.enabled:
+        return fetch()
+    if getattr(rest_obj, "appliance_version", None) is None:
+        rest_obj.appliance_version = get_ome_version(rest_obj)
+    key = ["ome", rest_obj.hostname, rest_obj.port, rest_obj.appliance_version, name]
+    return cache.get_or_fetch(key, fetch)
+
+
+class SessionCache(ResponseCache):
+    """
+    Cache of the X-Auth-Token sessions created by the modules, enabled with OMAM_SESSION_CACHE_DIR.
+    Sessions are kept per base URL, user and password so that the tasks and forks of a play
+    reuse the session of a host instead of creating and deleting one in every task.
+    The password is only stored as a PBKDF2 hash, and the tokens are written with owner only
+    permissions.
+    """
+
+    @classmethod
+    def from_env(cls):
+        """Returns the cache configured with OMAM_SESSION_CACHE_DIR and OMAM_SESSION_CACHE_TTL."""
+        return cls(os.environ.get(SESSION_CACHE_DIR_ENV) or None,
+                   ttl=_get_int_env(SESSION_CACHE_TTL_ENV, DEFAULT_SESSION_CACHE_TTL))
+
+    @staticmethod
+    def session_key(base_url, username, password):
+        """Returns the key of the session of a user, a changed password does not reuse the session."""
+        secret = hashlib.pbkdf2_hmac("sha256", to_bytes(password or ""), to_bytes("{0}|{1}".format(base_url, username)),
+                                     SESSION_KEY_ITERATIONS)
+        return ["session", base_url, username, binascii.hexlify(secret).decode("ascii")]
+
+    @contextmanager
+    def lock(self, key):
+        """Serializes the access to a session across processes."""
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, mode=0o700)
+        with open(os.path.join(self.cache_dir, self._digest(key) + LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def acquire(self, key, create, validate):
+        """
+        Returns the cached session of the key when validate accepts it, otherwise the one returned
+        by create, which is stored for the next tasks.
+        :param key: key returned by session_key
+        :param create: callable returning a dict with the 'Id', 'Token' and 'Url' of a new session
+        :param validate: callable receiving the cached session and returning whether it is alive
+        """
+        with self.lock(key):
+            session = self.get(key)
+            if session is None or not validate(session):
+                session = create()
+                self.set(key, session)
+        return session
+
+    def purge(self, validate_certs=False, ca_path=None, timeout=30):
+        """
+        Deletes every cached session on its host and removes it from the cache, errors deleting a
+        session are ignored as the session expires on the host anyway.
+        :returns: number of sessions removed
+        """
+        count = 0
+        for path, entry in list(self.entries()):
+            self.close_session(entry.get("data") or {}, validate_certs, ca_path, timeout)
+            try:
+                os.remove(path)
+                count += 1
+            except OSError:
+                pass
+        return count
+
+    @staticmethod
+    def close_session(session, validate_certs=False, ca_path=None, timeout=30):
+        """Deletes a cached session on its host, errors are ignored as the session expires on the host anyway."""
+        if session.get("Url") and session.get("Token"):
+            try:
+                urls.open_url(session["Url"], method="DELETE", headers={"X-Auth-Token": session["Token"]},
+                              validate_certs=session.get("ValidateCerts", validate_certs),
+                              ca_path=session.get("CaPath", ca_path), timeout=timeout)
+            except Exception:
+                pass
+
+    def _remove_entry(self, path):
+        """Deletes the session of an evicted entry on its host, so it does not stay open until it times out."""
+        try:
+            with open(path) as cache_file:
+                self.close_session(json.load(cache_file).get("data") or {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        os.remove(path)
+
+
+def build_registry_index(attributes, value_key="ValueName"):
+    """
+    Compiles the 'Attributes' entries of an attribute registry into an index keyed by the attribute name,
+    keeping only what is needed to validate a value: whether it is read only, its type, the values of an
+    enumeration and the bounds of an integer.
+    :param attributes: 'RegistryEntries' 'Attributes' list of the registry
+    :param value_key: key of the enumeration values compared with the requested value
+    :return: dict which is JSON serializable
+    """
+    index = {}
+    for attr in attributes:
+        entry = {"ReadOnly": bool(attr.get("ReadOnly", attr.get("Readonly", False))), "Type": attr.get("Type")}
+        if entry["Type"] == "Enumeration":
+            entry["Values"] = [val.get(value_key) for val in attr.get("Value", [])]
+        elif entry["Type"] == "Integer":
+            entry["LowerBound"] = attr.get("LowerBound")
+            entry["UpperBound"] = attr.get("UpperBound")
+        index[attr["AttributeName"]] = entry
+    return index
+
+
+def load_registry_index(index):
+    """Returns the index with the enumeration values as sets, so each value is checked in constant time."""
+    return dict((name, dict(entry, Values=frozenset(entry["Values"])) if "Values" in entry else entry)
+                for name, entry in index.items())
+
+
+def get_registry_index(key, fetch, value_key="ValueName"):
+    """
+    Returns the index of an attribute registry from the cache configured with OMAM_CACHE_DIR.
+    A registry only changes with the model and the firmware, so the index is shared by all the
+    servers of the same model and firmware version.
+    :param key: list identifying the registry, such as the registry name, system model and firmware
+      version, the cache is not used when a part of the key is unknown
+    :param fetch: callable returning the 'Attributes' entries of the registry
+    :param value_key: key of the enumeration values compared with the requested value
+    """
+    cache = ResponseCache.from_env()
+    key = ["registry"] + list(key)
+    index = cache.get(key) if all(key) else None
+    if index is None:
+        index = build_registry_index(fetch(), value_key)
+        if index and all(key):
+            cache.set(key, index)
+    return load_registry_index(index)
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import atexit
+import base64
+import io
+import os
+import socket
+import ssl
+import threading
+import time
+from ansible.module_utils import urls
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlparse, urljoin
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf import get_recorder
+
+POOL_SIZE_ENV = "OMAM_HTTP_POOL_SIZE"
+DEFAULT_POOL_SIZE = 4
+MAX_REDIRECTS = 10
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+HTTP_AGENT = "ansible-httpget"
+DEFAULT_PORTS = {"http": 80, "https": 443}
+POOLED_URL_KWARGS = frozenset(["method", "headers", "validate_certs", "ca_path", "use_proxy", "timeout",
+                               "follow_redirects", "url_username", "url_password", "force_basic_auth"])
+STALE_CONNECTION_ERRORS = (http_client.RemoteDisconnected, http_client.BadStatusLine,
+                           ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+
+def get_pool_size():
+    """Returns the number of idle keep-alive connections kept per host, 0 disables pooling."""
+    try:
+        return max(int(os.environ.get(POOL_SIZE_ENV, DEFAULT_POOL_SIZE)), 0)
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+class ConnectionPool(object):
+    """Keeps idle HTTP/1.1 keep-alive connections per scheme, host, port and TLS settings."""
+
+    def __init__(self, maxsize=DEFAULT_POOL_SIZE):
+        self.maxsize = maxsize
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns an idle connection for the key or None."""
+        with self._lock:
+            conns = self._idle.get(key)
+            if conns:
+                return conns.pop()
+        return None
+
+    def put(self, key, conn):
+        """Returns a connection to the pool, closing it when the pool for the key is full."""
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.maxsize:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def clear(self):
+        """Closes all the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_POOL = ConnectionPool(get_pool_size())
+_SSL_CONTEXTS = {}
+_SSL_LOCK = threading.Lock()
+atexit.register(_POOL.clear)
+
+
+def get_ssl_context(validate_certs=True, ca_path=None):
+    """Returns a shared SSL context for the given certificate validation settings."""
+    key = (bool(validate_certs), ca_path)
+    with _SSL_LOCK:
+        context = _SSL_CONTEXTS.get(key)
+        if context is None:
+            if validate_certs:
+                context = ssl.create_default_context(cafile=ca_path)
+            else:
+                context = ssl.create_default_context()
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            _SSL_CONTEXTS[key] = context
+    return context
+
+
+class PooledResponse(object):
+    """File like HTTP response which hands its connection back to the pool once the body is read."""
+
+    def __init__(self, pool, key, conn, response, url, retries=0):
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._response = response
+        self.url = url
+        self.retries = retries
+        self.status = self.code = response.status
+        self.reason = response.reason
+        self.headers = self.msg = response.msg
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def read(self, amt=None):
+        data = self._response.read() if amt is None else self._response.read(amt)
+        if self._response.isclosed():
+            self._release()
+        return data
+
+    def _release(self):
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        if self._response.will_close:
+            conn.close()
+        else:
+            self._pool.put(self._key, conn)
+
+    def close(self):
+        """Closes the response, a partially read connection cannot be reused."""
+        if not self._response.isclosed():
+            self._response.close()
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                conn.close()
+        self._release()
+
+
+def _new_connection(parsed, timeout, validate_certs, ca_path):
+    port = parsed.port or DEFAULT_PORTS[parsed.scheme]
+    if parsed.scheme == "https":
+        return http_client.HTTPSConnection(parsed.hostname, port, timeout=timeout,
+                                           context=get_ssl_context(validate_certs, ca_path))
+    return http_client.HTTPConnection(parsed.hostname, port, timeout=timeout)
+
+
+def _send(pool, key, parsed, method, data, headers, timeout, validate_certs, ca_path):
+    path = parsed.path or "/"
+    if parsed.query:
+        path = "{0}?{1}".format(path, parsed.query)
+    conn = pool.get(key)
+    retries = 0
+    while True:
+        reused = conn is not None
+        if not reused:
+            conn = _new_connection(parsed, timeout, validate_certs, ca_path)
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        conn.timeout = timeout
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            return conn, conn.getresponse(), retries
+        except STALE_CONNECTION_ERRORS as err:
+            conn.close()
+            if not reused:
+                raise URLError(err)
+            conn = None
+            retries += 1
+        except (socket.error, ssl.SSLError, http_client.HTTPException) as err:
+            conn.close()
+            raise URLError(err)
+
+
+def _is_poolable(url, kwargs):
+    if not _POOL.maxsize or not POOLED_URL_KWARGS.issuperset(kwargs):
+        return False
+    if kwargs.get("follow_redirects") != "all":
+        return False
+    if kwargs.get("url_username") and not kwargs.get("force_basic_auth"):
+        return False
+    parsed = urlparse(url)
+    if parsed.scheme not in DEFAULT_PORTS or not parsed.hostname:
+        return False
+    if kwargs.get("use_proxy", True) and getproxies().get(parsed.scheme) and not proxy_bypass(parsed.hostname):
+        return False
+    return True
+
+
+def _content_length(headers):
+    try:
+        return int(headers.get("Content-Length") or 0)
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+def _body_size(data, headers):
+    if isinstance(data, (bytes, str)):
+        return len(data)
+    return _content_length(headers or {})
+
+
+def open_url(url, data=None, **kwargs):
+    """
+    Drop-in replacement for :func:`ansible.module_utils.urls.open_url` which reuses
+    keep-alive connections and SSL contexts across requests to the same host.
+    Requests using options which are not handled here, or going through a proxy,
+    are sent with :func:`ansible.module_utils.urls.open_url`.
+    When the instrumentation is enabled with OMAM_PERF or OMAM_PERF_TRACE, every request is
+    recorded with its latency, status, sizes and retries.
+    :arg url: URL to request
+    :arg data: (optional) Payload to send with the request
+    :returns: file like response object
+    """
+    recorder = get_recorder()
+    if not recorder.enabled:
+        return _open_url(url, data, kwargs)
+    method = (kwargs.get("method") or ("POST" if data is not None else "GET")).upper()
+    status, headers, retries = None, None, 0
+    start = time.monotonic()
+    try:
+        resp = _open_url(url, data, kwargs)
+        status, headers = getattr(resp, "status", None), getattr(resp, "headers", None)
+        retries = getattr(resp, "retries", 0)
+        return resp
+    except HTTPError as err:
+        status, headers = err.code, err.headers
+        raise
+    finally:
+        recorder.record_request(method, url, status, time.monotonic() - start,
+                                bytes_sent=_body_size(data, kwargs.get("headers")),
+                                bytes_received=_content_length(headers), retries=retries)
+
+
+def _open_url(url, data, kwargs):
+    if not _is_poolable(url, kwargs):
+        return urls.open_url(url, data=data, **kwargs)
+    method = (kwargs.get("method") or ("POST" if data is not None else "GET")).upper()
+    validate_certs = kwargs.get("validate_certs", True)
+    ca_path = kwargs.get("ca_path")
+    timeout = kwargs.get("timeout", 10)
+    headers = {"User-Agent": HTTP_AGENT}
+    headers.update(kwargs.get("headers") or {})
+    if kwargs.get("force_basic_auth") and kwargs.get("url_username"):
+        credentials = "{0}:{1}".format(kwargs["url_username"], kwargs.get("url_password") or "")
+        headers["Authorization"] = "Basic {0}".format(base64.b64encode(credentials.encode("utf-8")).decode("ascii"))
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    for dummy in range(MAX_REDIRECTS + 1):
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.hostname, parsed.port, bool(validate_certs), ca_path)
+        conn, response, retries = _send(_POOL, key, parsed, method, data, headers, timeout, validate_certs, ca_path)
+        resp = PooledResponse(_POOL, key, conn, response, url, retries)
+        location = response.getheader("Location")
+        if resp.status in REDIRECT_CODES and location:
+            resp.read()
+            url = urljoin(url, location)
+            if resp.status not in (307, 308) and method not in ("GET", "HEAD"):
+                method, data = "GET", None
+                headers.pop("Content-Type", None)
+            continue
+        if resp.status >= 400:
+            body = resp.read()
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(body))
+        return resp
+    raise URLError("Maximum redirects ({0}) exceeded for {1}.".format(MAX_REDIRECTS, url))
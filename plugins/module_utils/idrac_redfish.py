@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # Redistribution and use in source and binary forms, with or without modification,
 # are permitted provided that the following conditions are met:
@@ -31,13 +31,21 @@ __metaclass__ = type
 
 import json
 import re
-import time
+from functools import partial
+import socket
+import threading
 import os
-from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+from ansible.module_utils import urls
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.common.parameters import env_fallback
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible.module_utils.common.text.converters import to_text
+from ansible_collections.dellemc.openmanage.plugins.module_utils.connection_pool import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import SessionCache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf import perf_sleep, PerfResultMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6, JobTracker, job_getter, parse_json, \
+    run_concurrently, write_file_atomically, DEFAULT_MAX_WORKERS, DOWNLOAD_CHUNK_SIZE
 from ansible.module_utils.basic import AnsibleModule
 
 idrac_auth_params = {
@@ -51,6 +59,21 @@ idrac_auth_params = {
 
 }
 
+idrac_hosts_params = {
+    "hosts": {"type": "list", "elements": "dict", "options": {
+        "idrac_ip": {"required": True, "type": "str"},
+        "idrac_user": {"type": "str"},
+        "idrac_password": {"type": "str", "aliases": ["idrac_pwd"], "no_log": True},
+        "idrac_port": {"type": "int"},
+        "timeout": {"type": "int"},
+    }},
+    "max_workers": {"type": "int", "default": DEFAULT_MAX_WORKERS},
+}
+idrac_hosts_mutually_exclusive = [("idrac_ip", "hosts")]
+idrac_hosts_required_one_of = [("idrac_ip", "hosts")]
+# the top level credentials are only required without hosts, each host may supply its own
+idrac_hosts_required_by = {"idrac_ip": ("idrac_user", "idrac_password")}
+
 SESSION_RESOURCE_COLLECTION = {
     "SESSION": "/redfish/v1/Sessions",
     "SESSION_ID": "/redfish/v1/Sessions/{Id}",
@@ -59,23 +82,101 @@ MANAGER_URI = "/redfish/v1/Managers/iDRAC.Embedded.1"
 EXPORT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ExportSystemConfiguration"
 IMPORT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfiguration"
 IMPORT_PREVIEW = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfigurationPreview"
+SSE_URI = "/redfish/v1/SSE"
+JOB_WAIT_MODE_ENV = "OMAM_JOB_WAIT_MODE"
+SSE_READ_TIMEOUT = 300
+SSE_POLL_INTERVAL = 60
+HOSTS_SUCCESS_MSG = "Successfully fetched the details of {0} out of {1} host(s)."
+HOSTS_FAILURE_MSG = "Unable to fetch the details of any of the {0} host(s)."
+HOSTS_CREDENTIALS_MSG = "The credentials of the host(s) '{0}' are not provided. Provide idrac_user and idrac_password " \
+                        "for each of these hosts or at the top level."
+
+
+class JobEventListener(object):
+    """
+    Reads the Redfish Server-Sent Events stream of the iDRAC in a background thread and sets
+    :attr:`event` whenever a received event mentions one of the jobs.
+    """
+
+    def __init__(self, stream, job_ids):
+        self.event = threading.Event()
+        self._stream = stream
+        self._job_ids = job_ids
+        self._thread = threading.Thread(target=self._read)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _read(self):
+        try:
+            for line in iter(self._stream.readline, b""):
+                line = to_text(line).strip()
+                if line.startswith("data:") and any(job_id in line for job_id in self._job_ids):
+                    self.event.set()
+        except Exception:
+            # The stream is closed or timed out, the jobs are still polled.
+            pass
+
+    def close(self):
+        try:
+            self._stream.close()
+        except Exception:
+            pass
 
 
 class OpenURLResponse(object):
     """Handles HTTPResponse"""
 
-    def __init__(self, resp):
-        self.body = None
+    def __init__(self, resp, strip_odata=False, lazy=False):
+        """
+        :param resp: response of open_url
+        :param strip_odata: drops the '@odata.' annotations while the body is parsed
+        :param lazy: the body is read on first access instead of right away, use download_to
+            to write a large body to a file without loading it into memory
+        """
+        self._body = None
+        self._streamed = False
         self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
+        self.strip_odata = strip_odata
+        self._json_data = None
+        if self.resp and not lazy:
+            self._body = self.resp.read()
+
+    @property
+    def body(self):
+        if self._body is None and self.resp and not self._streamed:
+            self._body = self.resp.read()
+        return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
+
+    def download_to(self, file_path, strip_cr=False, checksum=None, chunk_size=DOWNLOAD_CHUNK_SIZE):
+        """
+        Writes the body to file_path. The body of a lazy response is streamed in chunks of chunk_size bytes
+        and checked against the Content-Length of the response.
+        :param file_path: path of the file to write, it is replaced only when the download completes
+        :param strip_cr: removes the carriage returns from the content
+        :param checksum: (optional) expected SHA-256 hex digest of the written content
+        :param chunk_size: number of bytes read from the response at a time
+        :return: SHA-256 hex digest of the written content
+        """
+        if self._body is not None:
+            body = self._body.encode("utf-8") if isinstance(self._body, str) else self._body
+            return write_file_atomically(file_path, [body], strip_cr=strip_cr, checksum=checksum)
+        self._streamed = True
+        size = self.resp.headers.get("Content-Length")
+        if not str(size).isdigit() or self.resp.headers.get("Content-Encoding"):
+            size = None
+        return write_file_atomically(file_path, iter(partial(self.resp.read, chunk_size), b""),
+                                     strip_cr=strip_cr, checksum=checksum, size=size)
 
     @property
     def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
+        """Parsed body, the body is parsed once and the same document is returned on every access."""
+        if self._json_data is None:
+            self._json_data = parse_json(self.body, self.strip_odata)
+        return self._json_data
 
     @property
     def status_code(self):
@@ -110,6 +211,8 @@ class iDRACRedfishAPI(object):
         self.use_proxy = module_params.get("use_proxy", True)
         self.req_session = req_session
         self.session_id = None
+        self.session_cache = None
+        self._session_key = None
         self.protocol = 'https'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.ipaddress = config_ipv6(self.ipaddress)
@@ -165,40 +268,84 @@ class iDRACRedfishAPI(object):
         url_kwargs["force_basic_auth"] = False
         return url_kwargs
 
-    def invoke_request(self, uri, method, data=None, query_param=None, headers=None, api_timeout=None, dump=True):
+    def invoke_request(self, uri, method, data=None, query_param=None, headers=None, api_timeout=None, dump=True,
+                       strip_odata=False, stream=False):
+        """
+        Sends a request to iDRAC.
+        With stream the body is not read into memory, it is read on access or written to a file with
+        OpenURLResponse.download_to.
+        """
         try:
             if 'X-Auth-Token' in self._headers:
                 url_kwargs = self._args_with_session(method, api_timeout, headers=headers)
             else:
                 url_kwargs = self._args_without_session(uri, method, api_timeout, headers=headers)
-            if data and dump:
-                data = json.dumps(data)
+            payload = json.dumps(data) if data and dump else data
             url = self._build_url(uri, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
-        except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
+            resp = open_url(url, data=payload, **url_kwargs)
+            resp_data = OpenURLResponse(resp, strip_odata=strip_odata, lazy=stream)
+        except HTTPError as err:
+            if err.code == 401 and self._refresh_cached_session():
+                return self.invoke_request(uri, method, data=data, query_param=query_param, headers=headers,
+                                           api_timeout=api_timeout, dump=dump, strip_odata=strip_odata, stream=stream)
+            raise err
+        except (URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
+    def _create_session(self):
+        """Creates a session and returns its Id, token and URL"""
+        payload = {'UserName': self.username,
+                   'Password': self.password}
+        path = SESSION_RESOURCE_COLLECTION["SESSION"]
+        resp = self.invoke_request(path, 'POST', data=payload)
+        if resp and resp.success:
+            session_id = resp.json_data.get("Id")
+            return {"Id": session_id, "Token": resp.headers.get('X-Auth-Token'), "ValidateCerts": self.validate_certs,
+                    "CaPath": self.ca_path, "Url": self._build_url(SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=session_id))}
+        msg = "Could not create the session"
+        raise ConnectionError(msg)
+
+    def _is_session_alive(self, session):
+        """Checks a cached session with a GET of its own resource"""
+        self._headers["X-Auth-Token"] = session["Token"]
+        try:
+            self.invoke_request(SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=session["Id"]), 'GET')
+        except HTTPError as err:
+            if err.code not in (401, 404):
+                raise
+            self._headers.pop("X-Auth-Token", None)
+            return False
+        return True
+
+    def _refresh_cached_session(self):
+        """Replaces a cached session which expired while the module runs, only once per module run"""
+        key, self._session_key = self._session_key, None
+        if key is None:
+            return False
+        expired_token = self._headers.pop("X-Auth-Token", None)
+        session = self.session_cache.acquire(key, self._create_session, lambda cached: cached["Token"] != expired_token)
+        self._headers["X-Auth-Token"] = session["Token"]
+        return True
+
     def __enter__(self):
         """Creates sessions by passing it to header"""
         if self.req_session and not self.x_auth_token:
-            payload = {'UserName': self.username,
-                       'Password': self.password}
-            path = SESSION_RESOURCE_COLLECTION["SESSION"]
-            resp = self.invoke_request(path, 'POST', data=payload)
-            if resp and resp.success:
-                self.session_id = resp.json_data.get("Id")
-                self._headers["X-Auth-Token"] = resp.headers.get('X-Auth-Token')
+            self.session_cache = SessionCache.from_env()
+            if self.session_cache.enabled:
+                key = SessionCache.session_key(self._get_url(""), self.username, self.password)
+                session = self.session_cache.acquire(key, self._create_session, self._is_session_alive)
+                self._session_key = key
             else:
-                msg = "Could not create the session"
-                raise ConnectionError(msg)
+                session = self._create_session()
+                self.session_id = session["Id"]
+            self._headers["X-Auth-Token"] = session["Token"]
         elif self.x_auth_token is not None:
             self._headers["X-Auth-Token"] = self.x_auth_token
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        """Deletes a session id, which is in use for request"""
+        """Deletes a session id, which is in use for request, cached sessions are kept for the next tasks"""
         if self.session_id:
             path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
             self.invoke_request(path, 'DELETE')
@@ -217,44 +364,82 @@ class iDRACRedfishAPI(object):
             firmware_version = response.json_data["FirmwareVersion"]
         return generation, firmware_version
 
+    def open_job_events(self, job_uris):
+        """
+        Subscribes to the Server-Sent Events of the iDRAC when the environment variable
+        OMAM_JOB_WAIT_MODE is set to 'sse', so that a job wait ends as soon as the job changes.
+        :param job_uris: list of uris of the jobs, the last segment is the job id
+        :return: JobEventListener or None when the events are disabled or not supported
+        """
+        if os.environ.get(JOB_WAIT_MODE_ENV, "poll").lower() != "sse":
+            return None
+        try:
+            if 'X-Auth-Token' in self._headers:
+                url_kwargs = self._args_with_session('GET', SSE_READ_TIMEOUT)
+            else:
+                url_kwargs = self._args_without_session(SSE_URI, 'GET', SSE_READ_TIMEOUT)
+            url_kwargs["headers"] = dict(url_kwargs["headers"], Accept="text/event-stream")
+            stream = urls.open_url(self._build_url(SSE_URI), **url_kwargs)
+        except (HTTPError, URLError, SSLValidationError, ConnectionError, socket.error):
+            return None
+        return JobEventListener(stream, [uri.rstrip("/").split("/")[-1] for uri in job_uris])
+
+    def _track_job(self, job_uri, is_terminal, max_interval):
+        listener = self.open_job_events([job_uri])
+        try:
+            tracker = JobTracker(job_getter(self, uri_first=True), is_terminal, max_wait_sec=None,
+                                 max_interval=SSE_POLL_INTERVAL if listener else max_interval, conditional=True,
+                                 wake_event=listener.event if listener else None)
+            result = tracker.wait([job_uri])[job_uri]
+        finally:
+            if listener:
+                listener.close()
+        if result["error"] is not None:
+            raise result["error"]
+        return result["resp"]
+
     def wait_for_job_complete(self, task_uri, job_wait=False):
         """
         This function wait till the job completion.
+        The task is polled, or followed with Server-Sent Events when OMAM_JOB_WAIT_MODE is 'sse'.
         :param task_uri: uri to track job.
         :param job_wait: True or False decide whether to wait till the job completion.
         :return: object
         """
         response = None
-        while job_wait:
+        if job_wait:
+            def is_terminal(resp):
+                try:
+                    return resp.json_data.get("TaskState") != "Running"
+                except ValueError:
+                    return True
+
+            response = self._track_job(task_uri, is_terminal, 10)
             try:
-                response = self.invoke_request(task_uri, "GET")
-                if response.json_data.get("TaskState") == "Running":
-                    time.sleep(10)
-                else:
-                    break
+                response.json_data
             except ValueError:
                 response = response.body
-                break
         return response
 
     def wait_for_job_completion(self, job_uri, job_wait=False, reboot=False, apply_update=False):
         """
         This function wait till the job completion.
+        The job is polled, or followed with Server-Sent Events when OMAM_JOB_WAIT_MODE is 'sse'.
         :param job_uri: uri to track job.
         :param job_wait: True or False decide whether to wait till the job completion.
         :return: object
         """
-        time.sleep(5)
-        response = self.invoke_request(job_uri, "GET")
-        while job_wait:
-            response = self.invoke_request(job_uri, "GET")
-            if response.json_data.get("PercentComplete") == 100 and \
-                    response.json_data.get("JobState") == "Completed":
-                break
-            if response.json_data.get("JobState") == "Starting" and not reboot and apply_update:
-                break
-            time.sleep(30)
-        return response
+        perf_sleep(5, "iDRACRedfishAPI.wait_for_job_completion")
+        if not job_wait:
+            return self.invoke_request(job_uri, "GET")
+
+        def is_terminal(resp):
+            job_state = resp.json_data.get("JobState")
+            if resp.json_data.get("PercentComplete") == 100 and job_state == "Completed":
+                return True
+            return job_state == "Starting" and not reboot and apply_update
+
+        return self._track_job(job_uri, is_terminal, 30)
 
     def export_scp(self, export_format=None, export_use=None, target=None,
                    job_wait=False, share=None, include_in_export="Default"):
@@ -439,7 +624,7 @@ class iDRACRedfishAPI(object):
         return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
 
 
-class IdracAnsibleModule(AnsibleModule):
+class IdracAnsibleModule(PerfResultMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
@@ -459,6 +644,11 @@ class IdracAnsibleModule(AnsibleModule):
         auth_mutually_exclusive = [("idrac_user", "x_auth_token"), ("idrac_password", "x_auth_token")]
         auth_required_one_of = [("idrac_user", "x_auth_token")]
         auth_required_together = [("idrac_user", "idrac_password")]
+        if "hosts" in argument_spec:
+            argument_spec["idrac_ip"] = {"required": False, "type": 'str'}
+            auth_mutually_exclusive.extend(idrac_hosts_mutually_exclusive + [("x_auth_token", "hosts")])
+            # the credentials of the hosts are validated by run_on_idrac_hosts
+            auth_required_one_of = [("idrac_user", "x_auth_token", "hosts")] + idrac_hosts_required_one_of
 
         if mutually_exclusive is None:
             mutually_exclusive = []
@@ -476,3 +666,56 @@ class IdracAnsibleModule(AnsibleModule):
                          mutually_exclusive, required_together,
                          required_one_of, add_file_common_args,
                          supports_check_mode, required_if, required_by)
+
+
+def run_on_idrac_hosts(module, fetch, req_session=False):
+    """
+    Runs fetch against every iDRAC of the I(hosts) option concurrently, at most I(max_workers)
+    at a time, each with its own iDRACRedfishAPI and socket timeout. The options of a host
+    override the top level ones, so hosts can share the credentials of the task. The module fails
+    before any host is queried when a host has no credentials of its own nor at the top level.
+    :param module: module with the I(hosts) and I(max_workers) options
+    :param fetch: callable receiving the iDRACRedfishAPI object and the parameters of the host,
+        and returning a dict of the results of the host
+    :param req_session: whether a session is created on each iDRAC
+    :return: list of dicts with the 'idrac_ip' and the results or the error of each host
+    """
+    base_params = dict((key, val) for key, val in module.params.items() if key not in idrac_hosts_params)
+    missing = [host["idrac_ip"] for host in module.params["hosts"]
+               if not all(host.get(key) or base_params.get(key) for key in ("idrac_user", "idrac_password"))]
+    if missing:
+        module.fail_json(msg=HOSTS_CREDENTIALS_MSG.format(",".join(missing)))
+
+    def fetch_host(host):
+        params = dict(base_params)
+        params.update((key, val) for key, val in host.items() if val is not None)
+        result = {"idrac_ip": host["idrac_ip"], "failed": False}
+        try:
+            with iDRACRedfishAPI(params, req_session=req_session) as idrac:
+                result.update(fetch(idrac, params))
+        except HTTPError as err:
+            result.update(failed=True, msg=str(err))
+            try:
+                result["error_info"] = json.load(err)
+            except (ValueError, TypeError, AttributeError):
+                pass
+        except URLError as err:
+            result.update(failed=True, unreachable=True, msg=str(err))
+        except (RuntimeError, SSLValidationError, ConnectionError, KeyError, ValueError, TypeError, OSError) as err:
+            result.update(failed=True, msg=str(err))
+        return result
+
+    return run_concurrently(fetch_host, module.params["hosts"], module.params.get("max_workers"))
+
+
+def exit_idrac_hosts(module, fetch, req_session=False):
+    """
+    Exits the module with the results of :func:`run_on_idrac_hosts` in I(hosts). The module only
+    fails when none of the hosts could be queried, the failures of the other hosts are reported
+    in their results.
+    """
+    results = run_on_idrac_hosts(module, fetch, req_session=req_session)
+    succeeded = len([result for result in results if not result["failed"]])
+    if results and not succeeded:
+        module.exit_json(msg=HOSTS_FAILURE_MSG.format(len(results)), hosts=results, failed=True)
+    module.exit_json(msg=HOSTS_SUCCESS_MSG.format(succeeded, len(results)), hosts=results)
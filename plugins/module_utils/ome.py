@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
 # Dell OpenManage Ansible Modules
-# Version 9.4.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # Redistribution and use in source and binary forms, with or without modification,
 # are permitted provided that the following conditions are met:
@@ -32,13 +32,17 @@ __metaclass__ = type
 
 import json
 import os
-import time
-from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.common.parameters import env_fallback
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
-from ansible.module_utils.six.moves.urllib.parse import urlencode
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible.module_utils.six.moves.urllib.parse import urlencode, parse_qsl
+from ansible_collections.dellemc.openmanage.plugins.module_utils.connection_pool import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import get_ome_cached, SessionCache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf import PerfResultMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6, parse_json
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import run_concurrently, get_page_links, \
+    build_or_filters, JobTracker, JOB_POLL_MIN_INTERVAL, DEFAULT_MAX_WORKERS
 from ansible.module_utils.basic import AnsibleModule
 
 ome_auth_params = {
@@ -60,23 +64,27 @@ JOB_URI = "JobService/Jobs({job_id})"
 JOB_SERVICE_URI = "JobService/Jobs"
 HOST_UNRESOLVED_MSG = "Unable to resolve hostname or IP {0}."
 JOB_EXEC_HISTORY = "JobService/Jobs({job_id})/ExecutionHistories"
+JOB_TYPES_URI = "JobService/JobTypes"
+DEVICE_TYPE_URI = "DeviceService/DeviceType"
 
 
 class OpenURLResponse(object):
     """Handles HTTPResponse"""
 
-    def __init__(self, resp):
+    def __init__(self, resp, strip_odata=False):
         self.body = None
         self.resp = resp
+        self.strip_odata = strip_odata
+        self._json_data = None
         if self.resp:
             self.body = self.resp.read()
 
     @property
     def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
+        """Parsed body, the body is parsed once and the same document is returned on every access."""
+        if self._json_data is None:
+            self._json_data = parse_json(self.body, self.strip_odata)
+        return self._json_data
 
     @property
     def status_code(self):
@@ -107,6 +115,9 @@ class RestOME(object):
         self.req_session = req_session
         self.session_id = None
         self.protocol = 'https'
+        self.appliance_version = None
+        self.session_cache = None
+        self._session_key = None
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.hostname = config_ipv6(self.hostname)
 
@@ -164,7 +175,7 @@ class RestOME(object):
         return url_kwargs
 
     def invoke_request(self, method, path, data=None, query_param=None, headers=None,
-                       api_timeout=None, dump=True):
+                       api_timeout=None, dump=True, strip_odata=False):
         """
         Sends a request through open_url
         Returns :class:`OpenURLResponse` object.
@@ -177,6 +188,8 @@ class RestOME(object):
         :arg api_timeout: (optional) How long to wait for the server to send
             data before giving up
         :arg dump: (Optional) boolean value for dumping payload data.
+        :arg strip_odata: (Optional) drop the '@odata.' annotations while the response is parsed,
+            '@odata.count' and '@odata.nextLink' are kept.
         :returns: OpenURLResponse
         """
         try:
@@ -184,58 +197,129 @@ class RestOME(object):
                 url_kwargs = self._args_with_session(method, api_timeout, headers=headers)
             else:
                 url_kwargs = self._args_without_session(method, api_timeout, headers=headers)
-            if data and dump:
-                data = json.dumps(data)
+            payload = json.dumps(data) if data and dump else data
             url = self._build_url(path, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
-        except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
+            resp = open_url(url, data=payload, **url_kwargs)
+            resp_data = OpenURLResponse(resp, strip_odata=strip_odata)
+        except HTTPError as err:
+            if err.code == 401 and self._refresh_cached_session():
+                return self.invoke_request(method, path, data=data, query_param=query_param, headers=headers,
+                                           api_timeout=api_timeout, dump=dump, strip_odata=strip_odata)
+            raise err
+        except (URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
+    def _create_session(self):
+        """Creates a session and returns its Id, token and URL"""
+        payload = {'UserName': self.username,
+                   'Password': self.password,
+                   'SessionType': 'API', }
+        path = SESSION_RESOURCE_COLLECTION["SESSION"]
+        resp = self.invoke_request('POST', path, data=payload)
+        if resp and resp.success:
+            session_id = resp.json_data.get("Id")
+            return {"Id": session_id, "Token": resp.token_header, "ValidateCerts": self.validate_certs,
+                    "CaPath": self.ca_path, "Url": self._build_url(SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=session_id))}
+        msg = "Could not create the session"
+        raise ConnectionError(msg)
+
+    def _is_session_alive(self, session):
+        """Checks a cached session with a GET of its own resource"""
+        self._headers["X-Auth-Token"] = session["Token"]
+        try:
+            self.invoke_request('GET', SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=session["Id"]))
+        except HTTPError as err:
+            if err.code not in (401, 404):
+                raise
+            self._headers.pop("X-Auth-Token", None)
+            return False
+        return True
+
+    def _refresh_cached_session(self):
+        """Replaces a cached session which expired while the module runs, only once per module run"""
+        key, self._session_key = self._session_key, None
+        if key is None:
+            return False
+        expired_token = self._headers.pop("X-Auth-Token", None)
+        session = self.session_cache.acquire(key, self._create_session, lambda cached: cached["Token"] != expired_token)
+        self._headers["X-Auth-Token"] = session["Token"]
+        return True
+
     def __enter__(self):
         """Creates sessions by passing it to header"""
         if self.req_session and not self.x_auth_token:
-            payload = {'UserName': self.username,
-                       'Password': self.password,
-                       'SessionType': 'API', }
-            path = SESSION_RESOURCE_COLLECTION["SESSION"]
-            resp = self.invoke_request('POST', path, data=payload)
-            if resp and resp.success:
-                self.session_id = resp.json_data.get("Id")
-                self._headers["X-Auth-Token"] = resp.token_header
+            self.session_cache = SessionCache.from_env()
+            if self.session_cache.enabled:
+                key = SessionCache.session_key(self._get_base_url(), self.username, self.password)
+                session = self.session_cache.acquire(key, self._create_session, self._is_session_alive)
+                self._session_key = key
             else:
-                msg = "Could not create the session"
-                raise ConnectionError(msg)
+                session = self._create_session()
+                self.session_id = session["Id"]
+            self._headers["X-Auth-Token"] = session["Token"]
         elif self.x_auth_token is not None:
             self._headers["X-Auth-Token"] = self.x_auth_token
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        """Deletes a session id, which is in use for request"""
+        """Deletes a session id, which is in use for request, cached sessions are kept for the next tasks"""
         if self.session_id:
             path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
             self.invoke_request('DELETE', path)
         return False
 
-    def get_all_report_details(self, uri):
+    def get_all_report_details(self, uri, page_size=None, max_workers=DEFAULT_MAX_WORKERS, query_param=None):
         """
         This implementation mainly dependent on '@odata.count' value.
         Currently first request without query string, always returns total number of available
         reports in '@odata.count'.
+        The offsets of the remaining pages are computed from the size of the first page and the
+        pages are retrieved in parallel, the reports are returned in the order of the pages.
+        A page which returns fewer reports than requested, for example when the appliance caps
+        $top, is completed with further requests so that no report is skipped.
+        :param uri: uri which supports $top and $skip
+        :param page_size: (optional) number of reports requested with $top in each page, defaults to
+            the size of the first page returned by the appliance. The pages are laid out with the
+            size of the first page, so a page size capped by the appliance does not leave gaps.
+        :param max_workers: maximum number of pages retrieved at the same time
+        :param query_param: (optional) query parameters such as $expand sent with every page,
+            $top and $skip are set for each page
         """
         try:
-            resp = self.invoke_request('GET', uri)
+            base_param = dict(query_param or {})
+
+            def get_page(skip, top):
+                return self.invoke_request('GET', uri, query_param=dict(base_param, **{"$top": top, "$skip": skip}))
+
+            def get_full_page(skip):
+                top = min(first_page_count, total_count - skip)
+                page_resp = get_page(skip, top)
+                value = page_resp.json_data["value"]
+                while 0 < len(value) < top:
+                    more = get_page(skip + len(value), top - len(value)).json_data["value"]
+                    if not more:
+                        break
+                    value.extend(more)
+                return page_resp, value
+
+            first_param = dict(base_param, **{"$top": page_size}) if page_size else base_param
+            resp = self.invoke_request('GET', uri, query_param=first_param or None)
             data = resp.json_data
             report_list = data["value"]
             total_count = data['@odata.count']
+            first_page_count = min(page_size, len(report_list)) if page_size else len(report_list)
+            if first_page_count:
+                skip_list = range(first_page_count, total_count, first_page_count)
+                for resp, value in run_concurrently(get_full_page, skip_list, max_workers):
+                    report_list.extend(value)
             remaining_count = total_count - len(report_list)
-            first_page_count = len(report_list)
-            while remaining_count > 0:
-                resp = self.invoke_request('GET', uri,
-                                           query_param={"$top": first_page_count, "$skip": len(report_list)})
+            while remaining_count > 0 and first_page_count:
+                resp = get_page(len(report_list), first_page_count)
                 data = resp.json_data
                 value = data["value"]
+                if not value:
+                    break
                 report_list.extend(value)
                 remaining_count = remaining_count - len(value)
             return {"resp_obj": resp, "report_list": report_list}
@@ -245,8 +329,7 @@ class RestOME(object):
     def get_job_type_id(self, jobtype_name):
         """This provides an ID of the job type."""
         job_type_id = None
-        resp = self.invoke_request('GET', "JobService/JobTypes")
-        data = resp.json_data["value"]
+        data = get_ome_cached(self, JOB_TYPES_URI, lambda: self.invoke_request('GET', JOB_TYPES_URI).json_data["value"])
         for each in data:
             if each["Name"] == jobtype_name:
                 job_type_id = each["Id"]
@@ -271,11 +354,15 @@ class RestOME(object):
             device_id = device_info["Id"]
         return {"Id": device_id, "value": device_info}
 
-    def get_all_items_with_pagination(self, uri, query_param=None):
+    def get_all_items_with_pagination(self, uri, query_param=None, max_workers=DEFAULT_MAX_WORKERS):
         """
          This implementation mainly to get all available items from ome for pagination
          supported GET uri
+         When the '@odata.nextLink' of the first page has $skip and $top, the links of the
+         remaining pages are computed and retrieved in parallel.
         :param uri: uri which supports pagination
+        :param query_param: (optional) query parameters of the first request, for example $top
+        :param max_workers: maximum number of pages retrieved at the same time
         :return: dict.
         """
         try:
@@ -284,6 +371,13 @@ class RestOME(object):
             total_items = data.get("value", [])
             total_count = data.get('@odata.count', 0)
             next_link = data.get('@odata.nextLink', '')
+            page_links = get_page_links(next_link, total_count)
+            if page_links:
+                page_resps = run_concurrently(lambda link: self.invoke_request('GET', link.split('/api')[-1]),
+                                              page_links, max_workers)
+                for resp in page_resps:
+                    total_items.extend(resp.json_data["value"])
+                next_link = page_resps[-1].json_data.get('@odata.nextLink', '')
             while next_link:
                 resp = self.invoke_request('GET', next_link.split('/api')[-1])
                 data = resp.json_data
@@ -294,6 +388,60 @@ class RestOME(object):
         except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
             raise err
 
+    def iter_items(self, uri, query_param=None):
+        """
+        Yields the items of a pagination supported GET uri one page at a time, only the current
+        page is held in memory and the remaining pages are not requested when the caller stops
+        iterating.
+        :param uri: uri which supports pagination
+        :param query_param: (optional) query parameters such as $filter, $select or $top which are
+            applied on the server, they are carried over to every page
+        :return: generator of the items
+        """
+        resp = self.invoke_request('GET', uri, query_param=query_param)
+        while True:
+            data = resp.json_data
+            for item in data.get("value", []):
+                yield item
+            next_link = data.get('@odata.nextLink')
+            if not next_link:
+                break
+            next_path, dummy, next_query = next_link.split('/api')[-1].partition('?')
+            next_param = dict(parse_qsl(next_query))
+            for key, val in (query_param or {}).items():
+                next_param.setdefault(key, val)
+            resp = self.invoke_request('GET', next_path.lstrip('/'), query_param=next_param)
+
+    def get_items_by_filter(self, uri, key, values, select=None, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Looks up the items of a collection whose key matches any of the values with '$filter'
+        queries evaluated on the appliance instead of retrieving the whole collection.
+        The values are batched into 'or' expressions which fit in the request URL and the
+        batches are retrieved in parallel.
+        :param uri: uri of the collection which supports $filter, for example 'DeviceService/Devices'
+        :param key: property matched with the values, for example 'DeviceServiceTag'
+        :param values: list of values to look up
+        :param select: (optional) list of properties returned for each item with '$select',
+            the lookup is retried without it when the appliance rejects the query
+        :param max_workers: maximum number of batches retrieved at the same time
+        :return: list of the matching items
+        """
+        def fetch(filter_query):
+            query_param = {"$filter": filter_query}
+            if select:
+                query_param["$select"] = ",".join(select)
+            try:
+                return list(self.iter_items(uri, query_param=query_param))
+            except HTTPError as err:
+                if not select or err.code != 400:
+                    raise err
+                return list(self.iter_items(uri, query_param={"$filter": filter_query}))
+
+        items = []
+        for batch in run_concurrently(fetch, build_or_filters(key, values), max_workers):
+            items.extend(batch)
+        return items
+
     def get_device_type(self):
         """
         Returns device type map where as key is type and value is type name
@@ -301,9 +449,10 @@ class RestOME(object):
         :return: dict, first item dict gives device type map
         """
         device_map = {}
-        response = self.invoke_request("GET", "DeviceService/DeviceType")
-        if response.json_data.get("value"):
-            device_map = dict([(item["DeviceType"], item["Name"]) for item in response.json_data["value"]])
+        device_types = get_ome_cached(self, DEVICE_TYPE_URI,
+                                      lambda: self.invoke_request("GET", DEVICE_TYPE_URI).json_data.get("value"))
+        if device_types:
+            device_map = dict([(item["DeviceType"], item["Name"]) for item in device_types])
         return device_map
 
     def get_job_info(self, job_id):
@@ -339,20 +488,18 @@ class RestOME(object):
         """
         job_id: job id
         job_wait_sec: Maximum time to wait to fetch the final job details in seconds
-        sleep_time: Maximum time to sleep in seconds in each job details fetch
+        sleep_time: Maximum time to sleep in seconds in each job details fetch, the job is polled
+            more often right after it changes, see :class:`JobTracker`
         """
-        max_sleep_time = job_wait_sec
-        sleep_interval = sleep_time
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            exit_poll, job_failed, job_message = self.get_job_info(job_id)
-            if exit_poll is True:
-                return job_failed, job_message
+        tracker = JobTracker(lambda job, headers=None: self.get_job_info(job), lambda job_info: job_info[0] is True,
+                             max_wait_sec=job_wait_sec, max_interval=sleep_time,
+                             initial_wait=min(sleep_time, JOB_POLL_MIN_INTERVAL))
+        result = tracker.wait([job_id])[job_id]
+        if result["error"] is not None:
+            raise result["error"]
+        if result["terminal"]:
+            exit_poll, job_failed, job_message = result["resp"]
+            return job_failed, job_message
         return True, "The job is not complete after {0} seconds.".format(job_wait_sec)
 
     def strip_substr_dict(self, odata_dict, chkstr='@odata.'):
@@ -427,7 +574,7 @@ class RestOME(object):
         return job_detail_status
 
 
-class OmeAnsibleModule(AnsibleModule):
+class OmeAnsibleModule(PerfResultMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
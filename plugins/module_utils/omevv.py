@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
 # Dell OpenManage Ansible Modules
-# Version 9.8.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # Redistribution and use in source and binary forms, with or without modification,
 # are permitted provided that the following conditions are met:
@@ -31,6 +31,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_api import RestAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf import PerfResultMixin
 from ansible.module_utils.common.parameters import env_fallback
 from ansible.module_utils.basic import AnsibleModule
 
@@ -74,7 +75,7 @@ class RestOMEVV(RestAPI):
                                          api_timeout, dump)
 
 
-class OMEVVAnsibleModule(AnsibleModule):
+class OMEVVAnsibleModule(PerfResultMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
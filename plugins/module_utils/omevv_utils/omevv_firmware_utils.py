@@ -27,7 +27,7 @@
 
 
 from __future__ import (absolute_import, division, print_function)
-import time
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf import perf_sleep
 
 __metaclass__ = type
 
@@ -185,11 +185,11 @@ class OMEVVFirmwareProfile:
             protocol_type, catalog_path, share_username, share_password, share_domain)
         resp = self.omevv.invoke_request("POST", TEST_CONNECTION_URI, payload)
         if resp.success:
-            time.sleep(5)  # Waiting here because response comes as empty at first call
+            perf_sleep(5, "OMEVVFirmwareProfile.test_connection")  # Waiting here because response comes as empty at first call
             job_id = resp.json_data
             resp_history = self.omevv.invoke_request("GET", TEST_CONNECTION_HISTORY.format(job_id=job_id))
             while resp_history.json_data[0]["statusSummary"] != "SUCCESSFUL" and resp_history.json_data[0]["statusSummary"] != "FAILED":
-                time.sleep(3)
+                perf_sleep(3, "OMEVVFirmwareProfile.test_connection")
                 resp_history = self.omevv.invoke_request("GET", TEST_CONNECTION_HISTORY.format(job_id=job_id))
             if resp_history.json_data[0]["statusSummary"] == "SUCCESSFUL":
                 return True
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import math
+import os
+import re
+import threading
+import time
+from ansible.module_utils.six.moves.urllib.parse import urlparse, parse_qsl
+
+PERF_ENV = "OMAM_PERF"
+PERF_TRACE_ENV = "OMAM_PERF_TRACE"
+PERF_RESULT_KEY = "perf"
+ENABLED_VALUES = frozenset(["1", "true", "yes", "on"])
+ODATA_KEY_REGEX = r"\([^)]*\)"
+ID_SEGMENT_REGEX = r"^(\d+|[A-Z]+_\w+|.*:.*|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27})$"
+PERCENTILES = (50, 95)
+TIME_PRECISION = 4
+
+
+def path_template(url):
+    """
+    Returns the path of a URL with the identifiers replaced by '{id}' and the names of the
+    query parameters without their values, so that the requests for different devices, jobs
+    or pages of the same resource are aggregated together.
+    For example '/api/JobService/Jobs(10)?$top=50' becomes '/api/JobService/Jobs({id})?$top'.
+    """
+    parsed = urlparse(url)
+    path = re.sub(ODATA_KEY_REGEX, "({id})", parsed.path)
+    path = "/".join("{id}" if re.match(ID_SEGMENT_REGEX, segment) else segment for segment in path.split("/"))
+    params = sorted(set(key for key, dummy in parse_qsl(parsed.query, keep_blank_values=True)))
+    return "{0}?{1}".format(path, "&".join(params)) if params else path
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0
+    return sorted_values[max(int(math.ceil(pct / 100.0 * len(sorted_values))) - 1, 0)]
+
+
+def _enabled_from_env():
+    return os.environ.get(PERF_ENV, "").strip().lower() in ENABLED_VALUES
+
+
+class PerfRecorder(object):
+    """
+    Records the HTTP requests sent by the REST clients and the sleeps of the job tracking
+    helpers of a module run. Each event is aggregated per method and path template for the
+    'perf' block of the module result, and appended to a JSON-lines trace file when one is set.
+    A disabled recorder does nothing.
+    """
+
+    def __init__(self, enabled=False, trace_file=None):
+        """
+        :param enabled: aggregate the events for the 'perf' block of the module result
+        :param trace_file: (optional) path of the JSON-lines file the events are appended to,
+            recording is enabled when it is set
+        """
+        self.trace_file = trace_file
+        self.enabled = bool(enabled or trace_file)
+        self._lock = threading.Lock()
+        self._trace = None
+        self.reset()
+
+    @classmethod
+    def from_env(cls):
+        """Creates the recorder from the OMAM_PERF and OMAM_PERF_TRACE environment variables."""
+        return cls(_enabled_from_env(), os.environ.get(PERF_TRACE_ENV) or None)
+
+    def reset(self):
+        """Clears the aggregated events."""
+        with self._lock:
+            self.endpoints = {}
+            self.sleeps = {}
+
+    def record_request(self, method, url, status, latency, bytes_sent=0, bytes_received=0, retries=0):
+        """
+        Records a request.
+        :param status: HTTP status code of the response, None when no response was received
+        :param latency: seconds until the status and headers of the response were received
+        :param retries: number of times the request was sent again on a new connection
+        """
+        if not self.enabled:
+            return
+        template = path_template(url)
+        with self._lock:
+            stats = self.endpoints.setdefault((method, template), {
+                "latencies": [], "status": {}, "bytes_sent": 0, "bytes_received": 0, "retries": 0})
+            stats["latencies"].append(latency)
+            status_key = str(status) if status is not None else "error"
+            stats["status"][status_key] = stats["status"].get(status_key, 0) + 1
+            stats["bytes_sent"] += bytes_sent
+            stats["bytes_received"] += bytes_received
+            stats["retries"] += retries
+        self.trace({"type": "request", "method": method, "path": template, "status": status,
+                    "latency": round(latency, TIME_PRECISION), "bytes_sent": bytes_sent,
+                    "bytes_received": bytes_received, "retries": retries})
+
+    def record_sleep(self, label, seconds):
+        """Records a sleep of a polling loop, label names the helper which slept."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self.sleeps.setdefault(label, {"count": 0, "time": 0})
+            stats["count"] += 1
+            stats["time"] += seconds
+        self.trace({"type": "sleep", "label": label, "seconds": round(seconds, TIME_PRECISION)})
+
+    def trace(self, event):
+        """Appends an event to the trace file with the time, process and thread it happened in."""
+        if not self.trace_file:
+            return
+        event = dict(event, ts=round(time.time(), 6), pid=os.getpid(), thread=threading.current_thread().name)
+        line = json.dumps(event, sort_keys=True) + "\n"
+        with self._lock:
+            try:
+                if self._trace is None:
+                    self._trace = open(self.trace_file, "a")
+                self._trace.write(line)
+                self._trace.flush()
+            except (IOError, OSError):
+                # a trace file which cannot be written must not fail the module
+                self.trace_file = None
+
+    def summary(self):
+        """
+        Returns the aggregated events, the endpoints and the sleeps are sorted by the time spent in them.
+        :return: dict with the totals and the 'endpoints' and 'sleeps' lists
+        """
+        with self._lock:
+            endpoints = []
+            for (method, template), stats in self.endpoints.items():
+                latencies = sorted(stats["latencies"])
+                endpoint = {"method": method, "path": template, "count": len(latencies),
+                            "time": round(sum(latencies), TIME_PRECISION),
+                            "max": round(latencies[-1], TIME_PRECISION), "status": dict(stats["status"]),
+                            "bytes_sent": stats["bytes_sent"], "bytes_received": stats["bytes_received"],
+                            "retries": stats["retries"]}
+                for pct in PERCENTILES:
+                    endpoint["p{0}".format(pct)] = round(percentile(latencies, pct), TIME_PRECISION)
+                endpoints.append(endpoint)
+            sleeps = [{"label": label, "count": stats["count"], "time": round(stats["time"], TIME_PRECISION)}
+                      for label, stats in self.sleeps.items()]
+        endpoints.sort(key=lambda endpoint: endpoint["time"], reverse=True)
+        sleeps.sort(key=lambda sleep_stats: sleep_stats["time"], reverse=True)
+        return {
+            "requests": sum(endpoint["count"] for endpoint in endpoints),
+            "request_time": round(sum(endpoint["time"] for endpoint in endpoints), TIME_PRECISION),
+            "bytes_sent": sum(endpoint["bytes_sent"] for endpoint in endpoints),
+            "bytes_received": sum(endpoint["bytes_received"] for endpoint in endpoints),
+            "retries": sum(endpoint["retries"] for endpoint in endpoints),
+            "sleep_time": round(sum(sleep_stats["time"] for sleep_stats in sleeps), TIME_PRECISION),
+            "endpoints": endpoints,
+            "sleeps": sleeps,
+        }
+
+
+_RECORDER = None
+_RECORDER_LOCK = threading.Lock()
+
+
+def get_recorder():
+    """Returns the recorder of the process, created from the environment on first use."""
+    global _RECORDER
+    with _RECORDER_LOCK:
+        if _RECORDER is None:
+            _RECORDER = PerfRecorder.from_env()
+    return _RECORDER
+
+
+def perf_sleep(seconds, label):
+    """time.sleep which is recorded with label when the instrumentation is enabled."""
+    time.sleep(seconds)
+    get_recorder().record_sleep(label, seconds)
+
+
+class PerfResultMixin(object):
+    """
+    Adds the 'perf' summary of the recorder to the result of a module when the instrumentation
+    is enabled, and appends the summary of the module run to the trace file.
+    """
+
+    def _add_perf_result(self, result):
+        recorder = get_recorder()
+        if recorder.enabled:
+            result[PERF_RESULT_KEY] = recorder.summary()
+            recorder.trace({"type": "module", "module": getattr(self, "_name", None),
+                            PERF_RESULT_KEY: result[PERF_RESULT_KEY]})
+
+    def exit_json(self, **kwargs):
+        self._add_perf_result(kwargs)
+        super(PerfResultMixin, self).exit_json(**kwargs)
+
+    def fail_json(self, *args, **kwargs):
+        self._add_perf_result(kwargs)
+        super(PerfResultMixin, self).fail_json(*args, **kwargs)
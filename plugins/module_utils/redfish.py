@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # Redistribution and use in source and binary forms, with or without modification,
 # are permitted provided that the following conditions are met:
@@ -31,11 +31,13 @@ __metaclass__ = type
 
 import json
 import os
-from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.common.parameters import env_fallback
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.connection_pool import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf import PerfResultMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6, parse_json
 from ansible.module_utils.basic import AnsibleModule
 
 redfish_auth_params = {
@@ -58,18 +60,20 @@ HOST_UNRESOLVED_MSG = "Unable to resolve hostname or IP {0}."
 class OpenURLResponse(object):
     """Handles HTTPResponse"""
 
-    def __init__(self, resp):
+    def __init__(self, resp, strip_odata=False):
         self.body = None
         self.resp = resp
+        self.strip_odata = strip_odata
+        self._json_data = None
         if self.resp:
             self.body = self.resp.read()
 
     @property
     def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
+        """Parsed body, the body is parsed once and the same document is returned on every access."""
+        if self._json_data is None:
+            self._json_data = parse_json(self.body, self.strip_odata)
+        return self._json_data
 
     @property
     def status_code(self):
@@ -228,7 +232,7 @@ class Redfish(object):
         return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
 
 
-class RedfishAnsibleModule(AnsibleModule):
+class RedfishAnsibleModule(PerfResultMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
 # Dell OpenManage Ansible Modules
-# Version 9.2.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # Redistribution and use in source and binary forms, with or without modification,
 # are permitted provided that the following conditions are met:
@@ -31,10 +31,9 @@ __metaclass__ = type
 
 import json
 import os
-from ansible.module_utils.urls import open_url
 from ansible.module_utils.six.moves.urllib.parse import urlencode
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
-from ansible.module_utils.urls import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.connection_pool import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6, parse_json
 from abc import ABC, abstractmethod
 
 HEADER_TYPE = "application/json"
@@ -44,12 +43,13 @@ class OpenURLResponse():
     """
     HTTP response handler class.
     """
-    def __init__(self, resp):
+    def __init__(self, resp, strip_odata=False):
         """
         Initializes a new instance of the class.
 
         Args:
             resp (Response): The response object to read the body from.
+            strip_odata (bool): Drop the '@odata.' annotations while the body is parsed.
 
         Initializes the following instance variables:
             - body (bytes): The body of the response, or None if the response is None.
@@ -59,6 +59,8 @@ class OpenURLResponse():
         """
         self.body = None
         self.resp = resp
+        self.strip_odata = strip_odata
+        self._json_data = None
         if self.resp:
             self.body = self.resp.read()
 
@@ -66,14 +68,14 @@ class OpenURLResponse():
     def json_data(self):
         """
         Returns the JSON data parsed from the `body` attribute of the object.
+        The body is parsed on first access and the same document is returned afterwards.
 
         :return: The parsed JSON data.
         :raises ValueError: If the `body` attribute cannot be parsed as JSON.
         """
-        try:
-            return json.loads(self.body)
-        except ValueError as exc:
-            raise ValueError("Unable to parse json") from exc
+        if self._json_data is None:
+            self._json_data = parse_json(self.body, self.strip_odata)
+        return self._json_data
 
     @property
     def status_code(self):
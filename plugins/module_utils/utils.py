@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
 # Dell OpenManage Ansible Modules
-# Version 9.6.0
-# Copyright (C) 2022-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # Redistribution and use in source and binary forms, with or without modification,
 # are permitted provided that the following conditions are met:
@@ -57,14 +57,35 @@ GET_IDRAC_FIRMWARE_DETAILS_URI_10 = "/redfish/v1/UpdateService/Oem/Dell/DellSoft
 GET_IDRAC_FIRMWARE_URI_10 = "/redfish/v1/UpdateService/Oem/Dell/DellSoftwareInventory"
 TIMEOUT_NEGATIVE_OR_ZERO_MSG = "The value for the 'job_wait_timeout' parameter cannot be negative or zero."
 INVALID_TIME_FORMAT_MSG = "Invalid value for time. Enter the value in positive integer."
-
+DEFAULT_MAX_WORKERS = 8
+PAGE_SKIP_REGEX = r"([?&](?:\$|%24)skip=)(\d+)"
+PAGE_TOP_REGEX = r"[?&](?:\$|%24)top=(\d+)"
+FILTER_MAX_LENGTH = 1500
+JOB_POLL_MIN_INTERVAL = 0.5
+JOB_POLL_BACKOFF = 2
+JOB_STATE_KEYS = ("JobState", "LastRunStatus", "TaskState", "JobStatus", "LCStatus")
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+REDFISH_EXPAND_URI = "{0}?$expand=.($levels={1})"
+ODATA_PREFIX = "@odata."
+ODATA_PAGING_KEYS = frozenset(["@odata.count", "@odata.nextLink"])
+
+import binascii
+import hashlib
+import json
+import os
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from inspect import getfullargspec
 import re
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import quote
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf import get_recorder, perf_sleep
 
 
 def strip_substr_dict(odata_dict, chkstr='@odata.', case_sensitive=False):
@@ -88,6 +109,249 @@ def strip_substr_dict(odata_dict, chkstr='@odata.', case_sensitive=False):
     return odata_dict
 
 
+def run_concurrently(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Calls func for each item with a bounded pool of threads.
+    :param func: callable invoked with a single item
+    :param items: iterable of items
+    :param max_workers: maximum number of concurrent calls, 1 or None runs the calls serially
+    :return: list of results in the same order as items
+    """
+    items = list(items)
+    if not max_workers or max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def build_or_filters(key, values, max_length=FILTER_MAX_LENGTH):
+    """
+    Builds OData '$filter' expressions matching any of the values, for example
+    "DeviceServiceTag eq 'ABC1234' or DeviceServiceTag eq 'XYZ5678'".
+    The values are split across several expressions so that each encoded expression
+    stays within max_length characters of the request URL.
+    :param key: property compared with the values
+    :param values: list of str or int values, duplicates are ignored
+    :param max_length: maximum length of each encoded expression
+    :return: list of filter expressions
+    """
+    filters, clauses, length = [], [], 0
+    for value in dict.fromkeys(values):
+        if isinstance(value, str):
+            value = "'{0}'".format(value.replace("'", "''"))
+        clause = "{0} eq {1}".format(key, value)
+        clause_length = len(quote(clause)) + (len(quote(" or ")) if clauses else 0)
+        if clauses and length + clause_length > max_length:
+            filters.append(" or ".join(clauses))
+            clauses, length = [], 0
+            clause_length = len(quote(clause))
+        clauses.append(clause)
+        length += clause_length
+    if clauses:
+        filters.append(" or ".join(clauses))
+    return filters
+
+
+class RedfishResourceLoader(object):
+    """
+    Fetches Redfish resources by their '@odata.id' and keeps them for the lifetime of the loader,
+    so that a resource referenced from several places is requested only once.
+    Collections are read with '$expand' when the service supports it, otherwise the members
+    are fetched concurrently.
+    The loader can be shared by several threads: a resource requested by one thread while another
+    one is fetching it waits for that request, and at most max_workers requests of all the threads
+    are sent at the same time.
+    """
+
+    def __init__(self, idrac, max_workers=DEFAULT_MAX_WORKERS, expand=True, expand_uri=REDFISH_EXPAND_URI):
+        """
+        :param idrac: iDRACRedfishAPI object
+        :param max_workers: maximum number of concurrent requests
+        :param expand: use '$expand' for collections, set to False after the service rejects it
+        :param expand_uri: format of the '$expand' URI, with the collection URI and the levels
+        """
+        self.idrac = idrac
+        self.max_workers = max_workers
+        self.expand = expand
+        self.expand_uri = expand_uri
+        self._resources = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._requests = threading.BoundedSemaphore(max(max_workers or 1, 1))
+
+    @staticmethod
+    def _is_expanded(ref):
+        return any(not key.startswith("@odata.") for key in ref)
+
+    def _load(self, uri, request_uri):
+        """Returns the resource of the URI, requesting request_uri unless it is loaded or being loaded."""
+        with self._lock:
+            if uri in self._resources:
+                return self._resources[uri]
+            future = self._pending.get(uri)
+            owner = future is None
+            if owner:
+                future = self._pending[uri] = Future()
+        if not owner:
+            return future.result()
+        try:
+            with self._requests:
+                resource = self.idrac.invoke_request(request_uri, "GET").json_data
+        except Exception as err:
+            with self._lock:
+                del self._pending[uri]
+            future.set_exception(err)
+            raise
+        with self._lock:
+            self._resources[uri] = resource
+            del self._pending[uri]
+        future.set_result(resource)
+        return resource
+
+    def get(self, uri):
+        """Returns the resource data for the URI, the URI is requested only on first use."""
+        return self._load(uri, uri)
+
+    def get_all(self, refs):
+        """
+        Returns the resources for a list of '@odata.id' references or URIs, in the same order.
+        References which are already expanded are used as is, the rest are fetched concurrently.
+        """
+        uris = []
+        for ref in refs:
+            if isinstance(ref, dict):
+                if self._is_expanded(ref):
+                    with self._lock:
+                        self._resources.setdefault(ref[ODATA_ID], ref)
+                ref = ref[ODATA_ID]
+            uris.append(ref)
+        with self._lock:
+            missing = [uri for uri in dict.fromkeys(uris) if uri not in self._resources]
+        run_concurrently(self.get, missing, max_workers=self.max_workers)
+        return [self.get(uri) for uri in uris]
+
+    def _get_collection(self, uri, levels):
+        if self.expand:
+            try:
+                return self._load(uri, self.expand_uri.format(uri, levels))
+            except HTTPError as err:
+                if err.code not in (400, 405, 501):
+                    raise
+                self.expand = False
+        return self.get(uri)
+
+    def get_members(self, uri, levels=1):
+        """
+        Returns the members of a collection.
+        :param uri: '@odata.id' of the collection
+        :param levels: number of levels expanded below the collection
+        """
+        return self.get_all(self._get_collection(uri, levels).get("Members", []))
+
+    def get_all_members(self, uris, levels=1):
+        """
+        Returns the members of several collections, in the same order. The collections are read
+        concurrently, then the members of all of them are fetched together in one pass.
+        :param uris: list of '@odata.id' of the collections
+        :param levels: number of levels expanded below the collections
+        """
+        collections = run_concurrently(lambda uri: self._get_collection(uri, levels), uris, max_workers=self.max_workers)
+        refs = [collection.get("Members", []) for collection in collections]
+        members = self.get_all([ref for collection_refs in refs for ref in collection_refs])
+        result, start = [], 0
+        for collection_refs in refs:
+            result.append(members[start:start + len(collection_refs)])
+            start += len(collection_refs)
+        return result
+
+
+class MultipartFileBody(object):
+    """
+    multipart/form-data body for uploading a single file, which is read from disk in chunks
+    while it is sent instead of being loaded into memory.
+    The body can be iterated more than once, every iteration reopens the file and starts from
+    the beginning, so a failed upload can be sent again on a new connection.
+    """
+
+    def __init__(self, file_path, field_name="file", file_name=None, file_type="application/octet-stream",
+                 chunk_size=UPLOAD_CHUNK_SIZE, progress=None):
+        """
+        :param file_path: path of the file to upload
+        :param field_name: name of the form field
+        :param file_name: file name sent to the server, defaults to the base name of file_path
+        :param file_type: Content-Type of the file part
+        :param chunk_size: number of bytes read from the file at a time
+        :param progress: (optional) callable invoked with the bytes of the file sent and the file size
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.file_size = os.path.getsize(file_path)
+        self.boundary = binascii.hexlify(os.urandom(16)).decode("ascii")
+        file_name = file_name or os.path.basename(file_path)
+        self._head = ('--{0}\r\nContent-Disposition: form-data; name="{1}"; filename="{2}"\r\n'
+                      'Content-Type: {3}\r\n\r\n').format(self.boundary, field_name, file_name,
+                                                          file_type).encode("utf-8")
+        self._tail = "\r\n--{0}--\r\n".format(self.boundary).encode("ascii")
+        self.content_length = len(self._head) + self.file_size + len(self._tail)
+
+    @property
+    def content_type(self):
+        return "multipart/form-data; boundary={0}".format(self.boundary)
+
+    @property
+    def headers(self):
+        """Headers to send with the body, the Content-Length is known upfront so no chunked encoding is needed."""
+        return {"Content-Type": self.content_type, "Content-Length": str(self.content_length)}
+
+    def __len__(self):
+        return self.content_length
+
+    def __iter__(self):
+        yield self._head
+        sent = 0
+        with open(self.file_path, "rb") as file_obj:
+            for chunk in iter(partial(file_obj.read, self.chunk_size), b""):
+                sent += len(chunk)
+                yield chunk
+                if self.progress is not None:
+                    self.progress(sent, self.file_size)
+        yield self._tail
+
+
+def write_file_atomically(file_path, chunks, strip_cr=False, checksum=None, size=None):
+    """
+    Writes the chunks to a temporary file next to file_path which replaces file_path once every chunk
+    is written and verified, so a failed download never leaves a partial file behind.
+    :param file_path: path of the file to write
+    :param chunks: iterable of bytes, for example a response read in chunks
+    :param strip_cr: removes the carriage returns from the content while it is written
+    :param checksum: (optional) expected SHA-256 hex digest of the written content
+    :param size: (optional) expected number of bytes received, for example the Content-Length of a response
+    :return: SHA-256 hex digest of the written content
+    """
+    temp_path = "{0}.{1}.part".format(file_path, binascii.hexlify(os.urandom(4)).decode("ascii"))
+    digest, received = hashlib.sha256(), 0
+    try:
+        with open(temp_path, "xb") as file_obj:
+            for chunk in chunks:
+                received += len(chunk)
+                if strip_cr:
+                    chunk = chunk.replace(b"\r", b"")
+                digest.update(chunk)
+                file_obj.write(chunk)
+        if size is not None and received != int(size):
+            raise ValueError("Incomplete download of '{0}', received {1} of {2} bytes.".format(file_path, received, size))
+        if checksum is not None and digest.hexdigest() != checksum.lower():
+            raise ValueError("Checksum mismatch for '{0}'.".format(file_path))
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return digest.hexdigest()
+
+
 def config_ipv6(hostname):
     ip_addr, port = hostname, None
     if hostname.count(':') == 1:
@@ -118,6 +382,183 @@ def compress_ipv6(ipv6_long):
     return ipv6_short
 
 
+def get_etag(resp):
+    """Returns the ETag header of a response of the REST clients or None."""
+    headers = getattr(getattr(resp, "resp", None), "headers", None)
+    etag = headers.get("ETag") if headers is not None else None
+    return etag if isinstance(etag, str) else None
+
+
+def job_getter(rest_obj, uri_first=False, **kwargs):
+    """
+    Returns a fetch callable for :class:`JobTracker` which sends GET requests with a REST client.
+    :param rest_obj: RestOME, Redfish or iDRACRedfishAPI object
+    :param uri_first: set when invoke_request of the client takes the uri before the method
+    :param kwargs: additional arguments of invoke_request, for example api_timeout
+    """
+    def fetch(uri, headers=None):
+        args = (uri, 'GET') if uri_first else ('GET', uri)
+        if not headers:
+            return rest_obj.invoke_request(*args, **kwargs)
+        try:
+            return rest_obj.invoke_request(*args, headers=headers, **kwargs)
+        finally:
+            # The clients keep the headers of a request for all the later requests.
+            client_headers = getattr(rest_obj, "_headers", None)
+            if isinstance(client_headers, dict):
+                for key in headers:
+                    client_headers.pop(key, None)
+    return fetch
+
+
+def get_job_state(resp):
+    """
+    Returns the state of a job response of the REST clients, the default state_key of :class:`JobTracker`.
+    The first of JOB_STATE_KEYS found in the response is returned, None when there is none.
+    """
+    data = getattr(resp, "json_data", None)
+    if not isinstance(data, dict):
+        return None
+    for key in JOB_STATE_KEYS:
+        if key in data:
+            return data[key]
+    return None
+
+
+class JobTracker(object):
+    """
+    Polls one or more jobs until each of them reaches a terminal state.
+
+    The interval between two polls of a job starts at min_interval and doubles up to max_interval
+    while the state of the job is unchanged, it drops back to min_interval whenever the state
+    changes. Only the value returned by state_key is compared, so progress or message updates of a
+    running job do not shorten the interval. A state change is seen shortly after it happens
+    without polling long running jobs too often.
+    With conditional set, a job which returned an ETag is polled with If-None-Match and a 304
+    response counts as unchanged. The REST clients keep the headers of a request in a dict shared
+    by all the requests, so conditional polls of several jobs are refused unless max_workers is 1.
+    With wake_event set, for example by a listener of the events of the jobs, the sleep between two
+    polls ends as soon as the event is set and all the jobs are polled right away.
+    The waited time is the sum of the intervals slept, like the trackers which used fixed sleeps.
+    """
+
+    def __init__(self, fetch, is_terminal, max_wait_sec=600, max_interval=10, min_interval=JOB_POLL_MIN_INTERVAL,
+                 max_unresponsive_wait=0, initial_wait=0, conditional=False, max_workers=DEFAULT_MAX_WORKERS,
+                 wake_event=None, state_key=get_job_state):
+        """
+        :param fetch: callable fetch(job, headers=None) which returns the response of a job
+        :param is_terminal: callable is_terminal(resp) which returns True once the job has finished
+        :param max_wait_sec: maximum time to wait for the jobs, None waits until all of them finish
+        :param max_interval: maximum time between two polls of a job
+        :param min_interval: time between two polls of a job after it has changed
+        :param max_unresponsive_wait: time for which the polls of a job may fail, a failed poll is
+            retried after max_interval
+        :param initial_wait: time slept before the first poll, it is not counted in wait_time
+        :param conditional: send If-None-Match with the ETag of the previous response
+        :param max_workers: maximum number of jobs polled at the same time
+        :param wake_event: (optional) threading.Event which ends the sleep between two polls
+        :param state_key: callable state_key(resp) which returns the state of the job, the interval
+            drops back to min_interval when it changes
+        """
+        self.fetch = fetch
+        self.is_terminal = is_terminal
+        self.max_wait_sec = max_wait_sec
+        self.max_interval = max_interval if max_interval and max_interval > 0 else min_interval
+        self.min_interval = min(min_interval, self.max_interval)
+        self.max_unresponsive_wait = max_unresponsive_wait
+        self.initial_wait = initial_wait
+        self.conditional = conditional
+        self.max_workers = max_workers
+        self.wake_event = wake_event
+        self.state_key = state_key
+        self.wait_time = 0
+        self._state = {}
+
+    def _poll(self, job):
+        state = self._state[job]
+        state["polls"] += 1
+        try:
+            resp = None
+            if state["etag"]:
+                try:
+                    resp = self.fetch(job, headers={"If-None-Match": state["etag"]})
+                except HTTPError as err:
+                    if err.code != 304:
+                        raise err
+            else:
+                resp = self.fetch(job)
+            if resp is None or getattr(resp, "status_code", None) == 304:
+                return state["resp"], False, False, None
+            terminal = self.is_terminal(resp)
+            job_state = self.state_key(resp)
+            changed = state["polls"] == 1 or job_state != state["snapshot"]
+            state["resp"], state["snapshot"] = resp, job_state
+            if self.conditional:
+                state["etag"] = get_etag(resp)
+            return resp, changed, terminal, None
+        except Exception as err:
+            return state["resp"], False, False, err
+
+    def _sleep(self, sleep_time, pending, elapsed):
+        if self.wake_event is None:
+            perf_sleep(sleep_time, "JobTracker.wait")
+            return sleep_time
+        start = time.monotonic()
+        if self.wake_event.wait(sleep_time):
+            self.wake_event.clear()
+            sleep_time = min(time.monotonic() - start, sleep_time)
+            for job in pending:
+                self._state[job]["next_poll"] = elapsed + sleep_time
+        get_recorder().record_sleep("JobTracker.wait", sleep_time)
+        return sleep_time
+
+    def wait(self, jobs):
+        """
+        Waits for the jobs.
+        :param jobs: list of job uris, or of the job identifiers understood by fetch
+        :return: dict of each job to a dict with 'resp', the last response of the job, 'terminal'
+            set when the job has finished, 'error', the exception raised by the last poll or None, and
+            'polls', the number of polls
+        :raises ValueError: when conditional is set and several jobs would be polled at the same time
+        """
+        pending = list(dict.fromkeys(jobs))
+        if self.conditional and len(pending) > 1 and self.max_workers and self.max_workers > 1:
+            raise ValueError("Conditional polling of several jobs requires max_workers to be 1.")
+        retries = int(self.max_unresponsive_wait // self.max_interval)
+        self._state = dict((job, {"resp": None, "snapshot": None, "etag": None, "interval": self.min_interval,
+                                  "next_poll": 0, "retries": retries, "polls": 0}) for job in pending)
+        results = dict((job, {"resp": None, "terminal": False, "error": None, "polls": 0}) for job in pending)
+        if self.initial_wait and pending:
+            perf_sleep(self.initial_wait, "JobTracker.wait")
+        elapsed = 0
+        while pending and (self.max_wait_sec is None or elapsed < self.max_wait_sec):
+            due = [job for job in pending if self._state[job]["next_poll"] <= elapsed]
+            for job, (resp, changed, terminal, err) in zip(due, run_concurrently(self._poll, due, self.max_workers)):
+                state, result = self._state[job], results[job]
+                result["resp"], result["error"], result["polls"] = resp, err, state["polls"]
+                if err is not None:
+                    if state["retries"] > 0:
+                        state["retries"] -= 1
+                        state["next_poll"] = elapsed + self.max_interval
+                        continue
+                    pending.remove(job)
+                elif terminal:
+                    result["terminal"] = True
+                    pending.remove(job)
+                else:
+                    interval = self.min_interval if changed else state["interval"] * JOB_POLL_BACKOFF
+                    state["interval"] = min(interval, self.max_interval)
+                    state["next_poll"] = elapsed + state["interval"]
+            if not pending:
+                break
+            sleep_time = min(self._state[job]["next_poll"] for job in pending) - elapsed
+            if self.max_wait_sec is not None:
+                sleep_time = min(sleep_time, self.max_wait_sec - elapsed)
+            elapsed += self._sleep(sleep_time, pending, elapsed)
+        self.wait_time = elapsed
+        return results
+
+
 def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRunStatus', 'Id'),
                  job_complete_states=(2060, 2020, 2090), job_fail_states=(2070, 2101, 2102, 2103),
                  job_running_states=(2050, 2040, 2030, 2100),
@@ -130,8 +571,9 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
     :param job_state_var: The nested dict traversal path
     :param job_complete_states:
     :param job_fail_states:
-    :param job_running_states:
-    :param sleep_interval_secs:
+    :param job_running_states: kept for compatibility, any state which is neither complete nor
+        failed is polled until max_job_wait_sec
+    :param sleep_interval_secs: maximum time between two polls
     :param max_unresponsive_wait:
     :param initial_wait:
     :return:
@@ -142,49 +584,34 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
     #     2103: "Canceled"
     # }
     # ensure job states are mutually exclusive
-    max_retries = max_job_wait_sec // sleep_interval_secs
-    unresp = max_unresponsive_wait // sleep_interval_secs
-    loop_ctr = 0
     job_failed = True
     job_dict = {}
-    wait_time = 0
     if set(job_complete_states) & set(job_fail_states):
-        return job_failed, "Overlapping job states found.", job_dict, wait_time
+        return job_failed, "Overlapping job states found.", job_dict, 0
     msg = "Job tracking started."
-    time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
-        try:
-            job_resp = rest_obj.invoke_request('GET', job_uri)
-            job_dict = job_resp.json_data
-            job_status = job_dict
-            for x in job_state_var:
-                job_status = job_status.get(x, {})
-            if job_status in job_complete_states:
-                job_failed = False
-                msg = "Job tracking completed."
-                loop_ctr = max_retries
-            elif job_status in job_fail_states:
-                job_failed = True
-                msg = "Job is in Failed state."
-                loop_ctr = max_retries
-            if job_running_states:
-                if job_status in job_running_states:
-                    time.sleep(sleep_interval_secs)
-                    wait_time = wait_time + sleep_interval_secs
-            else:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-        except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            else:
-                job_failed = True
-                msg = "Exception in job tracking " + str(err)
-                break
-            unresp = unresp - 1
-    return job_failed, msg, job_dict, wait_time
+
+    def get_job_status(resp):
+        job_status = resp.json_data
+        for x in job_state_var:
+            job_status = job_status.get(x, {})
+        return job_status
+
+    tracker = JobTracker(job_getter(rest_obj),
+                         lambda resp: get_job_status(resp) in tuple(job_complete_states) + tuple(job_fail_states),
+                         max_wait_sec=max_job_wait_sec, max_interval=sleep_interval_secs,
+                         max_unresponsive_wait=max_unresponsive_wait, initial_wait=initial_wait, conditional=True,
+                         state_key=get_job_status)
+    result = tracker.wait([job_uri])[job_uri]
+    if result["resp"] is not None:
+        job_dict = result["resp"].json_data
+    if result["error"] is not None:
+        msg = "Exception in job tracking " + str(result["error"])
+    elif result["terminal"] and get_job_status(result["resp"]) in job_complete_states:
+        job_failed = False
+        msg = "Job tracking completed."
+    elif result["terminal"]:
+        msg = "Job is in Failed state."
+    return job_failed, msg, job_dict, tracker.wait_time
 
 
 def idrac_redfish_job_tracking(
@@ -197,47 +624,34 @@ def idrac_redfish_job_tracking(
     # idrac_redfish_job_sates = [ "New", "Scheduled", "Running", "Completed", "Downloading", "Downloaded",
     # "Scheduling", "ReadyForExecution", "Waiting", "Paused", "Failed", "CompletedWithErrors", "RebootPending",
     # "RebootFailed", "RebootCompleted", "PendingActivation", "Unknown"]
-    max_retries = max_job_wait_sec // sleep_interval_secs
-    unresp = max_unresponsive_wait // sleep_interval_secs
-    loop_ctr = 0
     job_failed = True
     job_dict = {}
-    wait_time = 0
     if set(job_complete_states) & set(job_fail_states):
-        return job_failed, "Overlapping job states found.", job_dict, wait_time
+        return job_failed, "Overlapping job states found.", job_dict, 0
     msg = "Job tracking started."
-    time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
-        try:
-            job_resp = rest_obj.invoke_request(job_uri, 'GET')
-            job_dict = job_resp.json_data
-            job_status = job_dict
-            job_status = job_status.get(job_state_var, "Unknown")
-            if job_status in job_running_states:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            elif job_status in job_complete_states:
-                job_failed = False
-                msg = "Job tracking completed."
-                loop_ctr = max_retries
-            elif job_status in job_fail_states:
-                job_failed = True
-                msg = "Job is in {0} state.".format(job_status)
-                loop_ctr = max_retries
-            else:  # unrecognised states, just wait
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-        except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            else:
-                job_failed = True
-                msg = "Exception in job tracking " + str(err)
-                break
-            unresp = unresp - 1
-    return job_failed, msg, job_dict, wait_time
+
+    def is_terminal(resp):
+        job_status = resp.json_data.get(job_state_var, "Unknown")
+        return job_status not in job_running_states and job_status in tuple(job_complete_states) + tuple(
+            job_fail_states)
+
+    tracker = JobTracker(job_getter(rest_obj, uri_first=True), is_terminal,
+                         max_wait_sec=max_job_wait_sec, max_interval=sleep_interval_secs,
+                         max_unresponsive_wait=max_unresponsive_wait, initial_wait=initial_wait, conditional=True,
+                         state_key=lambda resp: resp.json_data.get(job_state_var))
+    result = tracker.wait([job_uri])[job_uri]
+    if result["resp"] is not None:
+        job_dict = result["resp"].json_data
+    if result["error"] is not None:
+        msg = "Exception in job tracking " + str(result["error"])
+    elif result["terminal"]:
+        job_status = job_dict.get(job_state_var, "Unknown")
+        if job_status in job_complete_states:
+            job_failed = False
+            msg = "Job tracking completed."
+        else:
+            msg = "Job is in {0} state.".format(job_status)
+    return job_failed, msg, job_dict, tracker.wait_time
 
 
 def get_rest_items(rest_obj, uri="DeviceService/Devices", key="Id", value="Identifier", selector="value"):
@@ -270,41 +684,37 @@ def apply_diff_key(src, dest, klist):
 
 
 def wait_for_job_completion(redfish_obj, uri, job_wait=True, wait_timeout=120, sleep_time=10):
-    max_sleep_time = wait_timeout
-    sleep_interval = sleep_time
     if job_wait:
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            job_resp = redfish_obj.invoke_request("GET", uri)
-            if job_resp.json_data.get("PercentComplete") == 100:
-                time.sleep(10)
-                return job_resp, ""
+        tracker = JobTracker(job_getter(redfish_obj), lambda resp: resp.json_data.get("PercentComplete") == 100,
+                             max_wait_sec=wait_timeout, max_interval=sleep_time,
+                             initial_wait=min(sleep_time, JOB_POLL_MIN_INTERVAL), conditional=True)
+        result = tracker.wait([uri])[uri]
+        if result["error"] is not None:
+            raise result["error"]
+        if result["terminal"]:
+            perf_sleep(10, "wait_for_job_completion")
+            return result["resp"], ""
     else:
         job_resp = redfish_obj.invoke_request("GET", uri)
-        time.sleep(10)
+        perf_sleep(10, "wait_for_job_completion")
         return job_resp, ""
     return {}, "The job is not complete after {0} seconds.".format(wait_timeout)
 
 
 def wait_after_idrac_reset(idrac, wait_time_sec, interval=30):
-    time.sleep(interval // 2)
+    perf_sleep(interval // 2, "wait_after_idrac_reset")
     msg = RESET_UNTRACK
     wait = wait_time_sec
     track_failed = True
     while wait > 0:
         try:
             idrac.invoke_request(MANAGERS_URI, 'GET')
-            time.sleep(interval // 2)
+            perf_sleep(interval // 2, "wait_after_idrac_reset")
             msg = RESET_SUCCESS
             track_failed = False
             break
         except Exception:
-            time.sleep(interval)
+            perf_sleep(interval, "wait_after_idrac_reset")
             wait = wait - interval
     return track_failed, msg
 
@@ -337,29 +747,25 @@ def get_manager_res_id(idrac):
 
 
 def wait_for_idrac_job_completion(idrac, uri, job_wait=True, wait_timeout=120, sleep_time=10):
-    max_sleep_time = wait_timeout
-    sleep_interval = sleep_time
     job_msg = "The job is not complete after {0} seconds.".format(wait_timeout)
     if job_wait:
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            job_resp = idrac.invoke_request(uri, "GET")
-            if job_resp.json_data.get("PercentComplete") == 100:
-                time.sleep(10)
-                return job_resp, ""
-            if job_resp.json_data.get("JobState") == "RebootFailed":
-                time.sleep(10)
-                return job_resp, job_msg
+        tracker = JobTracker(job_getter(idrac, uri_first=True),
+                             lambda resp: resp.json_data.get("PercentComplete") == 100 or
+                             resp.json_data.get("JobState") == "RebootFailed",
+                             max_wait_sec=wait_timeout, max_interval=sleep_time,
+                             initial_wait=min(sleep_time, JOB_POLL_MIN_INTERVAL), conditional=True)
+        result = tracker.wait([uri])[uri]
+        if result["error"] is not None:
+            raise result["error"]
+        if result["terminal"]:
+            perf_sleep(10, "wait_for_idrac_job_completion")
+            job_resp = result["resp"]
+            return job_resp, "" if job_resp.json_data.get("PercentComplete") == 100 else job_msg
     else:
         job_resp = idrac.invoke_request(uri, "GET")
-        time.sleep(10)
+        perf_sleep(10, "wait_for_idrac_job_completion")
         return job_resp, ""
-    return {}, "The job is not complete after {0} seconds.".format(wait_timeout)
+    return {}, job_msg
 
 
 def idrac_system_reset(idrac, res_id, payload=None, job_wait=True, wait_time_sec=300, interval=30):
@@ -367,7 +773,7 @@ def idrac_system_reset(idrac, res_id, payload=None, job_wait=True, wait_time_sec
     reset_msg = RESET_UNTRACK
     try:
         idrac.invoke_request(SYSTEM_RESET_URI.format(res_id=res_id), 'POST', data=payload)
-        time.sleep(10)
+        perf_sleep(10, "idrac_system_reset")
         if wait_time_sec:
             resp = idrac.invoke_request(MANAGER_JOB_URI, "GET")
             job = list(filter(lambda d: d["JobState"] in ["RebootPending"], resp.json_data["Members"]))
@@ -399,19 +805,73 @@ def get_system_res_id(idrac):
     return res_id, error_msg
 
 
-def get_all_data_with_pagination(ome_obj, uri, query_param=None):
-    """To get all the devices with pagination based on the filter provided."""
+def get_page_links(next_link, total_count):
+    """
+    Builds the links of all the remaining pages from the first '@odata.nextLink' of a collection.
+    :param next_link: '@odata.nextLink' of the first page
+    :param total_count: '@odata.count' of the collection
+    :return: list of links, empty when the link does not have $skip and $top to compute the pages
+    """
+    skip = re.search(PAGE_SKIP_REGEX, next_link or "")
+    top = re.search(PAGE_TOP_REGEX, next_link or "")
+    if not (skip and top and total_count) or int(top.group(1)) <= 0:
+        return []
+    return [re.sub(PAGE_SKIP_REGEX, r"\g<1>{0}".format(offset), next_link, count=1)
+            for offset in range(int(skip.group(2)), total_count, int(top.group(1)))]
+
+
+def strip_odata_pairs(pairs):
+    """
+    object_pairs_hook for :func:`json.loads` which drops the '@odata.' annotations while
+    the document is decoded, '@odata.count' and '@odata.nextLink' are kept for pagination.
+    """
+    return dict((key, value) for key, value in pairs
+                if not key.startswith(ODATA_PREFIX) or key in ODATA_PAGING_KEYS)
+
+
+def parse_json(body, strip_odata=False):
+    """
+    Parses a JSON response body.
+    :param body: response body
+    :param strip_odata: drop the '@odata.' annotations during decoding, same as calling
+        :func:`remove_key` on the result but without walking the document again
+    :return: parsed document
+    """
+    try:
+        if strip_odata:
+            return json.loads(body, object_pairs_hook=strip_odata_pairs)
+        return json.loads(body)
+    except ValueError:
+        raise ValueError("Unable to parse json")
+
+
+def get_all_data_with_pagination(ome_obj, uri, query_param=None, max_workers=DEFAULT_MAX_WORKERS, strip_odata=False):
+    """
+    To get all the devices with pagination based on the filter provided.
+    The remaining pages are retrieved in parallel when they can be computed from '@odata.count'.
+    With strip_odata the '@odata.' annotations are dropped from the items while the pages are parsed.
+    """
     query, resp, report_list = "", None, []
+    request_kwargs = {"strip_odata": True} if strip_odata else {}
     try:
-        resp = ome_obj.invoke_request('GET', uri, query_param=query_param)
+        resp = ome_obj.invoke_request('GET', uri, query_param=query_param, **request_kwargs)
         next_uri = resp.json_data.get("@odata.nextLink", None)
         report_list = resp.json_data.get("value")
         if query_param is not None:
             for k, v in query_param.items():
                 query += "{0}={1}".format(k, v.replace(" ", "%20"))
+        page_links = get_page_links(next_uri, resp.json_data.get("@odata.count"))
+        if page_links:
+            page_resps = run_concurrently(
+                lambda link: ome_obj.invoke_request(
+                    'GET', "{0}&{1}".format(link.strip("/api"), query) if query else link.strip("/api"), **request_kwargs),
+                page_links, max_workers)
+            for resp in page_resps:
+                report_list.extend(resp.json_data.get("value"))
+            next_uri = resp.json_data.get("@odata.nextLink", None)
         while next_uri is not None:
             next_uri_query = "{0}&{1}".format(next_uri.strip("/api"), query) if query else next_uri.strip("/api")
-            resp = ome_obj.invoke_request('GET', next_uri_query)
+            resp = ome_obj.invoke_request('GET', next_uri_query, **request_kwargs)
             report_list.extend(resp.json_data.get("value"))
             next_uri = resp.json_data.get("@odata.nextLink", None)
     except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
@@ -444,7 +904,7 @@ def wait_for_redfish_reboot_job(redfish_obj, res_id, payload=None, wait_time_sec
     reset, job_resp, msg = False, {}, ""
     try:
         resp = redfish_obj.invoke_request('POST', SYSTEM_RESET_URI.format(res_id=res_id), data=payload, api_timeout=120)
-        time.sleep(10)
+        perf_sleep(10, "wait_for_redfish_reboot_job")
         if wait_time_sec and resp.status_code == 204:
             resp = redfish_obj.invoke_request("GET", MANAGER_JOB_URI)
             reboot_job_lst = list(filter(lambda d: (d["JobType"] in ["RebootNoForce"]), resp.json_data["Members"]))
@@ -459,27 +919,23 @@ def wait_for_redfish_reboot_job(redfish_obj, res_id, payload=None, wait_time_sec
 
 
 def wait_for_redfish_job_complete(redfish_obj, job_uri, job_wait=True, wait_timeout=120, sleep_time=10):
-    max_sleep_time = wait_timeout
-    sleep_interval = sleep_time
     job_msg = "The job is not complete after {0} seconds.".format(wait_timeout)
     job_resp = {}
     if job_wait:
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
-            if job_resp.json_data.get("PercentComplete") == 100:
-                time.sleep(10)
-                return job_resp, ""
-            if job_resp.json_data.get("JobState") == "RebootFailed":
-                time.sleep(10)
-                return job_resp, job_msg
+        tracker = JobTracker(job_getter(redfish_obj, api_timeout=120),
+                             lambda resp: resp.json_data.get("PercentComplete") == 100 or
+                             resp.json_data.get("JobState") == "RebootFailed",
+                             max_wait_sec=wait_timeout, max_interval=sleep_time,
+                             initial_wait=min(sleep_time, JOB_POLL_MIN_INTERVAL), conditional=True)
+        result = tracker.wait([job_uri])[job_uri]
+        if result["error"] is not None:
+            raise result["error"]
+        job_resp = result["resp"] if result["resp"] is not None else job_resp
+        if result["terminal"]:
+            perf_sleep(10, "wait_for_redfish_job_complete")
+            return job_resp, "" if job_resp.json_data.get("PercentComplete") == 100 else job_msg
     else:
-        time.sleep(10)
+        perf_sleep(10, "wait_for_redfish_job_complete")
         job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
         return job_resp, ""
     return job_resp, job_msg
@@ -578,14 +1034,12 @@ def trigger_restart_operation(idrac, restart_type="GracefulRestart", resource_id
 def wait_for_lc_status(idrac, job_wait_timeout=300, resource_id=None, interval=10):
     lc_status_completed, error_msg = False, ''
     lcstatus = ""
-    retry_count = 1
     # LCStatus remain 'Ready' even after triggering restart
     # so waiting few seconds before loop
     waiting_before_lc_status_check = 12 * interval
     if job_wait_timeout >= waiting_before_lc_status_check:
-        time.sleep(waiting_before_lc_status_check)
+        perf_sleep(waiting_before_lc_status_check, "wait_for_lc_status")
         job_wait_timeout = job_wait_timeout - waiting_before_lc_status_check
-    max_idrac_reset_try = job_wait_timeout // interval
     uri, error_msg = validate_and_get_first_resource_id_uri(resource_id, idrac, MANAGERS_URI)
     if error_msg:
         return lc_status_completed, error_msg
@@ -596,25 +1050,20 @@ def wait_for_lc_status(idrac, job_wait_timeout=300, resource_id=None, interval=1
         lc_url = action_resp.get('Actions', {}).get('#DellLCService.GetRemoteServicesAPIStatus', {}).get('target', {})
     else:
         return lc_status_completed, UNSUPPORTED_LC_STATUS_MSG
-    lc_resp = idrac.invoke_request(lc_url, "POST", data="{}", dump=False)
-    lcstatus = lc_resp.json_data.get('LCStatus')
-    while retry_count < max_idrac_reset_try:
-        try:
-            lc_resp = idrac.invoke_request(lc_url, "POST", data="{}", dump=False)
-            lcstatus = lc_resp.json_data.get('LCStatus')
-            if lcstatus == 'Ready':
-                lc_status_completed = True
-                break
-            time.sleep(interval)
-            retry_count = retry_count + 1
-        except URLError:
-            time.sleep(interval)
-            retry_count = retry_count + 1
-            if retry_count == max_idrac_reset_try:
-                error_msg = LC_STATUS_MSG.format(lc_status='unreachable', retries=max_idrac_reset_try)
-                break
-    if retry_count == max_idrac_reset_try and lcstatus != "Ready":
-        error_msg = LC_STATUS_MSG.format(lc_status=lcstatus, retries=retry_count)
+    tracker = JobTracker(lambda lc_uri, headers=None: idrac.invoke_request(lc_uri, "POST", data="{}", dump=False),
+                         lambda lc_resp: lc_resp.json_data.get('LCStatus') == 'Ready',
+                         max_wait_sec=job_wait_timeout, max_interval=interval,
+                         max_unresponsive_wait=job_wait_timeout)
+    result = tracker.wait([lc_url])[lc_url]
+    if result["error"] is not None and not isinstance(result["error"], URLError):
+        raise result["error"]
+    if result["terminal"]:
+        lc_status_completed = True
+    elif result["error"] is not None:
+        error_msg = LC_STATUS_MSG.format(lc_status='unreachable', retries=result["polls"])
+    else:
+        lcstatus = result["resp"].json_data.get('LCStatus') if result["resp"] is not None else lcstatus
+        error_msg = LC_STATUS_MSG.format(lc_status=lcstatus, retries=result["polls"])
     return lc_status_completed, error_msg
 
 
@@ -696,7 +1145,7 @@ def track_power_state(idrac, base_uri, desired_state, retries=POWER_CHECK_RETRIE
             achieved = True
             break
         else:
-            time.sleep(interval)
+            perf_sleep(interval, "track_power_state")
         count = count - 1
     else:
         achieved = False
@@ -744,7 +1193,7 @@ def reset_host(idrac, restart_type, system_uri, base_uri):
         state_achieved = track_power_state(idrac, base_uri, ["Off"])
         p_state = "On"
         if not state_achieved:
-            time.sleep(10)
+            perf_sleep(10, "reset_host")
             p_state = "ForceRestart"
     p_act = power_act_host(idrac, system_uri, p_state)
     if not p_act:
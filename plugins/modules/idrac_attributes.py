@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2022-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -260,10 +260,12 @@ error_info:
 
 import json
 import re
+from functools import partial
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_manager_res_id
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_manager_res_id, run_concurrently
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import get_registry_index
 
 
 SUCCESS_MSG = "Successfully updated the attributes."
@@ -275,6 +277,7 @@ MANAGER_ID = "iDRAC.Embedded.1"
 LC_ID = "LifecycleController.Embedded.1"
 MANAGERS_URI = "/redfish/v1/Managers"
 ATTR = "Attributes"
+MANAGER_ATTR_URI = "/redfish/v1/Managers/{0}/Attributes"
 JOB_URI = "/redfish/v1/Managers/{manager_id}/Jobs/{job_id}"
 
 
@@ -301,10 +304,32 @@ def validate_attr_name(attribute, req_data):
     return data_dict, invalid_attr
 
 
+def get_attribute_components(idrac, fqdd_list):
+    """
+    Returns the current attributes of the components in the Server Configuration Profile
+    format, read concurrently from the Attributes resource of each component, or None
+    when iDRAC does not provide them.
+    """
+    try:
+        responses = run_concurrently(lambda fqdd: idrac.invoke_request(MANAGER_ATTR_URI.format(fqdd), "GET").json_data,
+                                     fqdd_list)
+    except HTTPError:
+        return None
+    components = []
+    for fqdd, response in zip(fqdd_list, responses):
+        attributes = [{"Name": re.sub(r"\.(?!\d)", "#", key), "Value": "" if val is None else str(val)}
+                      for key, val in response.get(ATTR, {}).items()]
+        components.append({"FQDD": fqdd, "Attributes": attributes})
+    return components
+
+
 def get_check_mode(module, idrac, idrac_json, sys_json, lc_json):
-    scp_response = idrac.export_scp(export_format="JSON", export_use="Default",
-                                    target="iDRAC,System,LifecycleController", job_wait=True)
-    comp = scp_response.json_data["SystemConfiguration"]["Components"]
+    fqdd_list = [fqdd for fqdd, attr in ((MANAGER_ID, idrac_json), (SYSTEM_ID, sys_json), (LC_ID, lc_json)) if attr]
+    comp = get_attribute_components(idrac, fqdd_list)
+    if comp is None:
+        scp_response = idrac.export_scp(export_format="JSON", export_use="Default",
+                                        target="iDRAC,System,LifecycleController", job_wait=True)
+        comp = scp_response.json_data["SystemConfiguration"]["Components"]
     exist_idrac, exist_sys, exist_lc, invalid = {}, {}, {}, {}
     for cmp in comp:
         if idrac_json and cmp.get("FQDD") == MANAGER_ID:
@@ -369,16 +394,21 @@ def get_response_attr(idrac, idrac_id, attr, uri_dict):
     return diff, response_attr
 
 
-def get_attributes_registry(idrac):
-    reggy = {}
+def fetch_registry_attributes(idrac):
+    attr_list = []
+    resp = idrac.invoke_request("/redfish/v1/Registries/ManagerAttributeRegistry", "GET")
+    loc_list = resp.json_data.get("Location", [])
+    if loc_list:
+        reg_json_uri = loc_list[-1].get("Uri")
+        reg_resp = idrac.invoke_request(reg_json_uri, "GET")
+        attr_list = reg_resp.json_data.get("RegistryEntries").get("Attributes")
+    return attr_list
+
+
+def get_attributes_registry(idrac, model=None, firmware_version=None):
     try:
-        resp = idrac.invoke_request("/redfish/v1/Registries/ManagerAttributeRegistry", "GET")
-        loc_list = resp.json_data.get("Location", [])
-        if loc_list:
-            reg_json_uri = loc_list[-1].get("Uri")
-            reg_resp = idrac.invoke_request(reg_json_uri, "GET")
-            attr_list = reg_resp.json_data.get("RegistryEntries").get("Attributes")
-            reggy = dict((x["AttributeName"], x) for x in attr_list)
+        reggy = get_registry_index(["ManagerAttributeRegistry", model, firmware_version],
+                                   partial(fetch_registry_attributes, idrac), value_key="ValueDisplayName")
     except Exception:
         reggy = {}
     return reggy
@@ -389,16 +419,15 @@ def validate_vs_registry(registry, attr_dict):
     for k, v in attr_dict.items():
         if k in registry:
             val_dict = registry.get(k)
-            if val_dict.get("Readonly"):
+            if val_dict.get("ReadOnly"):
                 invalid[k] = "Read only Attribute cannot be modified."
             else:
                 type = val_dict.get("Type")
                 if type == "Enumeration":
-                    found = False
-                    for val in val_dict.get("Value", []):
-                        if v == val.get("ValueDisplayName"):
-                            found = True
-                            break
+                    try:
+                        found = v in val_dict.get("Values", ())
+                    except TypeError:
+                        found = False
                     if not found:
                         invalid[k] = "Invalid value for Enumeration."
                 if type == "Integer":
@@ -431,17 +460,23 @@ def fetch_idrac_uri_attr(idrac, module, res_id):
         system_attr = module.params.get("system_attributes")
         lc_attr = module.params.get("lifecycle_controller_attributes")
         invalid = {}
-        attr_registry = get_attributes_registry(idrac)
+        requests = [partial(get_attributes_registry, idrac, response.json_data.get("Model"),
+                            response.json_data.get("FirmwareVersion"))]
+        for attr_id, attr in ((MANAGER_ID, idrac_attr), (SYSTEM_ID, system_attr), (LC_ID, lc_attr)):
+            if attr is not None:
+                requests.append(partial(get_response_attr, idrac, attr_id, attr, uri_dict))
+        responses = run_concurrently(lambda request: request(), requests)
+        attr_registry = responses.pop(0)
         if idrac_attr is not None:
-            x, idrac_response_attr = get_response_attr(idrac, MANAGER_ID, idrac_attr, uri_dict)
+            x, idrac_response_attr = responses.pop(0)
             invalid.update(validate_vs_registry(attr_registry, idrac_response_attr))
             diff += x
         if system_attr is not None:
-            x, system_response_attr = get_response_attr(idrac, SYSTEM_ID, system_attr, uri_dict)
+            x, system_response_attr = responses.pop(0)
             invalid.update(validate_vs_registry(attr_registry, system_response_attr))
             diff += x
         if lc_attr is not None:
-            x, lc_response_attr = get_response_attr(idrac, LC_ID, lc_attr, uri_dict)
+            x, lc_response_attr = responses.pop(0)
             invalid.update(validate_vs_registry(attr_registry, lc_response_attr))
             diff += x
         if invalid:
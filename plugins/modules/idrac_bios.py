@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.6.0
-# Copyright (C) 2018-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2018-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -356,6 +356,7 @@ from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import get_registry_index
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import idrac_redfish_job_tracking, \
     strip_substr_dict
@@ -605,12 +606,11 @@ def clear_pending_bios(module, redfish_obj):
     module.exit_json(status_msg=SUCCESS_CLEAR, changed=True)
 
 
-def get_attributes_registry(idrac):
-    reggy = {}
+def get_attributes_registry(idrac, model=None, bios_version=None):
     try:
-        resp = idrac.invoke_request(BIOS_REGISTRY, "GET")
-        attr_list = resp.json_data.get("RegistryEntries").get("Attributes")
-        reggy = dict((x["AttributeName"], x) for x in attr_list)
+        reggy = get_registry_index(
+            ["BiosAttributeRegistry", model, bios_version],
+            lambda: idrac.invoke_request(BIOS_REGISTRY, "GET").json_data.get("RegistryEntries").get("Attributes"))
     except Exception:
         reggy = {}
     return reggy
@@ -626,11 +626,10 @@ def validate_vs_registry(registry, attr_dict):
             else:
                 type = val_dict.get("Type")
                 if type == "Enumeration":
-                    found = False
-                    for val in val_dict.get("Value", []):
-                        if v == val.get("ValueName"):
-                            found = True
-                            break
+                    try:
+                        found = v in val_dict.get("Values", ())
+                    except TypeError:
+                        found = False
                     if not found:
                         invalid[k] = "Invalid value for enumeration."
                 if type == "Integer":
@@ -720,7 +719,7 @@ def attributes_config(module, redfish_obj):
         if diff_tuple[0]:
             attr = diff_tuple[0]
     invalid = {}
-    attr_registry = get_attributes_registry(redfish_obj)
+    attr_registry = get_attributes_registry(redfish_obj, curr_attr.get("SystemModelName"), curr_attr.get("SystemBiosVersion"))
     if attr_registry:
         invalid.update(validate_vs_registry(attr_registry, attr))
         if invalid:
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -632,10 +632,9 @@ class ExportDiagnostics(Diagnostics):
         self.share_name = file_path.rstrip("/")
         diagnostics_status = self.__export_diagnostics(payload)
         diagnostics_file_name = payload.get("FileName")
-        diagnostics_data = self.idrac.invoke_request(diagnostics_status.headers.get("Location"), "GET")
+        diagnostics_data = self.idrac.invoke_request(diagnostics_status.headers.get("Location"), "GET", stream=True)
         file_name = os.path.join(file_path, diagnostics_file_name)
-        with open(file_name, "w") as fp:
-            fp.write(diagnostics_data.body.decode().replace("\r", ""))
+        diagnostics_data.download_to(file_name, strip_cr=True)
         return diagnostics_status
 
     def __export_diagnostics_http(self):
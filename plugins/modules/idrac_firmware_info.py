@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.8.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -21,6 +21,31 @@ version_added: "3.0.0"
 description: Get Firmware Inventory.
 extends_documentation_fragment:
   - dellemc.openmanage.idrac_auth_options
+  - dellemc.openmanage.idrac_hosts_options
+options:
+  idrac_ip:
+    required: false
+    type: str
+    description:
+      - iDRAC IP Address.
+      - I(idrac_ip) is required when I(hosts) is not provided.
+  idrac_user:
+    required: false
+    type: str
+    description:
+      - iDRAC username.
+      - If the username is not provided, then the environment variable E(IDRAC_USERNAME) is used.
+      - "Example: export IDRAC_USERNAME=username"
+      - I(idrac_user) is required when I(idrac_ip) is provided, or when a host of I(hosts) does not provide its own.
+  idrac_password:
+    required: false
+    type: str
+    description:
+      - iDRAC user password.
+      - If the password is not provided, then the environment variable E(IDRAC_PASSWORD) is used.
+      - "Example: export IDRAC_PASSWORD=password"
+      - I(idrac_password) is required when I(idrac_ip) is provided, or when a host of I(hosts) does not provide its own.
+    aliases: ['idrac_pwd']
 
 requirements:
     - "python >= 3.9.6"
@@ -41,6 +66,18 @@ EXAMPLES = """
     idrac_user: "user_name"
     idrac_password: "user_password"
     ca_path: "/path/to/ca_cert.pem"
+
+- name: Get Installed Firmware Inventory of several iDRACs in one task
+  dellemc.openmanage.idrac_firmware_info:
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+    max_workers: 16
+    hosts:
+      - idrac_ip: "192.168.0.1"
+      - idrac_ip: "192.168.0.2"
+        idrac_user: "other_user_name"
+        idrac_password: "other_user_password"
 """
 
 RETURN = r'''
@@ -83,6 +120,25 @@ firmware_info:
                 "impactsTPMmeasurements": "false"
             }]
   }
+hosts:
+  type: list
+  elements: dict
+  description:
+    - Results of each iDRAC of I(hosts), with the I(firmware_info) of the iDRAC, or I(msg) and I(error_info) when it could not be queried.
+  returned: when I(hosts) is provided
+  sample: [
+    {
+      "idrac_ip": "192.168.0.1",
+      "failed": false,
+      "firmware_info": {"Firmware": []}
+    },
+    {
+      "idrac_ip": "192.168.0.2",
+      "failed": true,
+      "unreachable": true,
+      "msg": "<urlopen error [Errno 113] No route to host>"
+    }
+  ]
 error_info:
   description: Details of the HTTP Error.
   returned: on HTTP error
@@ -107,7 +163,8 @@ error_info:
 
 import json
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
-from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, idrac_hosts_params, \
+    idrac_hosts_mutually_exclusive, idrac_hosts_required_one_of, idrac_hosts_required_by, exit_idrac_hosts
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import GET_IDRAC_FIRMWARE_DETAILS_URI_10, GET_IDRAC_FIRMWARE_URI_10, remove_key
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -116,8 +173,8 @@ from urllib.error import URLError, HTTPError
 ERR_STATUS = 404
 
 
-def get_from_wsman(module):
-    with iDRACConnection(module.params) as idrac:
+def get_from_wsman(module_params):
+    with iDRACConnection(module_params) as idrac:
         firmware_details = idrac.update_mgr.InstalledFirmware
         return firmware_details
 
@@ -169,7 +226,7 @@ def transform_firmware_data(filtered_data):
     return transformed_data
 
 
-def get_idrac_firmware_info(idrac, module):
+def get_idrac_firmware_info(idrac, module_params):
     try:
         response = idrac.invoke_request(method='GET', uri=GET_IDRAC_FIRMWARE_URI_10)
         if response.status_code == 200:
@@ -186,7 +243,7 @@ def get_idrac_firmware_info(idrac, module):
 
     except HTTPError as err:
         if err.status == ERR_STATUS:
-            return get_from_wsman(module)
+            return get_from_wsman(module_params)
 
         raise
 
@@ -194,14 +251,23 @@ def get_idrac_firmware_info(idrac, module):
 def main():
     specs = {}
     specs.update(idrac_auth_params)
+    specs.update(idrac_hosts_params)
+    specs["idrac_ip"] = {"required": False, "type": 'str'}
+    specs["idrac_user"] = dict(idrac_auth_params["idrac_user"], required=False)
+    specs["idrac_password"] = dict(idrac_auth_params["idrac_password"], required=False)
     module = AnsibleModule(
         argument_spec=specs,
+        mutually_exclusive=idrac_hosts_mutually_exclusive,
+        required_one_of=idrac_hosts_required_one_of,
+        required_by=idrac_hosts_required_by,
         supports_check_mode=True
     )
+    if module.params.get("hosts"):
+        exit_idrac_hosts(module, lambda idrac, params: {"firmware_info": get_idrac_firmware_info(idrac, params)})
 
     try:
         with iDRACRedfishAPI(module.params) as idrac:
-            firmware_info = get_idrac_firmware_info(idrac, module)
+            firmware_info = get_idrac_firmware_info(idrac, module.params)
     except HTTPError as err:
         module.exit_json(msg=str(err), error_info=json.load(err), failed=True)
     except URLError as err:
@@ -0,0 +1,471 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: idrac_gather_facts
+short_description: Gather the facts of the components of a PowerEdge server from iDRAC
+version_added: "9.10.0"
+description:
+  - This module gathers the facts of the components of a PowerEdge server from the Redfish service of iDRAC.
+  - The collections are read with C($expand) and the remaining resources are fetched concurrently over one session.
+  - The facts have the same structure as the facts set by the C(dellemc.openmanage.idrac_gather_facts) role.
+extends_documentation_fragment:
+  - dellemc.openmanage.idrac_x_auth_options
+options:
+  target:
+    description:
+      - Target components for which the facts are gathered.
+      - C(IDRAC) gathers the system, manager and lifecycle controller attributes.
+      - C(System) gathers the ComputerSystem resource and the operating system attributes.
+      - C(BIOS) gathers the BIOS attributes.
+      - C(Controller) gathers the storage controllers.
+      - C(CPU) gathers the system processors.
+      - C(Enclosure) gathers the enclosures.
+      - C(EnclosureEMM) gathers the enclosure management modules.
+      - C(Fan) gathers the fans.
+      - C(Firmware) gathers the firmware inventory.
+      - C(HostNIC) gathers the host interfaces.
+      - C(License) gathers the licenses.
+      - C(Memory) gathers the memory devices.
+      - C(NIC) gathers the ethernet interfaces.
+      - C(PCIeSSDBackPlane) gathers the PCIe SSD backplanes.
+      - C(PowerSupply) gathers the power supplies.
+      - C(PresenceAndStatusSensor) gathers the presence and status sensors.
+      - C(Sensors_Battery) gathers the system board CMOS battery sensor.
+      - C(Sensors_Intrusion) gathers the chassis intrusion sensor.
+      - C(Sensors_Voltage) gathers the voltage sensors.
+      - C(VirtualDisk) gathers the virtual disks.
+      - C(PCIeDevice) gathers the PCIe devices.
+      - C(PhysicalDisk) gathers the physical disks.
+      - C(SystemMetrics) gathers the power supply, thermal and memory metrics.
+      - C(SecureBoot) gathers the secure boot databases and their certificates.
+    type: list
+    elements: str
+    choices: [IDRAC, System, BIOS, Controller, CPU, Enclosure, EnclosureEMM, Fan, Firmware, HostNIC, License, Memory, NIC,
+              PCIeSSDBackPlane, PowerSupply, PresenceAndStatusSensor, Sensors_Battery, Sensors_Intrusion, Sensors_Voltage,
+              VirtualDisk, PCIeDevice, PhysicalDisk, SystemMetrics, SecureBoot]
+    default: [System]
+  computer_system_id:
+    description:
+      - Id of the computer system, for example C(System.Embedded.1).
+      - The first computer system is used when I(computer_system_id) is not provided.
+    type: str
+  manager_id:
+    description:
+      - Id of the manager, for example C(iDRAC.Embedded.1).
+      - The first manager is used when I(manager_id) is not provided.
+    type: str
+  max_workers:
+    description:
+      - Maximum number of concurrent requests to iDRAC.
+      - C(1) sends the requests one after the other.
+    type: int
+    default: 8
+requirements:
+  - "python >= 3.9.6"
+author:
+  - "Rajshekar P(@rajshekarp87)"
+notes:
+  - Run this module from a system that has direct access to Dell iDRAC.
+  - This module supports both IPv4 and IPv6 address for I(idrac_ip).
+  - This module supports C(check_mode).
+  - The facts of a target which is not available on the iDRAC keep their empty default value.
+"""
+
+EXAMPLES = r"""
+---
+- name: Gather the system facts
+  dellemc.openmanage.idrac_gather_facts:
+    idrac_ip: "192.168.0.1"
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+
+- name: Gather the CPU, memory and firmware facts of a computer system
+  dellemc.openmanage.idrac_gather_facts:
+    idrac_ip: "192.168.0.1"
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+    computer_system_id: "System.Embedded.1"
+    target:
+      - CPU
+      - Memory
+      - Firmware
+"""
+
+RETURN = r'''
+---
+msg:
+  description: Status of gathering the facts.
+  returned: always
+  type: str
+  sample: "Successfully gathered the facts."
+facts:
+  description:
+    - Facts of the components, keyed by the facts of the C(dellemc.openmanage.idrac_gather_facts) role.
+    - The facts of the targets which are not gathered keep their empty default value.
+  returned: success
+  type: dict
+  sample: {
+    "backplane": [],
+    "bios": {},
+    "controller": [],
+    "cpu": [
+      {
+        "Id": "CPU.Socket.1",
+        "Manufacturer": "Intel",
+        "MaxSpeedMHz": 4000,
+        "Model": "Intel(R) Xeon(R) Bronze 3204 CPU @ 1.90GHz",
+        "Status": {"Health": "OK", "State": "Enabled"},
+        "TotalCores": 6
+      }
+    ],
+    "enclosure": [],
+    "enclosure_emm": [],
+    "fan": [],
+    "firmware": [],
+    "hostnic": [],
+    "idrac": {},
+    "intrusion_sensor": {},
+    "license": [],
+    "memory": [],
+    "memory_metrics": [],
+    "nic": [],
+    "pcie_device": {},
+    "physical_disk": [],
+    "power_metrics": [],
+    "power_supply": [],
+    "presence_and_status_sensor": [],
+    "secure_boot": {},
+    "sensor_battery": {},
+    "system": {},
+    "thermal_metrics": [],
+    "virtual_disk": [],
+    "voltages": []
+  }
+resources:
+  description: URIs of the computer system, manager and chassis the facts are gathered from.
+  returned: success
+  type: dict
+  sample: {
+    "api_system": "/redfish/v1/Systems/System.Embedded.1",
+    "api_manager": "/redfish/v1/Managers/iDRAC.Embedded.1",
+    "api_chassis": "/redfish/v1/Chassis/System.Embedded.1",
+    "computer_system_id": "System.Embedded.1"
+  }
+error_info:
+  description: Details of the HTTP Error.
+  returned: on HTTP error
+  type: dict
+  sample: {
+    "error": {
+      "code": "Base.1.0.GeneralError",
+      "message": "A general error has occurred. See ExtendedInfo for more information.",
+      "@Message.ExtendedInfo": [
+        {
+          "MessageId": "GEN1234",
+          "RelatedProperties": [],
+          "Message": "Unable to process the request because an error occurred.",
+          "MessageArgs": [],
+          "Severity": "Critical",
+          "Resolution": "Retry the operation. If the issue persists, contact your system administrator."
+        }
+      ]
+    }
+  }
+'''
+
+import copy
+import json
+import re
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (
+    run_concurrently, RedfishResourceLoader, DEFAULT_MAX_WORKERS, ODATA_ID)
+
+SYSTEMS_URI = "/redfish/v1/Systems"
+MANAGERS_URI = "/redfish/v1/Managers"
+CHASSIS_URI = "/redfish/v1/Chassis"
+OS_ATTRIBUTES_URI = "/redfish/v1/Managers/{0}/Attributes?$select=ServerOS.*"
+DELL_ATTRIBUTES_URI = "{0}/Oem/Dell/DellAttributes/{1}"
+BATTERY_URI = "{0}/Oem/Dell/DellSensors/iDRAC.Embedded.1_0x23_SystemBoardCMOSBattery"
+INTRUSION_URI = "{0}?$select=PhysicalSecurity/IntrusionSensor"
+ENCLOSURE_URI = "/redfish/v1/Chassis/Oem/Dell/DellEnclosures"
+ENCLOSURE_EMM_URI = "/redfish/v1/Chassis/Oem/Dell/DellEnclosureEMM"
+BACKPLANE_URI = "/redfish/v1/Chassis/Oem/Dell/DellPCIeSSDBackPlanes"
+FIRMWARE_URI = "/redfish/v1/UpdateService/FirmwareInventory"
+LICENSE_URI = "/redfish/v1/LicenseService/Licenses"
+EXPAND_URI = "{0}?$expand=*($levels={1})"
+
+SUCCESS_MSG = "Successfully gathered the facts."
+INVALID_SYSTEM_ID_MSG = "Invalid computer system id : {0}, valid values are {1}"
+INVALID_MANAGER_ID_MSG = "Invalid computer manager id : {0}, valid values are {1}"
+
+ODATA_KEYS = ["@odata.context", "@odata.id", "@odata.type"]
+ALL_ODATA_REGEX = r"^.*@odata.*$"
+
+DEFAULT_FACTS = {
+    "idrac": {}, "system": {}, "bios": {}, "controller": [], "cpu": [], "enclosure": [], "enclosure_emm": [],
+    "fan": [], "firmware": [], "hostnic": [], "license": [], "memory": [], "nic": [], "backplane": [],
+    "power_supply": [], "presence_and_status_sensor": [], "sensor_battery": {}, "intrusion_sensor": {},
+    "voltages": [], "virtual_disk": [], "pcie_device": {}, "physical_disk": [], "power_metrics": [],
+    "thermal_metrics": [], "memory_metrics": [], "secure_boot": {}
+}
+
+
+def remove_keys(data, keys=(), regex=None):
+    """
+    Returns a copy of the dict/list without the keys at any depth, the resources cached by the
+    loader are shared by several facts and are not modified.
+    :param keys: names of the keys to remove
+    :param regex: pattern of the keys to remove
+    """
+    if isinstance(data, dict):
+        return dict((key, remove_keys(val, keys, regex)) for key, val in data.items()
+                    if key not in keys and not (regex and re.match(regex, key)))
+    if isinstance(data, list):
+        return [remove_keys(item, keys, regex) for item in data]
+    return copy.deepcopy(data)
+
+
+def get_member_id(member):
+    return member[ODATA_ID].rstrip("/").split("/")[-1]
+
+
+class IdracFactsCollector(object):
+    """
+    Gathers the facts of the role targets. Every fact is read independently and concurrently,
+    the resources shared by several facts, such as the storage or memory collections, are
+    requested once through the loader, which also bounds the requests of all the facts to
+    max_workers at a time.
+    """
+
+    def __init__(self, idrac, module_params):
+        self.loader = RedfishResourceLoader(idrac, max_workers=module_params.get("max_workers") or DEFAULT_MAX_WORKERS,
+                                            expand_uri=EXPAND_URI)
+        self.max_workers = self.loader.max_workers
+        self.module_params = module_params
+        self.api_system = self.api_manager = self.api_chassis = self.system_id = None
+
+    def _select(self, members, resource_id, message):
+        if not resource_id:
+            return members[0][ODATA_ID] if members else ""
+        ids = [get_member_id(member) for member in members]
+        if resource_id not in ids:
+            raise ValueError(message.format(resource_id, ",".join(ids)))
+        return members[ids.index(resource_id)][ODATA_ID]
+
+    def resolve_resources(self):
+        systems, managers, chassis = self.loader.get_all([SYSTEMS_URI, MANAGERS_URI, CHASSIS_URI])
+        self.api_system = self._select(systems.get("Members", []), self.module_params.get("computer_system_id"),
+                                       INVALID_SYSTEM_ID_MSG)
+        self.api_manager = self._select(managers.get("Members", []), self.module_params.get("manager_id"),
+                                        INVALID_MANAGER_ID_MSG)
+        self.api_chassis = self._select(chassis.get("Members", []), None, None)
+        self.system_id = self.module_params.get("computer_system_id") or \
+            (self.api_system.rstrip("/").split("/")[-1] if self.api_system else "System.Embedded.1")
+        return {"api_system": self.api_system, "api_manager": self.api_manager, "api_chassis": self.api_chassis,
+                "computer_system_id": self.system_id}
+
+    def _members(self, uri):
+        return self.loader.get_members(uri)
+
+    def _storage(self):
+        return self._members(self.api_system + "/Storage")
+
+    def _metrics(self, members):
+        return self.loader.get_all([member["Metrics"] for member in members if member.get("Metrics")])
+
+    def get_idrac(self):
+        uris = [DELL_ATTRIBUTES_URI.format(self.api_manager, resource_id)
+                for resource_id in (self.system_id, "iDRAC.Embedded.1", "LifecycleController.Embedded.1")]
+        system, manager, lc = self.loader.get_all(uris)
+        return {"system_attributes": system.get("Attributes"), "manager_attributes": manager.get("Attributes"),
+                "lifecycle_controller_attributes": lc.get("Attributes")}
+
+    def get_system(self):
+        system, os_attributes = self.loader.get_all([self.api_system, OS_ATTRIBUTES_URI.format(self.system_id)])
+        system = dict(system.get("Oem", {}).get("Dell", {}).get("DellSystem", {}), **os_attributes.get("Attributes", {}))
+        return remove_keys(system, ODATA_KEYS)
+
+    def get_bios(self):
+        return remove_keys(self.loader.get(self.api_system + "/Bios"),
+                           ODATA_KEYS + ["SettingsObject", "Actions", "AttributeRegistry", "Description", "Id", "Links", "Name"])
+
+    def get_controller(self):
+        uris = [storage["Controllers"][ODATA_ID] for storage in self._storage() if storage.get("Controllers")]
+        controllers = run_concurrently(self._members, uris, max_workers=self.max_workers)
+        return remove_keys([controller for members in controllers for controller in members], regex=ALL_ODATA_REGEX)
+
+    def get_cpu(self):
+        return remove_keys(self._members(self.api_system + "/Processors"), ODATA_KEYS + ["Assembly", "Links"])
+
+    def get_enclosure(self):
+        return remove_keys(self.loader.get(ENCLOSURE_URI).get("Members", []), ODATA_KEYS + ["Links", "Description"])
+
+    def get_enclosure_emm(self):
+        return remove_keys(self.loader.get(ENCLOSURE_EMM_URI).get("Members", []), ODATA_KEYS + ["Links", "Description"])
+
+    def get_fan(self):
+        return remove_keys(self._members(self.api_chassis + "/ThermalSubsystem/Fans"), ODATA_KEYS)
+
+    def get_firmware(self):
+        return remove_keys(self._members(FIRMWARE_URI), ODATA_KEYS + [
+            "Classifications@odata.count", "IdentityInfoType@odata.count", "IdentityInfoValue@odata.count"])
+
+    def get_hostnic(self):
+        return remove_keys(self._members(self.api_manager + "/HostInterfaces"),
+                           ODATA_KEYS + ["HostEthernetInterfaces", "ManagerEthernetInterface"])
+
+    def get_license(self):
+        return remove_keys(self._members(LICENSE_URI), ODATA_KEYS)
+
+    def get_memory(self):
+        return remove_keys(self._members(self.api_system + "/Memory"), ODATA_KEYS + [
+            "AllowedSpeedsMHz@odata.count", "CPUAffinity@odata.count", "Processors@odata.count",
+            "MaxTDPMilliWatts@odata.count", "OperatingMemoryModes@odata.count"])
+
+    def get_nic(self):
+        return remove_keys(self._members(self.api_system + "/EthernetInterfaces"), ODATA_KEYS + [
+            "IPv4Addresses@odata.count", "IPv6AddressPolicyTable@odata.count", "IPv6Addresses@odata.count",
+            "IPv6StaticAddresses@odata.count", "NameServers@odata.count"])
+
+    def get_backplane(self):
+        return remove_keys(self.loader.get(BACKPLANE_URI).get("Members", []), ODATA_KEYS)
+
+    def get_power_supply(self):
+        return remove_keys(self._members(self.api_chassis + "/PowerSubsystem/PowerSupplies"), ODATA_KEYS + [
+            "ActiveInputVoltage@Redfish.Deprecated", "OperationalStatus@odata.count", "RedTypeOfSet@odata.count"])
+
+    def get_presence_and_status_sensor(self):
+        return remove_keys(self.loader.get(self.api_system + "/Oem/Dell/DellPresenceAndStatusSensors").get("Members", []),
+                           ODATA_KEYS + ["Assembly", "Links"])
+
+    def get_sensor_battery(self):
+        return remove_keys(self.loader.get(BATTERY_URI.format(self.api_system)), ODATA_KEYS)
+
+    def get_intrusion_sensor(self):
+        return remove_keys(self.loader.get(INTRUSION_URI.format(self.api_chassis)), ODATA_KEYS)
+
+    def get_voltages(self):
+        return remove_keys(self.loader.get(self.api_chassis + "/Power").get("Voltages", []), ODATA_KEYS)
+
+    def get_virtual_disk(self):
+        uris = ["{0}/Volumes".format(storage[ODATA_ID]) for storage in self._storage()]
+        volumes = run_concurrently(self._members, uris, max_workers=self.max_workers)
+        return remove_keys([volume for members in volumes for volume in members], ODATA_KEYS + [
+            "Actions", "EncryptionTypes@odata.count", "Identifiers@odata.count", "Links", "Operations@odata.count",
+            "DellVirtualDisk", "DellVirtualDisk@Redfish.Deprecated"])
+
+    def get_pcie_device(self):
+        return remove_keys(self._members(self.api_chassis + "/PCIeDevices"), ODATA_KEYS + ["Links", "@odata.etag"])
+
+    def get_physical_disk(self):
+        drives = self.loader.get_all([drive for storage in self._storage() for drive in storage.get("Drives", [])])
+        return remove_keys(drives, ODATA_KEYS + [
+            "Actions", "Assembly", "Links", "DellDriveSMARTAttributes", "DellNVMeSMARTAttributes", "Operations@odata.count"])
+
+    def get_power_metrics(self):
+        return remove_keys(self._metrics(self._members(self.api_chassis + "/PowerSubsystem/PowerSupplies")),
+                           ODATA_KEYS + ["DataSourceUri"])
+
+    def get_thermal_metrics(self):
+        return remove_keys(self.loader.get(self.api_chassis + "/ThermalSubsystem/ThermalMetrics"),
+                           ODATA_KEYS + ["DataSourceUri", "TemperatureReadingsCelsius@odata.count"])
+
+    def get_memory_metrics(self):
+        return remove_keys(self._metrics(self._members(self.api_system + "/Memory")), ODATA_KEYS + ["DataSourceUri"])
+
+    def get_secure_boot(self):
+        secure_boot = self.loader.get(self.api_system + "/SecureBoot")
+        databases = self._members(self.api_system + "/SecureBoot/SecureBootDatabases")
+        certificates = run_concurrently(self._members, [database["Certificates"][ODATA_ID] for database in databases],
+                                        max_workers=self.max_workers)
+        databases = [dict(database, Certificates=certs) for database, certs in zip(databases, certificates)]
+        return remove_keys(dict(secure_boot, SecureBootDatabases=databases), regex=ALL_ODATA_REGEX)
+
+    def _get_fact(self, name):
+        try:
+            return name, getattr(self, "get_" + name)()
+        except (HTTPError, KeyError, AttributeError, TypeError):
+            return name, None
+
+    def collect(self, targets):
+        """Returns all the facts, the facts which are not gathered or not available keep their default value."""
+        names = [name for target in targets for name in TARGET_FACTS[target]]
+        facts = copy.deepcopy(DEFAULT_FACTS)
+        for name, value in run_concurrently(self._get_fact, list(dict.fromkeys(names)), max_workers=self.max_workers):
+            if value is not None:
+                facts[name] = value
+        return facts
+
+
+TARGET_FACTS = {
+    "IDRAC": ["idrac"],
+    "System": ["system"],
+    "BIOS": ["bios"],
+    "Controller": ["controller"],
+    "CPU": ["cpu"],
+    "Enclosure": ["enclosure"],
+    "EnclosureEMM": ["enclosure_emm"],
+    "Fan": ["fan"],
+    "Firmware": ["firmware"],
+    "HostNIC": ["hostnic"],
+    "License": ["license"],
+    "Memory": ["memory"],
+    "NIC": ["nic"],
+    "PCIeSSDBackPlane": ["backplane"],
+    "PowerSupply": ["power_supply"],
+    "PresenceAndStatusSensor": ["presence_and_status_sensor"],
+    "Sensors_Battery": ["sensor_battery"],
+    "Sensors_Intrusion": ["intrusion_sensor"],
+    "Sensors_Voltage": ["voltages"],
+    "VirtualDisk": ["virtual_disk"],
+    "PCIeDevice": ["pcie_device"],
+    "PhysicalDisk": ["physical_disk"],
+    "SystemMetrics": ["power_metrics", "thermal_metrics", "memory_metrics"],
+    "SecureBoot": ["secure_boot"],
+}
+
+
+def main():
+    specs = {
+        "target": {"type": "list", "elements": "str", "choices": list(TARGET_FACTS), "default": ["System"]},
+        "computer_system_id": {"type": "str"},
+        "manager_id": {"type": "str"},
+        "max_workers": {"type": "int", "default": DEFAULT_MAX_WORKERS},
+    }
+    module = IdracAnsibleModule(argument_spec=specs, supports_check_mode=True)
+    try:
+        with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+            collector = IdracFactsCollector(idrac, module.params)
+            resources = collector.resolve_resources()
+            facts = collector.collect(module.params["target"])
+        module.exit_json(msg=SUCCESS_MSG, facts=facts, resources=resources)
+    except HTTPError as err:
+        module.exit_json(msg=str(err), error_info=json.load(err), failed=True)
+    except URLError as err:
+        module.exit_json(msg=str(err), unreachable=True)
+    except (RuntimeError, SSLValidationError, ConnectionError, KeyError,
+            ImportError, ValueError, TypeError) as e:
+        module.exit_json(msg=str(e), failed=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -395,7 +395,7 @@ from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.compat.version import LooseVersion
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (
     get_idrac_firmware_version, get_dynamic_uri, get_manager_res_id,
-    validate_and_get_first_resource_id_uri, remove_key, idrac_redfish_job_tracking)
+    validate_and_get_first_resource_id_uri, remove_key, idrac_redfish_job_tracking, write_file_atomically)
 
 REDFISH = "/redfish/v1"
 MANAGERS_URI = "/redfish/v1/Managers"
@@ -638,10 +638,9 @@ class ExportLicense(License):
             license_file_name = f"{self.module.params['license_id']}_iDRAC_license.xml"
         license_status = self.idrac.invoke_request(export_license_url, "POST", data=payload)
         license_data = license_status.json_data
-        license_file = base64.b64decode(license_data.get("LicenseFile")).decode('utf-8')
+        license_file = base64.b64decode(license_data.get("LicenseFile"))
         file_name = os.path.join(path, license_file_name)
-        with open(file_name, "w") as fp:
-            fp.write(license_file)
+        write_file_atomically(file_name, [license_file])
         return license_status
 
     def __export_license_http(self, export_license_url):
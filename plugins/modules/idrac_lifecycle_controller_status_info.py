@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.1.0
-# Copyright (C) 2018-2022 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2018-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -22,6 +22,31 @@ description:
     - This module shows the status of the Lifecycle Controller on a Dell PowerEdge server.
 extends_documentation_fragment:
     - dellemc.openmanage.idrac_auth_options
+    - dellemc.openmanage.idrac_hosts_options
+options:
+  idrac_ip:
+    required: false
+    type: str
+    description:
+      - iDRAC IP Address.
+      - I(idrac_ip) is required when I(hosts) is not provided.
+  idrac_user:
+    required: false
+    type: str
+    description:
+      - iDRAC username.
+      - If the username is not provided, then the environment variable E(IDRAC_USERNAME) is used.
+      - "Example: export IDRAC_USERNAME=username"
+      - I(idrac_user) is required when I(idrac_ip) is provided, or when a host of I(hosts) does not provide its own.
+  idrac_password:
+    required: false
+    type: str
+    description:
+      - iDRAC user password.
+      - If the password is not provided, then the environment variable E(IDRAC_PASSWORD) is used.
+      - "Example: export IDRAC_PASSWORD=password"
+      - I(idrac_password) is required when I(idrac_ip) is provided, or when a host of I(hosts) does not provide its own.
+    aliases: ['idrac_pwd']
 
 requirements:
     - "omsdk >= 1.2.488"
@@ -33,6 +58,8 @@ notes:
     - Run this module from a system that has direct access to Dell iDRAC.
     - This module supports both IPv4 and IPv6 address for I(idrac_ip).
     - This module supports C(check_mode).
+    - When I(hosts) is provided, the status is read with the Redfish C(GetRemoteServicesAPIStatus) action of the
+      Lifecycle Controller instead of OMSDK.
 """
 
 EXAMPLES = """
@@ -43,6 +70,15 @@ EXAMPLES = """
     idrac_user: "user_name"
     idrac_password: "user_password"
     ca_path: "/path/to/ca_cert.pem"
+
+- name: Show status of the Lifecycle Controller of several iDRACs in one task
+  dellemc.openmanage.idrac_lifecycle_controller_status_info:
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+    hosts:
+      - idrac_ip: "192.168.0.1"
+      - idrac_ip: "192.168.0.2"
 """
 
 RETURN = r'''
@@ -62,6 +98,22 @@ lc_status_info:
         "LCStatus": "Ready"
       }
   }
+hosts:
+  type: list
+  elements: dict
+  description:
+    - Results of each iDRAC of I(hosts), with the I(lc_status_info) of the iDRAC, or I(msg) and I(error_info) when it could not be queried.
+  returned: when I(hosts) is provided
+  sample: [
+    {
+      "idrac_ip": "192.168.0.1",
+      "failed": false,
+      "lc_status_info": {
+        "LCReady": true,
+        "LCStatus": "Ready"
+      }
+    }
+  ]
 error_info:
   description: Details of the HTTP Error.
   returned: on HTTP error
@@ -86,18 +138,37 @@ error_info:
 
 
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import idrac_hosts_params, \
+    idrac_hosts_mutually_exclusive, idrac_hosts_required_one_of, idrac_hosts_required_by, exit_idrac_hosts
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.basic import AnsibleModule
 import json
 
+LC_STATUS_URI = "/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.GetRemoteServicesAPIStatus"
+
+
+def get_lc_status(idrac, module_params):
+    resp = idrac.invoke_request(LC_STATUS_URI, "POST", data="{}", dump=False)
+    lcstatus = resp.json_data.get("LCStatus")
+    return {"lc_status_info": {"LCReady": lcstatus == "Ready", "LCStatus": lcstatus}}
+
 
 def main():
     specs = {}
     specs.update(idrac_auth_params)
+    specs.update(idrac_hosts_params)
+    specs["idrac_ip"] = {"required": False, "type": 'str'}
+    specs["idrac_user"] = dict(idrac_auth_params["idrac_user"], required=False)
+    specs["idrac_password"] = dict(idrac_auth_params["idrac_password"], required=False)
     module = AnsibleModule(
         argument_spec=specs,
+        mutually_exclusive=idrac_hosts_mutually_exclusive,
+        required_one_of=idrac_hosts_required_one_of,
+        required_by=idrac_hosts_required_by,
         supports_check_mode=True)
+    if module.params.get("hosts"):
+        exit_idrac_hosts(module, get_lc_status)
 
     try:
         with iDRACConnection(module.params) as idrac:
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2023-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -318,6 +318,7 @@ error_info:
 
 import json
 import time
+from functools import partial
 from urllib.error import HTTPError, URLError
 from ansible.module_utils.compat.version import LooseVersion
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -325,7 +326,7 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish i
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (
     delete_job, get_current_time, get_dynamic_uri, get_idrac_firmware_version,
     get_scheduled_job_resp, remove_key, validate_and_get_first_resource_id_uri,
-    idrac_redfish_job_tracking, xml_data_conversion)
+    idrac_redfish_job_tracking, xml_data_conversion, run_concurrently)
 
 REGISTRY_URI = '/redfish/v1/Registries'
 SYSTEMS_URI = "/redfish/v1/Systems"
@@ -460,21 +461,35 @@ class IDRACNetworkAttributes:
                     reg.update({each_attr['Name']: each_attr['Value']})
         return reg
 
+    def __get_oem_network_attributes(self):
+        firm_ver = get_idrac_firmware_version(self.idrac)
+        if LooseVersion(firm_ver) >= '6.0':
+            return get_dynamic_uri(self.idrac, self.oem_uri, 'Attributes')
+        if self.oem_uri:
+            # Current values in one request instead of the registry or an SCP export job.
+            try:
+                return get_dynamic_uri(self.idrac, self.oem_uri, 'Attributes')
+            except HTTPError:
+                pass
+        if '3.0' < LooseVersion(firm_ver) < '6.0':
+            return self.__get_registry_fw_less_than_6_more_than_3()
+        return self.__get_registry_fw_less_than_3()
+
     def get_current_server_registry(self):
         reg = {}
         oem_network_attributes = self.module.params.get(
             'oem_network_attributes')
         network_attributes = self.module.params.get('network_attributes')
-        firm_ver = get_idrac_firmware_version(self.idrac)
+        requests = []
         if oem_network_attributes:
-            if LooseVersion(firm_ver) >= '6.0':
-                reg = get_dynamic_uri(self.idrac, self.oem_uri, 'Attributes')
-            elif '3.0' < LooseVersion(firm_ver) < '6.0':
-                reg = self.__get_registry_fw_less_than_6_more_than_3()
-            else:
-                reg = self.__get_registry_fw_less_than_3()
+            requests.append(self.__get_oem_network_attributes)
         if network_attributes:  # For Redfish
-            resp = get_dynamic_uri(self.idrac, self.redfish_uri)
+            requests.append(partial(get_dynamic_uri, self.idrac, self.redfish_uri))
+        responses = run_concurrently(lambda request: request(), requests)
+        if oem_network_attributes:
+            reg = responses.pop(0)
+        if network_attributes:
+            resp = responses.pop(0)
             reg.update({'Ethernet': resp.get('Ethernet', {})})
             reg.update({'FibreChannel': resp.get('FibreChannel', {})})
             reg.update({'iSCSIBoot': resp.get('iSCSIBoot', {})})
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.4.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -573,7 +573,7 @@ import xml.etree.ElementTree as ET
 from ansible.module_utils.compat.version import LooseVersion
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import idrac_redfish_job_tracking, \
-    strip_substr_dict, get_idrac_firmware_version, get_dynamic_uri
+    strip_substr_dict, get_idrac_firmware_version, get_dynamic_uri, write_file_atomically
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.parse import urlparse
@@ -796,12 +796,11 @@ def export_scp_redfish(module, idrac):
 def wait_for_response(scp_resp, module, share, idrac):
     task_uri = scp_resp.headers["Location"]
     wait_resp = idrac.wait_for_job_complete(task_uri, job_wait=True)
-    with open("{0}/{1}".format(share["share_name"], share["file_name"]), "w") as file_obj:
-        if module.params["export_format"] == "JSON":
-            json.dump(wait_resp.json_data, file_obj, indent=4)
-        else:
-            wait_resp_value = wait_resp.decode("utf-8")
-            file_obj.write(wait_resp_value)
+    if module.params["export_format"] == "JSON":
+        content = json.dumps(wait_resp.json_data, indent=4).encode("utf-8")
+    else:
+        content = wait_resp
+    write_file_atomically("{0}/{1}".format(share["share_name"], share["file_name"]), [content])
     return scp_resp
 
 
@@ -902,7 +901,7 @@ def idrac_custom_option(idrac):
         url = resp.get("Dell", {}).get('CustomDefaultsDownloadURI', {})
     try:
         if url:
-            result = idrac.invoke_request(url, "GET")
+            result = idrac.invoke_request(url, "GET", stream=True)
         return result
     except HTTPError as err:
         if err.code in ERR_STATUS_CODE:
@@ -1045,13 +1044,9 @@ def export_custom_defaults(module, idrac):
     idrac_resp_cds = idrac_custom_option(idrac)
     if idrac_resp_cds is None:
         module.exit_json(msg=CUSTOM_DEFAULTS_NOT_FOUND, changed=False)
-    idrac_resp_cds = idrac_resp_cds.body
     res = {}
     if share["share_type"] == "LOCAL":
-        if isinstance(idrac_resp_cds, bytes):
-            idrac_resp_cds = idrac_resp_cds.decode('utf-8')
-        with open("{0}/{1}".format(share["share_name"], share["file_name"]), "w") as file_obj:
-            file_obj.write(idrac_resp_cds)
+        idrac_resp_cds.download_to("{0}/{1}".format(share["share_name"], share["file_name"]))
     res = get_file(module.params, res, _scp_file_name_format)
     return res
 
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -290,7 +290,8 @@ from copy import deepcopy
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (
-    get_dynamic_uri, validate_and_get_first_resource_id_uri, xml_data_conversion, idrac_redfish_job_tracking, remove_key, get_idrac_firmware_version)
+    get_dynamic_uri, validate_and_get_first_resource_id_uri, xml_data_conversion, idrac_redfish_job_tracking, remove_key, get_idrac_firmware_version,
+    RedfishResourceLoader)
 
 
 SYSTEMS_URI = "/redfish/v1/Systems"
@@ -477,38 +478,39 @@ class StorageData:
         storage_controllers = get_dynamic_uri(self.idrac, uri, 'Storage')
         return storage_controllers
 
-    def fetch_api_data(self, uri, key_index_from_end):
-        key = uri.split("/")[key_index_from_end]
-        uri_data = self.idrac.invoke_request(uri, "GET")
-        return key, uri_data
+    @staticmethod
+    def resource_key(uri):
+        return uri.split("/")[-1]
 
     def all_storage_data(self):
         storage_info = {"Controllers": {}}
         controllers_details_uri = self.fetch_controllers_uri()[ODATA_ID] + "?$expand=*($levels=1)"
         controllers_list = get_dynamic_uri(self.idrac, controllers_details_uri)
-        for each_controller in controllers_list["Members"]:
+        controllers = [each_controller for each_controller in controllers_list["Members"]
+                       if not each_controller.get("Id").startswith("CPU")]
+        # Drives, volumes and enclosures are fetched once each and concurrently across the controllers
+        loader = RedfishResourceLoader(self.idrac)
+        volumes = loader.get_all_members([controller["Volumes"][ODATA_ID] for controller in controllers])
+        loader.get_all([ref for each_controller in controllers
+                        for ref in each_controller["Drives"] + each_controller["Links"]["Enclosures"]])
+        for each_controller, volume_list in zip(controllers, volumes):
             controller_id = each_controller.get("Id")
-            if controller_id.startswith("CPU"):
-                continue
             storage_info["Controllers"][controller_id] = deepcopy(each_controller)
             storage_info["Controllers"][controller_id]["Drives"] = {}
             storage_info["Controllers"][controller_id]["Volumes"] = {}
             storage_info["Controllers"][controller_id]["Links"]["Enclosures"] = {}
             # To fetch drives data
             for each_drive_uri in each_controller["Drives"]:
-                key, uri_data = self.fetch_api_data(each_drive_uri[ODATA_ID], -1)
-                storage_info["Controllers"][controller_id]["Drives"][key] = uri_data.json_data
+                key = self.resource_key(each_drive_uri[ODATA_ID])
+                storage_info["Controllers"][controller_id]["Drives"][key] = loader.get(each_drive_uri[ODATA_ID])
 
             # To fetch volumes data
-            volume_uri = each_controller['Volumes'][ODATA_ID]
-            volumes_list = get_dynamic_uri(self.idrac, volume_uri, "Members")
-            for each_volume_uri in volumes_list:
-                key, uri_data = self.fetch_api_data(each_volume_uri[ODATA_ID], -1)
-                storage_info["Controllers"][controller_id]["Volumes"][key] = uri_data.json_data
+            for each_volume in volume_list:
+                storage_info["Controllers"][controller_id]["Volumes"][self.resource_key(each_volume[ODATA_ID])] = each_volume
             # To fetch enclosures
             for each_enclosure_uri in each_controller["Links"]["Enclosures"]:
-                key, uri_data = self.fetch_api_data(each_enclosure_uri[ODATA_ID], -1)
-                storage_info["Controllers"][controller_id]["Links"]["Enclosures"][key] = uri_data.json_data
+                key = self.resource_key(each_enclosure_uri[ODATA_ID])
+                storage_info["Controllers"][controller_id]["Links"]["Enclosures"][key] = loader.get(each_enclosure_uri[ODATA_ID])
         return storage_info
 
     def fetch_storage_data(self):
@@ -531,7 +533,7 @@ class StorageData:
         if controller_data["Volumes"]:
             storage_info.setdefault("Controller", {}).setdefault(controller_id, {})["VirtualDisk"] = {}
             for volume_id, volume_data in controller_data["Volumes"].items():
-                physical_disk = [self.fetch_api_data(drive[ODATA_ID], -1)[0] for drive in volume_data["Links"]["Drives"]]
+                physical_disk = [self.resource_key(drive[ODATA_ID]) for drive in volume_data["Links"]["Drives"]]
                 storage_info["Controller"][controller_id]["VirtualDisk"][volume_id] = {"PhysicalDisk": physical_disk}
 
     def fetch_enclosures_and_physical_disk(self, controller_id, controller_data, storage_info):
@@ -542,7 +544,7 @@ class StorageData:
             storage_info["Controller"][controller_id].setdefault("Enclosure", {})
             for enclosure_id in enclosures:
                 storage_info["Controller"][controller_id]["Enclosure"][enclosure_id] = {"EnclosureSensor": {enclosure_id: {}}}
-                physical_disk = [self.fetch_api_data(drive[ODATA_ID], -1)[0] for drive in
+                physical_disk = [self.resource_key(drive[ODATA_ID]) for drive in
                                  controller_data["Links"]["Enclosures"][enclosure_id]["Links"]["Drives"]]
                 if physical_disk:
                     storage_info["Controller"][controller_id]["Enclosure"][enclosure_id]["PhysicalDisk"] = physical_disk
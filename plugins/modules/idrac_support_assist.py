@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.6.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -685,10 +685,9 @@ class RunSupportAssist(SupportAssist):
             file_name = (os.path.join(file_path, sa_file_name))
             file_dict = self.idrac.invoke_request(job_tracking_uri, "GET")
             file_dnld = self.idrac.invoke_request(file_dict.headers.get(
-                "Location"), "GET", headers={"Content-Type": "application/x-tar"})
+                "Location"), "GET", headers={"Content-Type": "application/x-tar"}, stream=True)
             if file_dnld.status_code == 200:
-                with open(file_name, "wb") as file:
-                    file.write(file_dnld.body)
+                file_dnld.download_to(file_name)
 
     def expand_ipv6(self, ip):
         sections = ip.split(':')
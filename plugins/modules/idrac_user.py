@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2018-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2018-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -210,6 +210,7 @@ from ssl import SSLError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import RedfishResourceLoader
 
 ACCOUNT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/"
 ATTRIBUTE_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Attributes/"
@@ -218,6 +219,7 @@ ACCESS = {0: "Disabled", 1: "Enabled"}
 INVALID_PRIVILAGE_MSG = "custom_privilege value should be from 0 to 511."
 INVALID_PRIVILAGE_MIN = 0
 INVALID_PRIVILAGE_MAX = 511
+USER_SLOTS = tuple(range(2, 17))
 
 
 def compare_payload(json_payload, idrac_attr):
@@ -242,20 +244,49 @@ def compare_payload(json_payload, idrac_attr):
     return is_change_required
 
 
-def get_user_account(module, idrac):
+def get_account_index(idrac):
     """
-    This function gets the slot id and slot uri for create and modify.
+    This function indexes the user slots from the iDRAC accounts collection.
+    :param idrac: idrac object
+    :return: dict of user name to slot id, sorted list of empty slot ids
+    """
+    user_index, empty_slots = {}, []
+    for account in RedfishResourceLoader(idrac).get_members(ACCOUNT_URI.rstrip("/")):
+        slot_id = str(account.get("Id", ""))
+        if not slot_id.isdigit() or int(slot_id) not in USER_SLOTS:
+            continue
+        if account.get("UserName"):
+            user_index[account["UserName"]] = int(slot_id)
+        else:
+            empty_slots.append(int(slot_id))
+    return user_index, sorted(empty_slots)
+
+
+def get_slot_attributes(idrac, slot_id):
+    """
+    This function gets the user attributes of a slot from the iDRAC attributes.
+    :param idrac: idrac object
+    :param slot_id: slot id of the user
+    :return: user attributes in the same format as the SCP export, for example Users.2#UserName
+    """
+    attributes = idrac.invoke_request(ATTRIBUTE_URI, "GET").json_data.get("Attributes", {})
+    prefix = "Users.{0}.".format(slot_id)
+    return dict((re.sub(r"(?<=\d)\.", "#", key), str(val)) for key, val in attributes.items()
+                if key.startswith(prefix) and val is not None)
+
+
+def get_user_account_from_scp(module, idrac):
+    """
+    This function gets the slot id and slot uri from the SCP export, used when the
+    iDRAC does not provide the accounts collection.
     :param module: ansible module arguments
     :param idrac: idrac objects
     :return: user_attr, slot_uri, slot_id, empty_slot, empty_slot_uri
     """
     slot_uri, slot_id, empty_slot, empty_slot_uri = None, None, None, None
-    if not module.params["user_name"]:
-        module.fail_json(msg="User name is not valid.")
     response = idrac.export_scp(export_format="JSON", export_use="Default", target="IDRAC", job_wait=True)
     user_attributes = idrac.get_idrac_local_account_attr(response.json_data, fqdd="iDRAC.Embedded.1")
-    slot_num = tuple(range(2, 17))
-    for num in slot_num:
+    for num in USER_SLOTS:
         user_name = "Users.{0}#UserName".format(num)
         if user_attributes.get(user_name) == module.params["user_name"]:
             slot_id = num
@@ -267,6 +298,35 @@ def get_user_account(module, idrac):
     return user_attributes, slot_uri, slot_id, empty_slot, empty_slot_uri
 
 
+def get_user_account(module, idrac):
+    """
+    This function gets the slot id and slot uri for create and modify.
+    The slots are looked up from the accounts collection and the SCP export is used
+    only when the collection is not available.
+    :param module: ansible module arguments
+    :param idrac: idrac objects
+    :return: user_attr, slot_uri, slot_id, empty_slot, empty_slot_uri
+    """
+    if not module.params["user_name"]:
+        module.fail_json(msg="User name is not valid.")
+    user_attributes, slot_uri, empty_slot, empty_slot_uri = {}, None, None, None
+    try:
+        user_index, empty_slots = get_account_index(idrac)
+        slot_id = user_index.get(module.params["user_name"])
+        if slot_id is not None and module.params["state"] == "present":
+            user_attributes = get_slot_attributes(idrac, slot_id)
+    except HTTPError:
+        user_index, empty_slots = {}, []
+    if not (user_index or empty_slots):
+        return get_user_account_from_scp(module, idrac)
+    if slot_id is not None:
+        slot_uri = ACCOUNT_URI + str(slot_id)
+    elif empty_slots:
+        empty_slot = empty_slots[0]
+        empty_slot_uri = ACCOUNT_URI + str(empty_slot)
+    return user_attributes, slot_uri, slot_id, empty_slot, empty_slot_uri
+
+
 def get_payload(module, slot_id, action=None):
     """
     This function creates the payload with slot id.
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2022-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -23,7 +23,14 @@ description:
    iDRAC"
 extends_documentation_fragment:
   - dellemc.openmanage.idrac_x_auth_options
+  - dellemc.openmanage.idrac_hosts_options
 options:
+  idrac_ip:
+    required: false
+    type: str
+    description:
+      - iDRAC IP Address.
+      - I(idrac_ip) is required when I(hosts) is not provided.
   user_id:
     description:
       - Sequential user id numbers that supports from 1 to 16.
@@ -66,6 +73,15 @@ EXAMPLES = """
     idrac_password: idrac_password
     ca_path: "/path/to/ca_cert.pem"
     username: user_name
+
+- name: Retrieve basic details of all user accounts of several iDRACs in one task.
+  dellemc.openmanage.idrac_user_info:
+    idrac_user: idrac_user
+    idrac_password: idrac_password
+    ca_path: "/path/to/ca_cert.pem"
+    hosts:
+      - idrac_ip: 198.162.0.1
+      - idrac_ip: 198.162.0.2
 """
 
 RETURN = r'''
@@ -89,6 +105,28 @@ user_info:
     "RoleId": "None",
     "UserName": ""
   }]
+hosts:
+  type: list
+  elements: dict
+  description:
+    - Results of each iDRAC of I(hosts), with the I(user_info) of the iDRAC, or I(msg) and I(error_info) when it could not be queried.
+  returned: when I(hosts) is provided
+  sample: [
+    {
+      "idrac_ip": "198.162.0.1",
+      "failed": false,
+      "user_info": [{
+        "Description": "User Account",
+        "Enabled": true,
+        "Id": "2",
+        "Locked": false,
+        "Name": "User Account",
+        "Password": null,
+        "RoleId": "Administrator",
+        "UserName": "root"
+      }]
+    }
+  ]
 error_info:
   description: Details of the HTTP Error.
   returned: on HTTP error
@@ -116,7 +154,8 @@ import json
 from ssl import SSLError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
-from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule, \
+    idrac_hosts_params, exit_idrac_hosts
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
 
 
@@ -187,11 +226,27 @@ def get_all_accounts(idrac, account_uri):
     return idrac_list
 
 
+def get_host_user_info(idrac, module_params):
+    """Returns the user information of an iDRAC of I(hosts), an invalid user is reported as the error of the host."""
+    accounts_uri = get_accounts_uri(idrac)
+    user_id = module_params.get("user_id")
+    user_name = module_params.get("username")
+    user_info = get_all_accounts(idrac, accounts_uri)
+    if user_id is not None:
+        user_info = [acc for acc in user_info if acc.get("Id") == str(user_id)]
+    elif user_name is not None:
+        user_info = [acc for acc in user_info if acc.get("UserName") == user_name]
+    if not user_info:
+        raise ValueError(INVALID_USERID if user_id is not None else INVALID_USERNAME if user_name is not None else UNSUCCESS_MSG)
+    return {"user_info": user_info}
+
+
 def main():
     specs = {
         "user_id": {"type": 'int'},
         "username": {"type": 'str'}
     }
+    specs.update(idrac_hosts_params)
 
     module = IdracAnsibleModule(
         argument_spec=specs,
@@ -200,6 +255,8 @@ def main():
         ],
         supports_check_mode=True
     )
+    if module.params.get("hosts"):
+        exit_idrac_hosts(module, get_host_user_info, req_session=True)
     try:
         with iDRACRedfishAPI(module.params, req_session=True) as idrac:
             resp = []
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2023-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -480,6 +480,7 @@ import os
 import json
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination, strip_substr_dict
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import get_ome_cached
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.common.dict_transformations import recursive_diff
@@ -618,8 +619,9 @@ def get_target_payload(module, rest_obj):
 
 
 def get_category_data_tree(rest_obj):
-    resp = rest_obj.invoke_request("GET", CATEGORY_URI)
-    cat_raw = resp.json_data.get("value", [])
+    cat_raw = get_ome_cached(
+        rest_obj, CATEGORY_URI,
+        lambda: get_all_data_with_pagination(rest_obj, CATEGORY_URI, strip_odata=True).get("report_list")) or []
     cat_dict = dict(
         (category.get("Name"),
             dict((y.get("Name"),
@@ -633,8 +635,9 @@ def get_category_data_tree(rest_obj):
 
 
 def get_all_actions(rest_obj):
-    resp = rest_obj.invoke_request("GET", ACTIONS_URI)
-    actions = resp.json_data.get("value", [])
+    actions = get_ome_cached(
+        rest_obj, ACTIONS_URI,
+        lambda: get_all_data_with_pagination(rest_obj, ACTIONS_URI, strip_odata=True).get("report_list")) or []
     cmp_actions = dict((x.get("Name"), {"Id": x.get("Id"),
                                         "Disabled": x.get("Disabled"),
                                         "Parameters": dict((y.get("Name"), y.get("Value")) for y in x.get("ParameterDetails")),
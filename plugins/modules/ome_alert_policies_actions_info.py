@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2023-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -254,10 +254,10 @@ msg:
 
 import json
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import remove_key
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import get_ome_cached
 
 ACTIONS_URI = "AlertService/AlertActionTemplates"
 SUCCESSFUL_MSG = "Successfully retrieved alert policies actions information."
@@ -272,10 +272,11 @@ def main():
         supports_check_mode=True)
     try:
         with RestOME(module.params, req_session=True) as rest_obj:
-            actions_info = get_all_data_with_pagination(rest_obj, ACTIONS_URI)
-            if not actions_info.get("report_list", []):
+            actions = get_ome_cached(
+                rest_obj, ACTIONS_URI,
+                lambda: get_all_data_with_pagination(rest_obj, ACTIONS_URI, strip_odata=True).get("report_list", []))
+            if not actions:
                 module.exit_json(msg=EMPTY_ALERT_POLICY_ACTION_MSG, actions=[])
-            actions = remove_key(actions_info['report_list'])
             module.exit_json(msg=SUCCESSFUL_MSG, actions=actions)
     except HTTPError as err:
         module.exit_json(msg=str(err), error_info=json.load(err), failed=True)
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2023-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -281,16 +281,17 @@ import json
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import remove_key
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import get_ome_cached
 
 ALERT_CATEGORY_URI = "AlertService/AlertCategories"
 SUCCESS_MSG = "Successfully retrieved alert policies category information."
 
 
 def get_formatted_categories(rest_obj):
-    report = get_all_data_with_pagination(rest_obj, ALERT_CATEGORY_URI)
-    categories = remove_key(report.get("report_list", []))
+    categories = get_ome_cached(
+        rest_obj, ALERT_CATEGORY_URI,
+        lambda: get_all_data_with_pagination(rest_obj, ALERT_CATEGORY_URI, strip_odata=True).get("report_list", []))
     return categories
 
 
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2023-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -106,7 +106,8 @@ error_info:
 import json
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import remove_key, get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import get_ome_cached
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -123,10 +124,11 @@ def main():
     )
     try:
         with RestOME(module.params, req_session=True) as rest_obj:
-            message_id_info = get_all_data_with_pagination(rest_obj, ALERT_MESSAGE_URI)
-            if not message_id_info.get("report_list", []):
+            message_ids = get_ome_cached(
+                rest_obj, ALERT_MESSAGE_URI,
+                lambda: get_all_data_with_pagination(rest_obj, ALERT_MESSAGE_URI, strip_odata=True).get("report_list", []))
+            if not message_ids:
                 module.exit_json(msg=EMPTY_MSG, message_ids=[])
-            message_ids = remove_key(message_id_info['report_list'])
             module.exit_json(msg=SUCCESSFUL_MSG, message_ids=message_ids)
     except HTTPError as err:
         module.exit_json(msg=str(err), error_info=json.load(err), failed=True)
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -41,6 +41,14 @@ options:
       - The device service tag of the target device associated with the I(baseline).
       - I(device_service_tag) is mutually exclusive with I(device_id).
     type: str
+  non_compliant_only:
+    description:
+      - Reports only the devices with the C(NONCOMPLIANT) status, the compliance details of the other devices
+        are not retrieved.
+      - I(non_compliant_only) is not applicable with I(device_id).
+    type: bool
+    default: false
+    version_added: 9.10.0
 requirements:
   - "python >= 3.9.6"
 author:
@@ -49,6 +57,8 @@ author:
 notes:
   - Run this module from a system that has direct access to Dell OpenManage Enterprise.
   - This module supports C(check_mode).
+  - The compliance details of the devices are retrieved in parallel, a request which fails with a connection error
+    or a server error is retried.
 '''
 
 EXAMPLES = r'''
@@ -78,6 +88,15 @@ EXAMPLES = r'''
     ca_path: "/path/to/ca_cert.pem"
     baseline: baseline_name
     device_service_tag: 2HFGH3
+
+- name: Retrieve the compliance report of the non-compliant devices in the specified configuration compliance baseline.
+  dellemc.openmanage.ome_configuration_compliance_info:
+    hostname: "192.168.0.1"
+    username: "username"
+    password: "password"
+    ca_path: "/path/to/ca_cert.pem"
+    baseline: baseline_name
+    non_compliant_only: true
 '''
 
 RETURN = r'''
@@ -147,14 +166,20 @@ error_info:
 '''
 
 import json
+import time
+from functools import partial
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import run_concurrently, DEFAULT_MAX_WORKERS
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
 BASELINE_URI = "TemplateService/Baselines"
 CONFIG_COMPLIANCE_URI = "TemplateService/Baselines({0})/DeviceConfigComplianceReports"
 COMPLIANCE_URI = "TemplateService/Baselines({0})/DeviceConfigComplianceReports({1})/DeviceComplianceDetails"
+NON_COMPLIANT = "NONCOMPLIANT"
+REQUEST_RETRIES = 3
+RETRY_INTERVAL = 2
 
 
 def validate_device(module, report, device_id=None, service_tag=None, base_id=None):
@@ -185,6 +210,29 @@ def get_baseline_id(module, baseline_name, rest_obj):
     return base_id, template_id
 
 
+def get_compliance_details(rest_obj, baseline_id, device_id, retries=REQUEST_RETRIES, interval=RETRY_INTERVAL):
+    """
+    Returns the compliance attribute groups of a device, the request is retried on a connection error or a server
+    error with an increasing interval.
+    """
+    compliance_uri = COMPLIANCE_URI.format(baseline_id, device_id)
+    for attempt in range(retries + 1):
+        try:
+            return rest_obj.invoke_request("GET", compliance_uri).json_data.get("ComplianceAttributeGroups")
+        except (HTTPError, URLError, ConnectionError, SSLError) as err:
+            if attempt == retries or (isinstance(err, HTTPError) and err.code < 500):
+                raise
+            time.sleep(interval * (attempt + 1))
+
+
+def add_compliance_details(rest_obj, baseline_id, devices, max_workers=DEFAULT_MAX_WORKERS):
+    """Adds the compliance attribute groups to each device, the details are retrieved in parallel."""
+    attr_groups = run_concurrently(partial(get_compliance_details, rest_obj, baseline_id),
+                                   [each["Id"] for each in devices], max_workers)
+    for each, attr_group in zip(devices, attr_groups):
+        each["ComplianceAttributeGroups"] = attr_group
+
+
 def compliance_report(module, rest_obj):
     baseline_name = module.params.get("baseline")
     device_id = module.params.get("device_id")
@@ -206,12 +254,11 @@ def compliance_report(module, rest_obj):
             report = list(filter(lambda d: d['Id'] in [device_id], baseline_report.get("value")))
         else:
             report = baseline_report.get("value")
+        if module.params.get("non_compliant_only"):
+            report = [each for each in report if each.get("ComplianceStatus") == NON_COMPLIANT]
         device_compliance = report
         if device_compliance:
-            for each in device_compliance:
-                compliance_uri = COMPLIANCE_URI.format(baseline_id, each["Id"])
-                attr_group = rest_obj.invoke_request("GET", compliance_uri)
-                each["ComplianceAttributeGroups"] = attr_group.json_data.get("ComplianceAttributeGroups")
+            add_compliance_details(rest_obj, baseline_id, device_compliance)
     return device_compliance
 
 
@@ -220,6 +267,7 @@ def main():
         "baseline": {"required": True, "type": "str"},
         "device_id": {"required": False, "type": "int"},
         "device_service_tag": {"required": False, "type": "str"},
+        "non_compliant_only": {"required": False, "type": "bool", "default": False},
     }
 
     module = OmeAnsibleModule(
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -276,6 +276,7 @@ error_info:
 """
 
 import json
+from bisect import bisect_left, bisect_right
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -356,27 +357,45 @@ def get_all_ips(ip_addresses, module):
     return ip_addresses_list
 
 
-def get_device_id_from_ip(ip_addresses, device_list, module):
+def parse_device_ip(network_address):
+    try:
+        ome_ip = IPAddress(network_address)
+    except AddrFormatError:
+        ome_ip = IPAddress(network_address.replace(']', '').replace('[', ''))
+    return ome_ip
+
+
+def get_device_ip_index(device_list):
+    """
+    Builds an index of the management addresses of the devices sorted by (IP version, integer value)
+    so that the devices of an address, range or network are looked up with a binary search.
+    :param device_list: list of devices
+    :return: tuple of the sorted keys and the list of (device id, IPAddress) in the same order
+    """
     ip_map = dict(
         [(each_device["DeviceManagement"][0]["NetworkAddress"], each_device["Id"]) for each_device in device_list
          if each_device["DeviceManagement"]])
-    device_id_list_map = {}
+    index = []
     for available_ip, device_id in ip_map.items():
-        for ip_formats in ip_addresses:
-            if isinstance(ip_formats, IPAddress):
-                try:
-                    ome_ip = IPAddress(available_ip)
-                except AddrFormatError:
-                    ome_ip = IPAddress(available_ip.replace(']', '').replace('[', ''))
-                if ome_ip == ip_formats:
-                    device_id_list_map.update({device_id: str(ip_formats)})
-            if not isinstance(ip_formats, IPAddress):
-                try:
-                    ome_ip = IPAddress(available_ip)
-                except AddrFormatError:
-                    ome_ip = IPAddress(available_ip.replace(']', '').replace('[', ''))
-                if ome_ip in ip_formats:
-                    device_id_list_map.update({device_id: str(ome_ip)})
+        ome_ip = parse_device_ip(available_ip)
+        index.append(((ome_ip.version, int(ome_ip)), device_id, ome_ip))
+    index.sort(key=lambda entry: entry[0])
+    return [entry[0] for entry in index], [entry[1:] for entry in index]
+
+
+def get_device_id_from_ip(ip_addresses, device_list, module):
+    keys, devices = get_device_ip_index(device_list)
+    device_id_list_map = {}
+    for ip_formats in ip_addresses:
+        if isinstance(ip_formats, IPAddress):
+            key = (ip_formats.version, int(ip_formats))
+            for device_id, ome_ip in devices[bisect_left(keys, key):bisect_right(keys, key)]:
+                device_id_list_map.update({device_id: str(ip_formats)})
+        else:
+            start = bisect_left(keys, (ip_formats.version, ip_formats.first))
+            end = bisect_right(keys, (ip_formats.version, ip_formats.last))
+            for device_id, ome_ip in devices[start:end]:
+                device_id_list_map.update({device_id: str(ome_ip)})
     if len(device_id_list_map) == 0:
         module.fail_json(msg=IP_NOT_EXISTS)
     return device_id_list_map
@@ -386,7 +405,6 @@ def get_device_id(rest_obj, module):
     device_id_list = module.params.get("device_ids")
     device_tag_list = module.params.get("device_service_tags")
     ip_addresses = module.params.get("ip_addresses")
-    device_list = rest_obj.get_all_report_details(DEVICE_URI)
     invalid, each_device_list, each_tag_to_id = [], [], []
     if device_id_list or device_tag_list:
         if device_id_list:
@@ -395,12 +413,13 @@ def get_device_id(rest_obj, module):
         elif device_tag_list:
             key = "DeviceServiceTag"
             each_device_list = device_tag_list
-
+        device_list = rest_obj.get_items_by_filter(DEVICE_URI, key, each_device_list,
+                                                   select=["Id", "DeviceServiceTag"])
+        device_map = dict((each_device[key], each_device["Id"]) for each_device in device_list)
         for each in each_device_list:
-            each_device = list(filter(lambda d: d[key] in [each], device_list["report_list"]))
-            if key == "DeviceServiceTag" and each_device:
-                each_tag_to_id.append(each_device[0]["Id"])
-            if not each_device:
+            if key == "DeviceServiceTag" and each in device_map:
+                each_tag_to_id.append(device_map[each])
+            if each not in device_map:
                 invalid.append(str(each))
         if invalid:
             value = "id" if key == "Id" else "service tag"
@@ -409,6 +428,7 @@ def get_device_id(rest_obj, module):
         if each_tag_to_id:
             each_device_list = each_tag_to_id
     else:
+        device_list = rest_obj.get_all_report_details(DEVICE_URI)
         all_ips = get_all_ips(ip_addresses, module)
         each_device_list = get_device_id_from_ip(all_ips, device_list["report_list"], module)
         key = "IPAddresses"
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -197,7 +197,8 @@ device_info:
 from ssl import SSLError
 
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination, run_concurrently, \
+    DEFAULT_MAX_WORKERS
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -216,45 +217,22 @@ DEVICE_RESOURCE_COLLECTION = {
 }
 
 
-def update_device_details_with_filtering(missing_service_tags, service_tag_dict, rest_obj):
-    """
-    This is a workaround solutions.
-    Use filtering query, in case fetching all report list fails for some reason.
-    Updates service_tag_dict if filtering request is success.
-    :param missing_service_tags:  Service tags which are unable to fetch from pagination request.
-    :param service_tag_dict: this contains device id mapping with tags
-    :param rest_obj: ome connection object
-    :return: None.
-    """
-    try:
-        for tag in missing_service_tags:
-            query = "DeviceServiceTag eq '{0}'".format(tag)
-            query_param = {"$filter": query}
-            resp = rest_obj.invoke_request('GET', DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"], query_param=query_param)
-            value = resp.json_data["value"]
-            if value and value[0]["DeviceServiceTag"] == tag:
-                service_tag_dict.update({value[0]["Id"]: value[0]["DeviceServiceTag"]})
-                missing_service_tags.remove(tag)
-    except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
-        raise err
-
-
 def _get_device_id_from_service_tags(service_tags, rest_obj):
     """
     Get device ids from device service tag
+    The service tags are looked up with batched '$filter' queries instead of retrieving every device.
     Returns :dict : device_id to service_tag map
     :arg service_tags: service tag
     :arg rest_obj: RestOME class object in case of request with session.
     :returns: dict eg: {1345:"MXL1245"}
     """
-    device_list = rest_obj.get_all_report_details(DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"])["report_list"]
+    devices = rest_obj.get_items_by_filter(DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"], "DeviceServiceTag",
+                                           service_tags, select=["Id", "DeviceServiceTag"])
     service_tag_dict = {}
-    for item in device_list:
+    for item in devices:
         if item["DeviceServiceTag"] in service_tags:
             service_tag_dict.update({item["Id"]: item["DeviceServiceTag"]})
-    available_service_tags = service_tag_dict.values()
-    missing_service_tags = list(set(service_tags) - set(available_service_tags))
-    update_device_details_with_filtering(missing_service_tags, service_tag_dict, rest_obj)
+    missing_service_tags = list(set(service_tags) - set(service_tag_dict.values()))
     device_fact_error_report.update(dict((tag, DESC_HTTP_ERROR) for tag in missing_service_tags))
     return service_tag_dict
 
@@ -346,6 +324,30 @@ def _get_resource_parameters(module_params, rest_obj):
     return path_dict
 
 
+def _fetch_device_facts(rest_obj, path_dict, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Replaces each resource path of the devices with its response, the paths are retrieved in parallel.
+    The error message is reported for a path which fails.
+    :returns: list of the status codes of the successful requests
+    """
+    requests = [(path_dict_map, identifier, path) for path_dict_map in path_dict.values()
+                for identifier, path in path_dict_map.items()]
+
+    def fetch(request):
+        try:
+            resp = rest_obj.invoke_request('GET', request[2])
+            return resp.json_data, resp.status_code
+        except HTTPError as err:
+            return str(err), None
+
+    resp_status = []
+    for (path_dict_map, identifier, path), (data, status_code) in zip(requests, run_concurrently(fetch, requests, max_workers)):
+        path_dict_map[identifier] = data
+        if status_code is not None:
+            resp_status.append(status_code)
+    return resp_status
+
+
 def _check_mutually_inclusive_arguments(val, module_params, required_args):
     """"
      Throws error if arguments detailed_inventory, subsystem_health
@@ -407,15 +409,7 @@ def main():
                     if device_facts["@odata.count"] == 0:
                         module.exit_json(msg="No devices present.", device_info=[])
             else:
-                for identifier_type, path_dict_map in device_facts.items():
-                    for identifier, path in path_dict_map.items():
-                        try:
-                            resp = rest_obj.invoke_request('GET', path)
-                            data = resp.json_data
-                            resp_status.append(resp.status_code)
-                        except HTTPError as err:
-                            data = str(err)
-                        path_dict_map[identifier] = data
+                resp_status = _fetch_device_facts(rest_obj, device_facts)
                 if any(device_fact_error_report):
                     if "device_service_tag" in device_facts:
                         device_facts["device_service_tag"].update(device_fact_error_report)
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -307,12 +307,12 @@ def group_validation(module, rest_obj):
 def device_validation(module, rest_obj):
     device_lst, invalid_lst, other_types = [], [], []
     devices, tags = module.params.get("device_ids"), module.params.get("device_service_tags")
-    all_device = rest_obj.get_all_report_details(DEVICE_URI)
     key = "Id" if devices is not None else "DeviceServiceTag"
     value = "id" if key == "Id" else "service tag"
     req_device = devices if devices is not None else tags
+    all_device = rest_obj.get_items_by_filter(DEVICE_URI, key, req_device, select=["Id", "DeviceServiceTag", "Type"])
     for each in req_device:
-        device = list(filter(lambda d: d[key] in [each], all_device["report_list"]))
+        device = list(filter(lambda d: d[key] in [each], all_device))
         if device and device[0]["Type"] == 1000:
             device_lst.append(device[0]["Id"])
         elif device and not device[0]["Type"] == 1000:
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -109,6 +109,32 @@ options:
       - GracefulRebootForce
       - PowerCycle
     default: GracefulRebootForce
+  batch_size:
+    version_added: '9.10.0'
+    type: int
+    description:
+      - Maximum number of devices updated by each firmware update job.
+      - The devices to be updated are split into batches of I(batch_size) devices and a separate update job is
+        submitted for each batch.
+      - If not provided, a single update job is submitted for all the devices.
+      - This is applicable only to I(baseline_name).
+  max_parallel_jobs:
+    version_added: '9.10.0'
+    type: int
+    description:
+      - Maximum number of batch update jobs running at the same time.
+      - The update jobs are submitted in waves of I(max_parallel_jobs) jobs, the next wave is submitted after all
+        the jobs of the current wave complete.
+      - If a job of a wave fails or does not complete within I(job_wait_timeout), the remaining batches are not submitted.
+      - If not provided, the update jobs of all the batches are submitted at once and are not tracked.
+      - This is applicable only when I(batch_size) is provided.
+  job_wait_timeout:
+    version_added: '9.10.0'
+    type: int
+    description:
+      - The maximum wait time in seconds for the update jobs of a wave to complete.
+      - This is applicable only when I(max_parallel_jobs) is provided.
+    default: 3600
 requirements:
     - "python >= 3.9.6"
 author:
@@ -265,6 +291,17 @@ EXAMPLES = r'''
     components:
       - BIOS
     reboot_type: PowerCycle
+
+- name: "Update firmware using baseline name in waves of four jobs of 50 devices each."
+  dellemc.openmanage.ome_firmware:
+    hostname: "192.168.0.1"
+    username: "username"
+    password: "password"
+    ca_path: "/path/to/ca_cert.pem"
+    baseline_name: baseline_devices
+    batch_size: 50
+    max_parallel_jobs: 4
+    job_wait_timeout: 7200
 '''
 
 RETURN = r'''
@@ -277,7 +314,7 @@ msg:
 update_status:
   type: dict
   description: The firmware update job and progress details from the OME.
-  returned: success
+  returned: success and I(batch_size) is not provided
   sample: {
     'LastRun': None,
     'CreatedBy': 'user',
@@ -326,6 +363,50 @@ update_status:
       'Id': 5,
       'Name': 'Update_Task'}
 }
+update_jobs:
+  type: list
+  elements: dict
+  description:
+    - The firmware update job details of each batch, in the order of the batches.
+    - The details of the tracked jobs are the details of their last poll.
+  returned: when I(batch_size) is provided
+  sample: [{
+    'Id': 11117,
+    'JobName': 'Firmware Update Task - Batch 1 of 2',
+    'JobStatus': {
+      'Id': 2060,
+      'Name': 'Completed'
+    },
+    'LastRunStatus': {
+      'Id': 2060,
+      'Name': 'Completed'
+    },
+    'Targets': [{
+      'TargetType': {
+      'Id': 1000,
+      'Name': 'DEVICE'},
+      'Data': 'DCIM:INSTALLED#701__NIC.Mezzanine.1A-1-1',
+      'Id': 11115,
+      'JobId': 11117}]
+  }, {
+    'Id': 11118,
+    'JobName': 'Firmware Update Task - Batch 2 of 2',
+    'JobStatus': {
+      'Id': 2060,
+      'Name': 'Completed'
+    },
+    'LastRunStatus': {
+      'Id': 2060,
+      'Name': 'Completed'
+    },
+    'Targets': [{
+      'TargetType': {
+      'Id': 1000,
+      'Name': 'DEVICE'},
+      'Data': 'DCIM:INSTALLED#iDRAC.Embedded.1-1#IDRACinfo',
+      'Id': 11116,
+      'JobId': 11118}]
+  }]
 error_info:
   description: Details of the HTTP Error.
   returned: on HTTP error
@@ -352,12 +433,20 @@ error_info:
 import json
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import JobTracker, job_getter, run_concurrently, \
+    DEFAULT_MAX_WORKERS
 from ansible.module_utils.urls import ConnectionError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
 
 COMPLIANCE_URI = "UpdateService/Baselines({0})/DeviceComplianceReports"
 BASELINE_URI = "UpdateService/Baselines"
+JOB_URI = "JobService/Jobs({0})"
+JOB_POLL_INTERVAL = 30
+BATCH_JOB_NAME = "Firmware Update Task - Batch {0} of {1}"
+UPDATE_ACTIONS = frozenset(["UPGRADE", "DOWNGRADE"])
+JOB_COMPLETE_STATES = (2060, 2020, 2090)
+JOB_FAIL_STATES = (2070, 2101, 2102, 2103)
 FW_JOB_DESC = "Firmware update task initiated from OpenManage Ansible Module collections"
 NO_CHANGES_MSG = "No changes found to be applied. Either there are no updates present or components specified are not" \
                  " found in the baseline."
@@ -365,6 +454,10 @@ COMPLIANCE_READ_FAIL = "Failed to read compliance report."
 DUP_REQ_MSG = "Parameter 'dup_file' to be provided along with 'device_id'|'device_service_tag'|'device_group_names'"
 APPLICABLE_DUP = "Unable to get applicable components DUP."
 CHANGES_FOUND = "Changes found to be applied."
+BATCH_JOB_FAILED = "Unable to complete the firmware update jobs of the batch(es) '{0}'."
+BATCH_JOBS_SUBMITTED = "Successfully submitted the firmware update jobs."
+BATCH_JOBS_COMPLETED = "Successfully completed the firmware update jobs."
+BATCHES_NOT_SUBMITTED = " The remaining {0} batch(es) are not submitted."
 
 
 def spawn_update_job(rest_obj, job_payload):
@@ -473,15 +566,17 @@ def get_device_ids(rest_obj, module, device_id_tags):
     device_id = []
     resp = rest_obj.get_all_report_details("DeviceService/Devices")
     if resp.get("report_list"):
-        device_resp = dict([(str(device['Id']), device['DeviceServiceTag']) for device in resp["report_list"]])
+        device_resp, tag_id_map = {}, {}
+        for device in resp["report_list"]:
+            device_resp[str(device['Id'])] = device['DeviceServiceTag']
+            tag_id_map.setdefault(device['DeviceServiceTag'], str(device['Id']))
         device_tags = map(str, device_id_tags)
         invalid_tags = []
         for tag in device_tags:
-            if tag in device_resp.keys():
+            if tag in device_resp:
                 device_id.append(tag)
-            elif tag in device_resp.values():
-                ids = list(device_resp.keys())[list(device_resp.values()).index(tag)]
-                device_id.append(ids)
+            elif tag in tag_id_map:
+                device_id.append(tag_id_map[tag])
             else:
                 invalid_tags.append(tag)
         if invalid_tags:
@@ -545,36 +640,34 @@ def single_dup_update(rest_obj, module):
 
 
 def baseline_based_update(rest_obj, module, baseline, dev_comp_map):
+    """
+    Returns the update targets of the non-compliant components of the baseline. The compliance
+    report is read one page at a time and the components of each device are matched against a set
+    of names built once for the device.
+    """
     compliance_uri = COMPLIANCE_URI.format(baseline["baseline_id"])
-    resp = rest_obj.get_all_report_details(compliance_uri)
     compliance_report_list = []
-    update_actions = ["UPGRADE", "DOWNGRADE"]
-    if resp["report_list"]:
-        comps = []
-        if not dev_comp_map:
-            comps = module.params.get('components')
-            dev_comp_map = dict([(str(dev["DeviceId"]), comps) for dev in resp["report_list"]])
-        for dvc in resp["report_list"]:
-            dev_id = dvc["DeviceId"]
-            if str(dev_id) in dev_comp_map:
-                comps = dev_comp_map.get(str(dev_id), [])
-                compliance_report = dvc.get("ComponentComplianceReports")
-                if compliance_report is not None:
-                    data_dict = {}
-                    comp_list = []
-                    if not comps:
-                        comp_list = list(icomp["SourceName"] for icomp in compliance_report
-                                         if icomp["UpdateAction"] in update_actions)
-                    else:
-                        comp_list = list(icomp["SourceName"] for icomp in compliance_report
-                                         if ((icomp["UpdateAction"] in update_actions) and
-                                         (icomp.get('Name') in comps)))  # regex filtering ++
-                    if comp_list:
-                        data_dict["Id"] = dev_id
-                        data_dict["Data"] = str(";").join(comp_list)
-                        data_dict["TargetType"] = {"Id": dvc['DeviceTypeId'], "Name": dvc["DeviceTypeName"]}
-                        compliance_report_list.append(data_dict)
-    else:
+    default_comps = frozenset(module.params.get('components') or [])
+    comp_names = dict((str(dev_id), frozenset(comps or [])) for dev_id, comps in (dev_comp_map or {}).items())
+    report_found = False
+    for dvc in rest_obj.iter_items(compliance_uri):
+        report_found = True
+        dev_id = dvc["DeviceId"]
+        if dev_comp_map:
+            comps = comp_names.get(str(dev_id))
+            if comps is None:
+                continue
+        else:
+            comps = default_comps
+        compliance_report = dvc.get("ComponentComplianceReports")
+        if compliance_report is not None:
+            comp_list = [icomp["SourceName"] for icomp in compliance_report
+                         if icomp["UpdateAction"] in UPDATE_ACTIONS and (not comps or icomp.get('Name') in comps)]
+            if comp_list:
+                compliance_report_list.append({
+                    "Id": dev_id, "Data": str(";").join(comp_list),
+                    "TargetType": {"Id": dvc['DeviceTypeId'], "Name": dvc["DeviceTypeName"]}})
+    if not report_found:
         module.fail_json(msg=COMPLIANCE_READ_FAIL)
     if not compliance_report_list:
         module.exit_json(msg=NO_CHANGES_MSG)
@@ -583,6 +676,56 @@ def baseline_based_update(rest_obj, module, baseline, dev_comp_map):
     return compliance_report_list
 
 
+def _is_job_terminal(resp):
+    return resp.json_data.get("LastRunStatus", {}).get("Id") in JOB_COMPLETE_STATES + JOB_FAIL_STATES
+
+
+def batch_update_jobs(rest_obj, module, target_data, baseline):
+    """
+    Splits the targets into batches of batch_size devices and submits an update job for each batch.
+    With max_parallel_jobs, the jobs are submitted in waves of max_parallel_jobs jobs and each wave
+    is tracked to completion before the next one, no further wave is submitted once a job fails.
+    A batch whose job cannot be submitted is reported as failed, with the jobs already submitted.
+    """
+    batch_size, max_parallel = module.params["batch_size"], module.params.get("max_parallel_jobs")
+    payload = job_payload_for_update(rest_obj, module, [], baseline=baseline)
+    batches = [target_data[index:index + batch_size] for index in range(0, len(target_data), batch_size)]
+    payloads = [dict(payload, JobName=BATCH_JOB_NAME.format(number, len(batches)), Targets=batch)
+                for number, batch in enumerate(batches, 1)]
+    wave_size = max_parallel or len(payloads)
+    tracker = JobTracker(job_getter(rest_obj), _is_job_terminal, max_wait_sec=module.params["job_wait_timeout"],
+                         max_interval=JOB_POLL_INTERVAL, max_unresponsive_wait=JOB_POLL_INTERVAL)
+    update_jobs = []
+
+    def submit(job_payload):
+        try:
+            return spawn_update_job(rest_obj, job_payload)
+        except (HTTPError, URLError, SSLError, ConnectionError):
+            return {}
+
+    for start in range(0, len(payloads), wave_size):
+        wave = run_concurrently(submit, payloads[start:start + wave_size], min(wave_size, DEFAULT_MAX_WORKERS))
+        update_jobs.extend(wave)
+        failed = [start + index + 1 for index, job in enumerate(wave) if not job.get("Id")]
+        if max_parallel and not failed:
+            job_uris = [JOB_URI.format(job["Id"]) for job in wave]
+            results = tracker.wait(job_uris)
+            for index, job_uri in enumerate(job_uris):
+                result = results[job_uri]
+                if result["resp"] is not None:
+                    update_jobs[start + index] = result["resp"].json_data
+                if not result["terminal"] or \
+                        update_jobs[start + index].get("LastRunStatus", {}).get("Id") in JOB_FAIL_STATES:
+                    failed.append(start + index + 1)
+        if failed:
+            msg = BATCH_JOB_FAILED.format(",".join(map(str, failed)))
+            remaining = len(payloads) - len(update_jobs)
+            if remaining:
+                msg += BATCHES_NOT_SUBMITTED.format(remaining)
+            module.fail_json(msg=msg, update_jobs=update_jobs)
+    return update_jobs
+
+
 def _validate_device_attributes(module):
     device_id_tags = []
     service_tag = module.params.get('device_service_tag')
@@ -603,7 +746,12 @@ def _validate_device_attributes(module):
 
 def get_device_component_map(rest_obj, module):
     device_id_tags = _validate_device_attributes(module)
+    if not device_id_tags:
+        return {}
     device_ids, id_tag_map = get_device_ids(rest_obj, module, device_id_tags)
+    tag_id_map = {}
+    for dev_id, tag in id_tag_map.items():
+        tag_id_map.setdefault(tag, dev_id)
     comps = module.params.get('components')
     dev_comp_map = {}
     if device_ids:
@@ -614,8 +762,7 @@ def get_device_component_map(rest_obj, module):
             if dev.get('id'):
                 dev_comp_map[str(dev.get('id'))] = dev.get('components')
             else:
-                id = list(id_tag_map.keys())[list(id_tag_map.values()).index(dev.get('service_tag'))]
-                dev_comp_map[str(id)] = dev.get('components')
+                dev_comp_map[str(tag_id_map[dev.get('service_tag')])] = dev.get('components')
     return dev_comp_map
 
 
@@ -624,6 +771,9 @@ def validate_inputs(module):
     if param.get("dup_file"):
         if not any([param.get("device_id"), param.get("device_service_tag"), param.get("device_group_names")]):
             module.fail_json(msg=DUP_REQ_MSG)
+    for option in ("batch_size", "max_parallel_jobs", "job_wait_timeout"):
+        if param.get(option) is not None and param[option] <= 0:
+            module.fail_json(msg="The value of '{0}' must be greater than zero.".format(option))
 
 
 def main():
@@ -648,6 +798,9 @@ def main():
             "mutually_exclusive": [('id', 'service_tag')],
             "required_one_of": [('id', 'service_tag')]
         },
+        "batch_size": {"type": 'int'},
+        "max_parallel_jobs": {"type": 'int'},
+        "job_wait_timeout": {"type": 'int', "default": 3600},
     }
 
     module = OmeAnsibleModule(
@@ -658,7 +811,9 @@ def main():
             ["device_group_names", "device_id", "devices"],
             ["device_group_names", "device_service_tag", "devices"],
             ["baseline_name", "device_group_names"],
-            ["dup_file", "components", "devices"]],
+            ["dup_file", "components", "devices"],
+            ["dup_file", "batch_size"]],
+        required_by={"max_parallel_jobs": "batch_size"},
         supports_check_mode=True
     )
     validate_inputs(module)
@@ -669,6 +824,10 @@ def main():
                 baseline_details = get_baseline_ids(rest_obj, module)
                 device_comp_map = get_device_component_map(rest_obj, module)
                 target_data = baseline_based_update(rest_obj, module, baseline_details, device_comp_map)
+                if module.params.get("batch_size"):
+                    update_jobs = batch_update_jobs(rest_obj, module, target_data, baseline_details)
+                    msg = BATCH_JOBS_COMPLETED if module.params.get("max_parallel_jobs") else BATCH_JOBS_SUBMITTED
+                    module.exit_json(msg=msg, update_jobs=update_jobs, changed=True)
             else:
                 target_data = single_dup_update(rest_obj, module)
             job_payload = job_payload_for_update(rest_obj, module, target_data, baseline=baseline_details)
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -240,6 +240,12 @@ EXIT_MESSAGE = "Unable to retrieve baseline list either because the device ID(s)
 MSG_ID = "CUPD3090"
 
 
+def _has_items(rest_obj, uri):
+    """Checks whether a collection has at least one item by requesting only its first item."""
+    resp = rest_obj.invoke_request('GET', uri, query_param={"$top": 1})
+    return bool(resp.json_data.get("value"))
+
+
 def _get_device_id_from_service_tags(service_tags, rest_obj, module):
     """
     Get device ids from device service tag
@@ -249,13 +255,11 @@ def _get_device_id_from_service_tags(service_tags, rest_obj, module):
     :returns: dict eg: {1345:"MXL1245"}
     """
     try:
-        resp = rest_obj.get_all_report_details("DeviceService/Devices")
-        devices_list = resp["report_list"]
-        if devices_list:
-            service_tag_dict = {}
-            for item in devices_list:
-                if item["DeviceServiceTag"] in service_tags:
-                    service_tag_dict.update({item["Id"]: item["DeviceServiceTag"]})
+        devices = rest_obj.get_items_by_filter(device_is_list_path, "DeviceServiceTag", service_tags,
+                                               select=["Id", "DeviceServiceTag"])
+        service_tag_dict = dict((item["Id"], item["DeviceServiceTag"]) for item in devices
+                                if item["DeviceServiceTag"] in service_tags)
+        if service_tag_dict or _has_items(rest_obj, device_is_list_path):
             return service_tag_dict
         else:
             module.exit_json(msg="Unable to fetch the device information.", baseline_compliance_info=[])
@@ -284,16 +288,12 @@ def get_device_ids_from_group_ids(module, grou_id_list, rest_obj):
 def get_device_ids_from_group_names(module, rest_obj):
     try:
         grp_name_list = module.params.get("device_group_names")
-        resp = rest_obj.get_all_report_details(group_service_path)
-        group_id_list = []
-        grp_list_resp = resp["report_list"]
-        if grp_list_resp:
-            for name in grp_name_list:
-                for group in grp_list_resp:
-                    if group["Name"] == name:
-                        group_id_list.append(group['Id'])
-                        break
-        else:
+        groups = rest_obj.get_items_by_filter(group_service_path, "Name", grp_name_list, select=["Id", "Name"])
+        group_id_map = {}
+        for group in groups:
+            group_id_map.setdefault(group["Name"], group["Id"])
+        group_id_list = [group_id_map[name] for name in grp_name_list if name in group_id_map]
+        if not group_id_map and not _has_items(rest_obj, group_service_path):
             module.exit_json(msg="Unable to fetch the specified device_group_names.",
                              baseline_compliance_info=[])
         return get_device_ids_from_group_ids(module, group_id_list, rest_obj)
@@ -317,17 +317,17 @@ def get_baseline_id_from_name(rest_obj, module):
         baseline_name = module.params.get("baseline_name")
         baseline_id = 0
         if baseline_name is not None:
-            resp_val = rest_obj.get_all_items_with_pagination(base_line_path)
-            baseline_list = resp_val["value"]
-            if baseline_list:
-                for baseline in baseline_list:
-                    if baseline["Name"] == baseline_name:
-                        baseline_id = baseline["Id"]
-                        break
-                else:
+            # the baselines are read one page at a time until the named baseline is found
+            baseline_found = False
+            for baseline in rest_obj.iter_items(base_line_path):
+                baseline_found = True
+                if baseline["Name"] == baseline_name:
+                    baseline_id = baseline["Id"]
+                    break
+            else:
+                if baseline_found:
                     module.exit_json(msg="Specified baseline_name does not exist in the system.",
                                      baseline_compliance_info=[])
-            else:
                 module.exit_json(msg="No baseline exists in the system.", baseline_compliance_info=[])
         else:
             module.fail_json(msg="baseline_name is a mandatory option.")
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2020-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2020-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -52,6 +52,8 @@ author:
   - "Abhishek Sinha (@Abhishek-Dell)"
 notes:
     - Run this module from a system that has direct access to Dell OpenManage Enterprise.
+    - When I(job_id) is not given, the last execution details are fetched only for the jobs
+      returned by I(system_query_options).
     - This module supports C(check_mode).
 '''
 
@@ -293,13 +295,15 @@ job_info:
 
 import json
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict, remove_key
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict, remove_key, \
+    run_concurrently, DEFAULT_MAX_WORKERS
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
 JOBS_URI = "JobService/Jobs"
 EXECUTION_HISTORIES_URI = "JobService/Jobs({0})/ExecutionHistories"
 LAST_EXECUTION_DETAIL_URI = "JobService/Jobs({0})/LastExecutionDetail"
+EXPAND_LAST_EXECUTION_DETAIL = {"$expand": "LastExecutionDetail"}
 
 
 def _get_query_parameters(module_params):
@@ -314,6 +318,12 @@ def _get_query_parameters(module_params):
     return query_parameter
 
 
+def _strip_detail(detail):
+    """Drops the OData annotations of a job detail, the same way for listed and expanded details."""
+    detail.get('JobStatus', {}).pop('@odata.type', None)
+    return strip_substr_dict(detail)
+
+
 def get_uri_detail(rest_obj, uri):
     try:
         result = []
@@ -328,8 +338,7 @@ def get_uri_detail(rest_obj, uri):
                     each_element.update({"ExecutionHistoryDetails": execution_history_detail})
                 result.append(strip_substr_dict(each_element))
         else:
-            json_data.get('JobStatus', {}).pop('@odata.type', None)
-            result = strip_substr_dict(json_data)
+            result = _strip_detail(json_data)
     except Exception:
         pass
     return result
@@ -353,6 +362,44 @@ def last_execution_detail_of_a_job(rest_obj, job_id):
     return last_execution_detail
 
 
+def get_jobs(rest_obj, query_param):
+    """
+    Lists the jobs with the last execution detail expanded, the jobs are listed again
+    without '$expand' when the appliance rejects it.
+    :returns: job facts and the list of response status codes
+    """
+    for param in (dict(query_param, **EXPAND_LAST_EXECUTION_DETAIL), query_param):
+        try:
+            if query_param:
+                resp = rest_obj.invoke_request('GET', JOBS_URI, query_param=param)
+                return remove_key(resp.json_data), [resp.status_code]
+            job_report = rest_obj.get_all_report_details(JOBS_URI, query_param=param or None)
+            job_facts = remove_key({"value": job_report["report_list"]})
+            return job_facts, [200] if len(job_facts["value"]) > 0 else []
+        except HTTPError as err:
+            if err.code != 400 or param is query_param:
+                raise
+
+
+def add_last_execution_details(rest_obj, jobs, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Adds the last execution detail to each job. Details expanded in the job list are stripped like
+    the retrieved ones and the remaining ones are retrieved in parallel.
+    """
+    pending = []
+    for job in jobs:
+        if job.get("LastExecutionDetail"):
+            job["LastExecutionDetail"] = _strip_detail(job["LastExecutionDetail"])
+        else:
+            pending.append(job)
+    details = run_concurrently(lambda job: last_execution_detail_of_a_job(rest_obj, job.get("Id")),
+                               pending, max_workers)
+    for job, detail in zip(pending, details):
+        job["LastExecutionDetail"] = detail
+    for job in jobs:
+        job["ExecutionHistories"] = []
+
+
 def main():
     specs = {
         "job_id": {"required": False, "type": 'int'},
@@ -386,25 +433,9 @@ def main():
                                   'LastExecutionDetail': last_execution})
                 resp_status.append(resp.status_code)
             else:
-                # query applicable only for all jobs list fetching
-                query_param = _get_query_parameters(module.params)
-                if query_param:
-                    resp = rest_obj.invoke_request('GET', JOBS_URI, query_param=query_param)
-                    job_facts = resp.json_data
-                    job_facts = remove_key(job_facts)
-                    resp_status.append(resp.status_code)
-                else:
-                    # Fetch all jobs, filter and pagination options
-                    job_report = rest_obj.get_all_report_details(JOBS_URI)
-                    job_facts = {"value": job_report["report_list"]}
-                    job_facts = remove_key(job_facts)
-                    if len(job_facts["value"]) > 0:
-                        resp_status.append(200)
-                for each_value in job_facts["value"]:
-                    job_id = each_value["Id"] if "Id" in each_value else None
-                    last_execution = last_execution_detail_of_a_job(rest_obj, job_id)
-                    each_value.update({'ExecutionHistories': [],
-                                       'LastExecutionDetail': last_execution})
+                # query applicable only for all jobs list fetching, only the jobs returned are enriched
+                job_facts, resp_status = get_jobs(rest_obj, _get_query_parameters(module.params))
+                add_last_execution_details(rest_obj, job_facts["value"])
     except HTTPError as httperr:
         module.fail_json(msg=str(httperr), job_info=json.load(httperr))
     except URLError as err:
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -51,7 +51,6 @@ options:
         default: 3600
 requirements:
     - "python >= 3.9.6"
-    - "urllib3"
 author:
     - "Felix Stephen (@felixs88)"
     - "Husniya Hameed (@husniya_hameed)"
@@ -145,17 +144,10 @@ import os
 import time
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, RedfishAnsibleModule
-from ansible.module_utils.basic import missing_required_lib
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import MultipartFileBody
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
-try:
-    from urllib3.fields import RequestField
-    from urllib3.filepost import encode_multipart_formdata
-    HAS_LIB = True
-except ImportError:
-    HAS_LIB = False
-
 UPDATE_SERVICE = "UpdateService"
 JOB_URI = "JobService/Jobs/{job_id}"
 JOB_WAIT_MSG = 'Job wait timed out after {0} seconds.'
@@ -167,18 +159,55 @@ JOBSTATUS_FAILED = "failed"
 JOBSTATUS_TIMED_OUT = "timed_out"
 JOBSTATUS_SCHEDULED = "scheduled"
 JOBSTATUS_ERRORED = "errored"
+UPLOAD_RETRIES = 3
+UPLOAD_RETRY_INTERVAL = 5
+UPLOAD_PROGRESS_STEP = 10
+
+
+def _encode_form_data(image_path, progress=None):
+    """Returns the streamed multipart/form-data body and its Content-Type for the file upload."""
+    body = MultipartFileBody(image_path, file_name=image_path.split(os.sep)[-1], file_type="multipart/form-data",
+                             progress=progress)
+    return body, body.content_type
+
 
+def _upload_progress(module, image_path):
+    """Returns a callback which logs the upload progress every UPLOAD_PROGRESS_STEP percent."""
+    logged = {"percent": 0}
 
-def _encode_form_data(payload_file):
-    """Encode multipart/form-data for file upload."""
-    fields = []
-    f_name, f_data, f_type = payload_file.get("file")
-    f_binary = f_data.read()
-    req_field = RequestField(name="file", data=f_binary, filename=f_name)
-    req_field.make_multipart(content_type=f_type)
-    fields.append(req_field)
-    data, content_type = encode_multipart_formdata(fields)
-    return data, content_type
+    def progress(sent, total):
+        percent = sent * 100 // total if total else 100
+        if percent - logged["percent"] >= UPLOAD_PROGRESS_STEP or (sent == total and logged["percent"] < 100):
+            logged["percent"] = percent
+            module.log("Uploaded {0}% ({1} of {2} bytes) of {3}.".format(percent, sent, total, image_path))
+    return progress
+
+
+def _upload_image(obj, module, push_uri, image_path, etag):
+    """
+    Streams the image file to the HttpPushUri. The upload is sent again from the beginning on a new
+    connection when the connection fails, errors returned by the server are not retried.
+    """
+    data, ctype = _encode_form_data(image_path, progress=_upload_progress(module, image_path))
+    headers = {"If-Match": etag, "Content-Type": ctype, "Content-Length": str(len(data))}
+    saved_headers = dict(obj._headers)
+    try:
+        for attempt in range(1, UPLOAD_RETRIES + 1):
+            try:
+                return obj.invoke_request("POST", push_uri, data=data, headers=headers, dump=False,
+                                          api_timeout=module.params["timeout"])
+            except HTTPError:
+                raise
+            except (URLError, ConnectionError, OSError) as err:
+                if attempt == UPLOAD_RETRIES:
+                    raise
+                module.log("Upload of {0} failed with '{1}', retrying {2} of {3}.".format(
+                    image_path, err, attempt, UPLOAD_RETRIES - 1))
+                time.sleep(UPLOAD_RETRY_INTERVAL)
+    finally:
+        # the upload headers are merged into the session headers, restore them for the next requests
+        obj._headers.clear()
+        obj._headers.update(saved_headers)
 
 
 def _get_update_service_target(obj, module):
@@ -211,12 +240,7 @@ def firmware_update(obj, module):
         update_status = obj.invoke_request("POST", update_uri, data=payload)
     else:
         resp_inv = obj.invoke_request("GET", inventory_uri)
-        with open(os.path.join(image_path), "rb") as img_file:
-            binary_payload = {"file": (image_path.split(os.sep)[-1], img_file, "multipart/form-data")}
-            data, ctype = _encode_form_data(binary_payload)
-        headers = {"If-Match": resp_inv.headers.get("etag")}
-        headers.update({"Content-Type": ctype})
-        upload_status = obj.invoke_request("POST", push_uri, data=data, headers=headers, dump=False, api_timeout=module.params["timeout"])
+        upload_status = _upload_image(obj, module, push_uri, image_path, resp_inv.headers.get("etag"))
         if upload_status.status_code == 201:
             payload = {"ImageURI": upload_status.headers.get("location")}
             update_status = obj.invoke_request("POST", update_uri, data=payload)
@@ -275,8 +299,6 @@ def main():
     module = RedfishAnsibleModule(
         argument_spec=specs,
         supports_check_mode=False)
-    if not HAS_LIB:
-        module.fail_json(msg=missing_required_lib("urllib3"))
     try:
         message = "Failed to submit the firmware update task."
         with Redfish(module.params, req_session=True) as obj:
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.utils import set_module_args, \
+    AnsibleExitJson, AnsibleFailJson
+
+
+class RunProfile(object):
+    """Wall time, requests sent to the simulator and peak memory of one run."""
+
+    def __init__(self, result, wall_time, round_trips, peak_memory):
+        self.result = result
+        self.wall_time = wall_time
+        self.round_trips = round_trips
+        self.peak_memory = peak_memory
+
+    def as_dict(self):
+        return {"wall_time": round(self.wall_time, 4), "round_trips": self.round_trips,
+                "peak_memory": self.peak_memory}
+
+
+class SimpleBenchmark(object):
+    """Runs the target once when pytest-benchmark is not installed, with the same call signatures."""
+
+    def __init__(self):
+        self.extra_info = {}
+
+    def __call__(self, target, *args, **kwargs):
+        return target(*args, **kwargs)
+
+    def pedantic(self, target, args=(), kwargs=None, setup=None, rounds=1, iterations=1, warmup_rounds=0):
+        result = None
+        for dummy in range(rounds):
+            if setup is not None:
+                setup()
+            for dummy in range(iterations):
+                result = target(*args, **(kwargs or {}))
+        return result
+
+
+def run_module(module, module_args):
+    """Runs the main of a module and returns the result passed to exit_json or fail_json."""
+    set_module_args(dict(module_args))
+    try:
+        module.main()
+    except (AnsibleExitJson, AnsibleFailJson) as result:
+        return result.args[0]
+    raise AssertionError("{0} did not exit.".format(module.__name__))
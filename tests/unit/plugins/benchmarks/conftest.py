@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import time
+import tracemalloc
+import pytest
+from ansible.module_utils import basic
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.utils import exit_json, fail_json
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.benchmarks.common import RunProfile, SimpleBenchmark
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.simulator.server import DeviceSimulator
+
+try:
+    import pytest_benchmark  # noqa: F401
+    HAS_PYTEST_BENCHMARK = True
+except ImportError:
+    HAS_PYTEST_BENCHMARK = False
+
+
+if not HAS_PYTEST_BENCHMARK:
+    @pytest.fixture
+    def benchmark():
+        return SimpleBenchmark()
+
+
+@pytest.fixture(autouse=True)
+def module_mock(mocker):
+    return mocker.patch.multiple(basic.AnsibleModule, exit_json=exit_json, fail_json=fail_json)
+
+
+@pytest.fixture
+def simulator(monkeypatch):
+    pytest.importorskip("cryptography")
+    for name in ("OMAM_SESSION_CACHE_DIR", "OMAM_CACHE_DIR"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    with DeviceSimulator() as sim:
+        yield sim
+
+
+@pytest.fixture
+def ome_args(simulator):
+    return {"hostname": simulator.host, "port": simulator.port, "username": "admin", "password": "password",
+            "validate_certs": False}
+
+
+@pytest.fixture
+def idrac_args(simulator):
+    return {"idrac_ip": simulator.host, "idrac_port": simulator.port, "idrac_user": "root",
+            "idrac_password": "password", "validate_certs": False}
+
+
+@pytest.fixture
+def profile(benchmark, simulator):
+    """
+    Returns a function which runs a callable against the simulator and returns its RunProfile,
+    the wall time, round trips and peak memory are also recorded in the extra info of the benchmark.
+    The peak memory is traced for the whole process, so it includes the buffers of the simulator
+    thread and is meant for comparing runs with each other.
+    """
+    def run(func, *args, **kwargs):
+        def measure():
+            simulator.reset()
+            tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                wall_time = time.perf_counter() - start
+                peak_memory = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            return RunProfile(result, wall_time, simulator.count(), peak_memory)
+        run_profile = benchmark.pedantic(measure, rounds=1, iterations=1)
+        benchmark.extra_info.update(run_profile.as_dict())
+        return run_profile
+    return run
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from mock import MagicMock
+from ansible_collections.dellemc.openmanage.plugins.inventory.ome_inventory import InventoryModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils import perf
+from ansible_collections.dellemc.openmanage.plugins.modules import idrac_firmware, idrac_storage_volume, \
+    ome_device_info, ome_job_info
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.benchmarks.common import run_module
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.simulator import payloads
+
+SESSION_ROUND_TRIPS = 2
+
+
+def assert_no_duplicate_gets(simulator):
+    gets = [(path, tuple(sorted(query.items()))) for method, path, query in simulator.requests if method == "GET"]
+    assert len(gets) == len(set(gets))
+
+
+class TestOmeBenchmarks(object):
+
+    def test_ome_device_info_basic_inventory(self, simulator, ome_args, profile):
+        payloads.add_ome_devices(simulator, 230)
+        run = profile(run_module, ome_device_info, ome_args)
+        assert run.result["device_info"]["@odata.count"] == 230
+        # first page followed by the remaining 4 pages
+        assert simulator.count("GET", "/api/DeviceService/Devices") == 5
+        assert run.round_trips == 5 + SESSION_ROUND_TRIPS
+
+    def test_ome_device_info_subsystem_health(self, simulator, ome_args, profile):
+        payloads.add_ome_devices(simulator, 100)
+        tags = ["SVC{0:04d}".format(index) for index in range(0, 100, 5)]
+        ome_args.update(fact_subset="subsystem_health", system_query_options={"device_service_tag": tags})
+        run = profile(run_module, ome_device_info, ome_args)
+        assert sorted(run.result["device_info"]["device_service_tag"]) == tags
+        assert simulator.count("GET", "/api/DeviceService/Devices?") == 0
+        assert len([req for req in simulator.requests if "$filter" in req[2]]) == 1
+        assert run.round_trips == 1 + len(tags) + SESSION_ROUND_TRIPS
+
+    def test_ome_job_info(self, simulator, ome_args, profile):
+        payloads.add_ome_jobs(simulator, 120)
+        run = profile(run_module, ome_job_info, ome_args)
+        jobs = run.result["job_info"]["value"]
+        assert len(jobs) == 120
+        assert all(job["LastExecutionDetail"]["Progress"] == "100" for job in jobs)
+        # the last execution details are expanded in the job pages
+        assert simulator.count("GET", "/api/JobService/Jobs(") == 0
+        assert run.round_trips == 3 + SESSION_ROUND_TRIPS
+
+    def test_ome_inventory(self, simulator, ome_args, profile):
+        devices = payloads.add_ome_devices(simulator, 200)
+        payloads.add_ome_groups(simulator, devices, 4)
+        options = dict(ome_args, max_workers=8, cache=False)
+        plugin = InventoryModule()
+        plugin.config = options
+        plugin.inventory = MagicMock()
+        plugin.get_option = options.get
+        run = profile(plugin._get_connection_resp)
+        assert len(run.result["All Devices"]["hosts"]) == 200
+        assert run.result["All Devices"]["children"] == ["Group 0", "Group 1", "Group 2", "Group 3"]
+        assert all(len(run.result["Group {0}".format(index)]["hosts"]) == 50 for index in range(4))
+        # groups, 4 pages of leaf devices and the sub groups of 'All Devices', then one page each for the sub groups
+        assert run.round_trips == 1 + 5 + 4 * 2 + SESSION_ROUND_TRIPS
+
+    def test_ome_job_info_perf(self, simulator, ome_args, profile, tmp_path, monkeypatch):
+        recorder = perf.PerfRecorder(trace_file=str(tmp_path / "trace.jsonl"))
+        monkeypatch.setattr(perf, "_RECORDER", recorder)
+        payloads.add_ome_jobs(simulator, 120)
+        run = profile(run_module, ome_job_info, ome_args)
+        assert run.result["perf"]["requests"] == run.round_trips
+        paths = [endpoint["path"] for endpoint in run.result["perf"]["endpoints"]]
+        assert sorted(paths) == ["/api/JobService/Jobs?$expand", "/api/JobService/Jobs?$expand&$skip&$top",
+                                 "/api/SessionService/Sessions", "/api/SessionService/Sessions({id})"]
+        with open(recorder.trace_file) as trace:
+            events = [json.loads(line) for line in trace]
+        assert len([event for event in events if event["type"] == "request"]) == run.round_trips
+        assert events[-1]["type"] == "module"
+
+    def test_latency_hidden_by_concurrency(self, simulator, ome_args, profile):
+        payloads.add_ome_devices(simulator, 32)
+        tags = ["SVC{0:04d}".format(index) for index in range(32)]
+        ome_args.update(fact_subset="detailed_inventory", system_query_options={"device_service_tag": tags})
+        baseline = profile(run_module, ome_device_info, ome_args)
+        simulator.latency = 0.05
+        run = profile(run_module, ome_device_info, ome_args)
+        assert len(run.result["device_info"]["device_service_tag"]) == 32
+        assert run.round_trips == baseline.round_trips
+        # the inventory details are retrieved in parallel, the delay added by the latency is far less than
+        # the delay of the same round trips sent one after the other
+        assert run.wall_time - baseline.wall_time < simulator.latency * run.round_trips / 2
+
+
+class TestIdracBenchmarks(object):
+
+    def test_idrac_storage_volume_view(self, simulator, idrac_args, profile):
+        payloads.add_idrac_manager(simulator)
+        payloads.add_idrac_storage(simulator, controllers=2, drives=8, volumes=2)
+        run = profile(run_module, idrac_storage_volume, dict(idrac_args, state="view"))
+        controllers = run.result["storage_status"]["Message"]["Controller"]
+        assert sorted(controllers) == ["RAID.Integrated.1-1", "RAID.Integrated.2-1"]
+        assert len(controllers["RAID.Integrated.1-1"]["VirtualDisk"]) == 2
+        assert_no_duplicate_gets(simulator)
+        # systems, system, expanded storage and volumes of each controller, drives, enclosures and the manager
+        assert run.round_trips == 3 + 2 + 16 + 2 + 1
+
+    @pytest.mark.parametrize("components", [1, 10])
+    def test_idrac_firmware_repository_update(self, components, simulator, idrac_args, profile, monkeypatch):
+        monkeypatch.setattr(idrac_firmware, "INTERVAL", 0)
+        payloads.add_idrac_manager(simulator)
+        payloads.add_idrac_firmware_repository(simulator, components, running_polls=2)
+        idrac_args.update(share_name="192.168.0.10:/firmware", reboot=True, job_wait=True, apply_update=True)
+        run = profile(run_module, idrac_firmware, idrac_args)
+        assert run.result["msg"] == "Successfully updated the firmware."
+        assert len(run.result["update_status"]["job_details"]["PackageList"]) == components
+        # each job returns two running states before it completes
+        job_polls = 2 + 1
+        assert simulator.count("GET", "/redfish/v1/JobService/Jobs/") == (components + 1) * job_polls
+        assert run.round_trips == 1 + 2 + (components + 1) * job_polls
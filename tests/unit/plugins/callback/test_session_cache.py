@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock import MagicMock
+from ansible_collections.dellemc.openmanage.plugins.callback.session_cache import CallbackModule
+
+CALLBACK_PATH = 'ansible_collections.dellemc.openmanage.plugins.callback.session_cache.'
+
+
+class TestSessionCacheCallback(object):
+
+    @pytest.mark.parametrize("cache_dir, purged", [("/tmp/sessions", True), (None, False)])
+    def test_v2_playbook_on_stats(self, cache_dir, purged, mocker):
+        cache_mock = mocker.patch(CALLBACK_PATH + 'SessionCache')
+        cache_mock.return_value.purge.return_value = 2
+        callback = CallbackModule()
+        callback.get_option = MagicMock(return_value=cache_dir)
+        callback._display = MagicMock()
+        callback.v2_playbook_on_stats(MagicMock())
+        assert cache_mock.return_value.purge.called is purged
+        if purged:
+            cache_mock.assert_called_once_with(cache_dir)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock import MagicMock
+from ansible_collections.dellemc.openmanage.plugins.inventory.ome_inventory import InventoryModule
+
+INVENTORY_PATH = 'ansible_collections.dellemc.openmanage.plugins.inventory.ome_inventory.'
+GROUPS = {
+    "GroupService/Groups": [
+        {"Name": "All Devices", "AllLeafDevices@odata.navigationLink": "/api/GroupService/Groups(1)/AllLeafDevices",
+         "SubGroups@odata.navigationLink": "/api/GroupService/Groups(1)/SubGroups"}],
+    "GroupService/Groups(1)/AllLeafDevices": [
+        {"DeviceManagement": [{"NetworkAddress": "192.168.0.1"}]},
+        {"DeviceManagement": [{"NetworkAddress": "[1234:5678::1]"}]},
+        {"DeviceManagement": []}],
+    "GroupService/Groups(1)/SubGroups": [
+        {"Name": "Servers", "Visible": True,
+         "AllLeafDevices@odata.navigationLink": "/api/GroupService/Groups(2)/AllLeafDevices",
+         "SubGroups@odata.navigationLink": "/api/GroupService/Groups(2)/SubGroups"},
+        {"Name": "Hidden", "Visible": False,
+         "AllLeafDevices@odata.navigationLink": "/api/GroupService/Groups(3)/AllLeafDevices",
+         "SubGroups@odata.navigationLink": "/api/GroupService/Groups(3)/SubGroups"}],
+    "GroupService/Groups(2)/AllLeafDevices": [{"DeviceManagement": [{"NetworkAddress": "192.168.0.1"}]}],
+    "GroupService/Groups(2)/SubGroups": [],
+}
+GROUP_TREE = {
+    "All Devices": {"hosts": ["192.168.0.1", "1234:5678::1"], "children": ["Servers"]},
+    "Servers": {"hosts": ["192.168.0.1"], "children": []},
+}
+
+
+class TestOmeInventory(object):
+
+    @pytest.fixture
+    def inventory_plugin(self, mocker):
+        options = {"hostname": "192.168.0.2", "username": "username", "password": "password",
+                   "max_workers": 4, "cache": False}
+        plugin = InventoryModule()
+        plugin.config = {"hostname": "192.168.0.2", "username": "username", "password": "password"}
+        plugin.inventory = MagicMock()
+        plugin.get_option = lambda option: options.get(option)
+        return plugin
+
+    @pytest.fixture
+    def pagination_mock(self, mocker):
+        return mocker.patch(INVENTORY_PATH + 'get_all_data_with_pagination',
+                            side_effect=lambda ome, uri: {"report_list": GROUPS[uri]})
+
+    def test_get_connection_resp(self, inventory_plugin, pagination_mock, mocker):
+        rest_mock = mocker.patch(INVENTORY_PATH + 'RestOME')
+        group_tree = inventory_plugin._get_connection_resp()
+        assert group_tree == GROUP_TREE
+        rest_mock.assert_called_once()
+        assert rest_mock.call_args[1] == {"req_session": True}
+        assert pagination_mock.call_count == 5
+
+    def test_populate(self, inventory_plugin):
+        inventory_plugin._populate(GROUP_TREE)
+        inventory_plugin.inventory.add_group.assert_any_call("All Devices")
+        inventory_plugin.inventory.add_group.assert_any_call("Servers")
+        inventory_plugin.inventory.add_host.assert_any_call(host="1234:5678::1", group="All Devices")
+        inventory_plugin.inventory.add_child.assert_called_once_with("All Devices", "Servers")
+
+    @pytest.mark.parametrize("params", [
+        {"cache_option": True, "cache": True, "cached": GROUP_TREE, "fetch": False, "update": False},
+        {"cache_option": True, "cache": True, "cached": None, "fetch": True, "update": True},
+        {"cache_option": True, "cache": False, "cached": GROUP_TREE, "fetch": True, "update": True},
+        {"cache_option": False, "cache": True, "cached": GROUP_TREE, "fetch": True, "update": False},
+    ])
+    def test_parse_cache(self, params, inventory_plugin, mocker):
+        mocker.patch(INVENTORY_PATH + 'BaseInventoryPlugin.parse')
+        inventory_plugin._read_config_data = MagicMock(return_value=inventory_plugin.config)
+        inventory_plugin.get_option = lambda option: params["cache_option"] if option == "cache" else None
+        inventory_plugin.get_cache_key = MagicMock(return_value="cache_key")
+        inventory_plugin._cache = {"cache_key": params["cached"]} if params["cached"] else {}
+        fetch_mock = mocker.patch(INVENTORY_PATH + 'InventoryModule._get_connection_resp', return_value=GROUP_TREE)
+        populate_mock = mocker.patch(INVENTORY_PATH + 'InventoryModule._populate')
+        inventory_plugin.parse(MagicMock(), MagicMock(), "ome_inventory.yml", cache=params["cache"])
+        assert fetch_mock.called is params["fetch"]
+        assert ("cache_key" in inventory_plugin._cache) is (params["update"] or bool(params["cached"]))
+        populate_mock.assert_called_once_with(GROUP_TREE)
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import time
+import pytest
+from mock import MagicMock
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import ResponseCache, SessionCache, get_ome_cached, \
+    build_registry_index, get_registry_index
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+KEY = ["ome", "192.168.0.1", 443, "4.0.0", "AlertService/AlertMessageDefinitions"]
+BASE_URL = "https://192.168.0.1:443"
+SESSION = {"Id": "1", "Token": "token", "Url": BASE_URL + "/redfish/v1/Sessions/1", "ValidateCerts": True, "CaPath": None}
+
+
+class TestResponseCache(object):
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ResponseCache(str(tmp_path / "cache"), ttl=60, max_size=1024 * 1024)
+
+    def test_get_set(self, cache):
+        assert cache.get(KEY) is None
+        cache.set(KEY, [{"Id": 1}])
+        assert cache.get(KEY) == [{"Id": 1}]
+        assert cache.get(KEY[:-1] + ["JobService/JobTypes"]) is None
+        assert oct(os.stat(cache.cache_dir).st_mode & 0o777) == oct(0o700)
+
+    def test_set_not_serializable(self, cache):
+        with pytest.raises(TypeError):
+            cache.set(KEY, [object()])
+        assert cache.get(KEY) is None
+
+    def test_get_expired(self, cache, mocker):
+        cache.set(KEY, [{"Id": 1}])
+        mocker.patch(MODULE_UTIL_PATH + 'cache.time.time', return_value=time.time() + 120)
+        assert cache.get(KEY) is None
+
+    def test_get_corrupted(self, cache):
+        cache.set(KEY, [{"Id": 1}])
+        with open(cache._path(KEY), "w") as cache_file:
+            cache_file.write("{not json")
+        assert cache.get(KEY) is None
+
+    def test_evict_lru(self, cache):
+        cache.max_size = 1
+        cache.set(KEY, "x" * 100)
+        assert cache.get(KEY) is None
+        cache.max_size = 1024 * 1024
+        keys = [KEY[:-1] + [str(index)] for index in range(3)]
+        for index, key in enumerate(keys):
+            cache.set(key, "x" * 100)
+            os.utime(cache._path(key), (time.time() - 30 + index, time.time() - 30 + index))
+        os.utime(cache._path(keys[0]), None)
+        cache.max_size = sum(os.path.getsize(cache._path(key)) for key in keys) + 50
+        cache.set(KEY, "x" * 100)
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == "x" * 100
+        assert cache.get(keys[2]) == "x" * 100
+        assert cache.get(KEY) == "x" * 100
+
+    def test_disabled(self, tmp_path):
+        cache = ResponseCache(str(tmp_path), ttl=0)
+        cache.set(KEY, [{"Id": 1}])
+        assert cache.get(KEY) is None
+        assert os.listdir(str(tmp_path)) == []
+
+    def test_get_or_fetch(self, cache):
+        fetch = MagicMock(return_value={"report_list": [{"Id": 1}]})
+        assert cache.get_or_fetch(KEY, fetch) == {"report_list": [{"Id": 1}]}
+        assert cache.get_or_fetch(KEY, fetch) == {"report_list": [{"Id": 1}]}
+        fetch.assert_called_once_with()
+
+    @pytest.mark.parametrize("env, cache_dir, ttl, max_size", [
+        ({}, None, 86400, 256 * 1024 * 1024),
+        ({"OMAM_CACHE_DIR": "/tmp/omam", "OMAM_CACHE_TTL": "600", "OMAM_CACHE_MAX_SIZE": "1"},
+         "/tmp/omam", 600, 1024 * 1024),
+        ({"OMAM_CACHE_DIR": "/tmp/omam", "OMAM_CACHE_TTL": "abc"}, "/tmp/omam", 86400, 256 * 1024 * 1024),
+    ])
+    def test_from_env(self, env, cache_dir, ttl, max_size, monkeypatch):
+        for name in ("OMAM_CACHE_DIR", "OMAM_CACHE_TTL", "OMAM_CACHE_MAX_SIZE"):
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        cache = ResponseCache.from_env()
+        assert (cache.cache_dir, cache.ttl, cache.max_size) == (cache_dir, ttl, max_size)
+
+
+class TestGetOmeCached(object):
+
+    @pytest.fixture
+    def rest_obj(self):
+        return MagicMock(hostname="192.168.0.1", port=443, appliance_version=None)
+
+    def test_get_ome_cached_disabled(self, rest_obj, monkeypatch, mocker):
+        monkeypatch.delenv("OMAM_CACHE_DIR", raising=False)
+        version_mock = mocker.patch(MODULE_UTIL_PATH + 'cache.get_ome_version')
+        fetch = MagicMock(return_value=[{"Id": 1}])
+        assert get_ome_cached(rest_obj, "JobService/JobTypes", fetch) == [{"Id": 1}]
+        assert get_ome_cached(rest_obj, "JobService/JobTypes", fetch) == [{"Id": 1}]
+        assert fetch.call_count == 2
+        version_mock.assert_not_called()
+
+    def test_get_ome_cached_version(self, rest_obj, tmp_path, monkeypatch, mocker):
+        monkeypatch.setenv("OMAM_CACHE_DIR", str(tmp_path))
+        version_mock = mocker.patch(MODULE_UTIL_PATH + 'cache.get_ome_version', return_value="3.10.0")
+        fetch = MagicMock(side_effect=[[{"Id": 1}], [{"Id": 2}]])
+        assert get_ome_cached(rest_obj, "JobService/JobTypes", fetch) == [{"Id": 1}]
+        assert get_ome_cached(rest_obj, "JobService/JobTypes", fetch) == [{"Id": 1}]
+        version_mock.assert_called_once_with(rest_obj)
+        upgraded = MagicMock(hostname="192.168.0.1", port=443, appliance_version="4.0.0")
+        assert get_ome_cached(upgraded, "JobService/JobTypes", fetch) == [{"Id": 2}]
+        assert fetch.call_count == 2
+
+    def test_get_ome_cached_paginated_report(self, rest_obj, tmp_path, monkeypatch, mocker):
+        monkeypatch.setenv("OMAM_CACHE_DIR", str(tmp_path))
+        mocker.patch(MODULE_UTIL_PATH + 'cache.get_ome_version', return_value="4.0.0")
+        http_resp = MagicMock()
+        http_resp.read.return_value = b'{"@odata.count": 1, "value": [{"@odata.id": "/api/1", "Id": 1}]}'
+        rest_obj.invoke_request.side_effect = lambda *args, **kwargs: OpenURLResponse(http_resp, kwargs.get("strip_odata"))
+        uri = "AlertService/AlertCategories"
+        with pytest.raises(TypeError):
+            get_ome_cached(rest_obj, uri, lambda: get_all_data_with_pagination(rest_obj, uri, strip_odata=True))
+        assert not list(ResponseCache(str(tmp_path)).entries())
+
+        def fetch():
+            return get_all_data_with_pagination(rest_obj, uri, strip_odata=True)["report_list"]
+        assert get_ome_cached(rest_obj, uri, fetch) == [{"Id": 1}]
+        assert get_ome_cached(rest_obj, uri, fetch) == [{"Id": 1}]
+        assert rest_obj.invoke_request.call_count == 2
+        assert len(list(ResponseCache(str(tmp_path)).entries())) == 1
+
+
+REGISTRY = [
+    {"AttributeName": "SystemModelName", "ReadOnly": True, "Type": "String"},
+    {"AttributeName": "NumLock", "ReadOnly": False, "Type": "Enumeration",
+     "Value": [{"ValueName": "On", "ValueDisplayName": "Enabled"}, {"ValueName": "Off", "ValueDisplayName": "Disabled"}]},
+    {"AttributeName": "MemTest", "Readonly": False, "Type": "Integer", "LowerBound": 0, "UpperBound": 10},
+]
+
+
+class TestRegistryIndex(object):
+
+    def test_build_registry_index(self):
+        assert build_registry_index(REGISTRY) == {
+            "SystemModelName": {"ReadOnly": True, "Type": "String"},
+            "NumLock": {"ReadOnly": False, "Type": "Enumeration", "Values": ["On", "Off"]},
+            "MemTest": {"ReadOnly": False, "Type": "Integer", "LowerBound": 0, "UpperBound": 10}}
+        assert build_registry_index(REGISTRY, "ValueDisplayName")["NumLock"]["Values"] == ["Enabled", "Disabled"]
+
+    def test_get_registry_index(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OMAM_CACHE_DIR", str(tmp_path))
+        fetch = MagicMock(return_value=REGISTRY)
+        key = ["BiosAttributeRegistry", "PowerEdge R750", "1.7.5"]
+        index = get_registry_index(key, fetch)
+        assert index["NumLock"]["Values"] == frozenset(["On", "Off"])
+        assert get_registry_index(key, fetch) == index
+        fetch.assert_called_once_with()
+        get_registry_index(["BiosAttributeRegistry", "PowerEdge R750", "1.8.0"], fetch)
+        get_registry_index(["BiosAttributeRegistry", None, "1.7.5"], fetch)
+        assert fetch.call_count == 3
+
+    def test_get_registry_index_disabled(self, monkeypatch):
+        monkeypatch.delenv("OMAM_CACHE_DIR", raising=False)
+        fetch = MagicMock(return_value=REGISTRY)
+        get_registry_index(["BiosAttributeRegistry", "PowerEdge R750", "1.7.5"], fetch)
+        get_registry_index(["BiosAttributeRegistry", "PowerEdge R750", "1.7.5"], fetch)
+        assert fetch.call_count == 2
+
+
+class TestSessionCache(object):
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return SessionCache(str(tmp_path / "sessions"))
+
+    def test_session_key(self):
+        key = SessionCache.session_key(BASE_URL, "root", "password")
+        assert key == SessionCache.session_key(BASE_URL, "root", "password")
+        assert key != SessionCache.session_key(BASE_URL, "root", "new_password")
+        assert key != SessionCache.session_key("https://192.168.0.2:443", "root", "password")
+        assert "password" not in str(key)
+
+    def test_acquire(self, cache):
+        key = SessionCache.session_key(BASE_URL, "root", "password")
+        create = MagicMock(side_effect=[SESSION, dict(SESSION, Id="2", Token="new_token")])
+        validate = MagicMock(side_effect=[True, False])
+        assert cache.acquire(key, create, validate) == SESSION
+        assert cache.acquire(key, create, validate) == SESSION
+        assert cache.acquire(key, create, validate)["Token"] == "new_token"
+        assert cache.get(key)["Token"] == "new_token"
+        assert create.call_count == 2
+        assert oct(os.stat(cache._path(key)).st_mode & 0o777) == oct(0o600)
+
+    def test_purge(self, cache, mocker):
+        open_url_mock = mocker.patch(MODULE_UTIL_PATH + 'cache.urls.open_url',
+                                     side_effect=[None, Exception("unreachable")])
+        cache.set(SessionCache.session_key(BASE_URL, "root", "password"), SESSION)
+        cache.set(SessionCache.session_key(BASE_URL, "admin", "password"), dict(SESSION, Id="2"))
+        assert cache.purge() == 2
+        assert open_url_mock.call_count == 2
+        assert open_url_mock.call_args[1]["method"] == "DELETE"
+        assert open_url_mock.call_args[1]["headers"] == {"X-Auth-Token": "token"}
+        assert list(cache.entries()) == []
+
+    def test_evict_closes_expired_sessions(self, cache, mocker):
+        open_url_mock = mocker.patch(MODULE_UTIL_PATH + 'cache.urls.open_url')
+        expired_key = SessionCache.session_key(BASE_URL, "root", "password")
+        cache.set(expired_key, SESSION)
+        os.utime(cache._path(expired_key), (time.time() - cache.ttl - 10, time.time() - cache.ttl - 10))
+        cache.set(SessionCache.session_key(BASE_URL, "admin", "password"), dict(SESSION, Id="2", Token="new_token"))
+        assert not os.path.exists(cache._path(expired_key))
+        open_url_mock.assert_called_once()
+        assert open_url_mock.call_args[0][0] == SESSION["Url"]
+        assert open_url_mock.call_args[1]["method"] == "DELETE"
+        assert open_url_mock.call_args[1]["headers"] == {"X-Auth-Token": "token"}
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import connection_pool
+from ansible_collections.dellemc.openmanage.plugins.module_utils.connection_pool import ConnectionPool, open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import MultipartFileBody
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+URLS_OPEN_URL = 'connection_pool.urls.open_url'
+POOL_KWARGS = {"method": "GET", "validate_certs": False, "use_proxy": False, "timeout": 5,
+               "follow_redirects": "all"}
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, val in (headers or {}).items():
+            self.send_header(key, val)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.path == "/redirect":
+            self._reply(302, {}, {"Location": "/api"})
+        elif self.path == "/missing":
+            self._reply(404, {"error": "not found"})
+        else:
+            self._reply(200, {"path": self.path, "auth": self.headers.get("Authorization")})
+
+    def do_POST(self):
+        self.server.connections.add(self.client_address)
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply(201, {"data": self.rfile.read(length).decode()})
+
+
+class TestConnectionPool(object):
+
+    @pytest.fixture
+    def server(self):
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        httpd.daemon_threads = True
+        httpd.handle_error = lambda request, client_address: None
+        httpd.connections = set()
+        thread = threading.Thread(target=httpd.serve_forever)
+        thread.daemon = True
+        thread.start()
+        yield httpd
+        connection_pool._POOL.clear()
+        httpd.shutdown()
+        httpd.server_close()
+
+    def _url(self, server, path):
+        return "http://127.0.0.1:{0}{1}".format(server.server_address[1], path)
+
+    def test_open_url_reuses_connection(self, server):
+        for dummy in range(3):
+            resp = open_url(self._url(server, "/api"), **POOL_KWARGS)
+            assert resp.getcode() == 200
+            assert json.loads(resp.read())["path"] == "/api"
+        assert len(server.connections) == 1
+
+    def test_open_url_basic_auth_and_post(self, server):
+        kwargs = dict(POOL_KWARGS, method="POST", url_username="user", url_password="pwd",
+                      force_basic_auth=True)
+        resp = open_url(self._url(server, "/api"), data=json.dumps({"Key": "Value"}), **kwargs)
+        assert resp.getcode() == 201
+        assert json.loads(json.loads(resp.read())["data"]) == {"Key": "Value"}
+        resp = open_url(self._url(server, "/api"), **dict(kwargs, method="GET"))
+        assert json.loads(resp.read())["auth"] == "Basic dXNlcjpwd2Q="
+
+    @pytest.mark.parametrize("pool_size", [4, 0])
+    def test_open_url_streamed_body(self, pool_size, server, tmp_path, mocker):
+        mocker.patch(MODULE_UTIL_PATH + 'connection_pool._POOL', ConnectionPool(pool_size))
+        image = tmp_path / "component.exe"
+        image.write_bytes(b"firmware" * 1000)
+        body = MultipartFileBody(str(image), chunk_size=1024)
+        resp = open_url(self._url(server, "/api"), data=body, **dict(POOL_KWARGS, method="POST", headers=body.headers))
+        assert json.loads(resp.read())["data"].encode() == b"".join(body)
+
+    def test_open_url_follows_redirect(self, server):
+        resp = open_url(self._url(server, "/redirect"), **POOL_KWARGS)
+        assert json.loads(resp.read())["path"] == "/api"
+        assert len(server.connections) == 1
+
+    def test_open_url_http_error(self, server):
+        with pytest.raises(HTTPError) as err:
+            open_url(self._url(server, "/missing"), **POOL_KWARGS)
+        assert err.value.code == 404
+        assert json.load(err.value) == {"error": "not found"}
+        resp = open_url(self._url(server, "/api"), **POOL_KWARGS)
+        assert resp.getcode() == 200
+        assert len(server.connections) == 1
+
+    def test_open_url_fallback(self, mocker):
+        urls_mock = mocker.patch(MODULE_UTIL_PATH + URLS_OPEN_URL, return_value="response")
+        assert open_url("https://testhost.com/api", unix_socket="/tmp/sock", **POOL_KWARGS) == "response"
+        assert open_url("https://testhost.com/api", **dict(POOL_KWARGS, follow_redirects="safe")) == "response"
+        assert urls_mock.call_count == 2
+
+    def test_open_url_pool_disabled(self, mocker):
+        urls_mock = mocker.patch(MODULE_UTIL_PATH + URLS_OPEN_URL, return_value="response")
+        mocker.patch(MODULE_UTIL_PATH + 'connection_pool._POOL', ConnectionPool(0))
+        assert open_url("https://testhost.com/api", **POOL_KWARGS) == "response"
+        urls_mock.assert_called_once()
+
+    def test_connection_pool_maxsize(self, mocker):
+        pool = ConnectionPool(1)
+        conn1, conn2 = mocker.MagicMock(), mocker.MagicMock()
+        pool.put("key", conn1)
+        pool.put("key", conn2)
+        conn2.close.assert_called_once()
+        assert pool.get("key") is conn1
+        assert pool.get("key") is None
+
+    @pytest.mark.parametrize("env_value, size", [("8", 8), ("0", 0), ("abc", 4)])
+    def test_get_pool_size(self, env_value, size, monkeypatch):
+        monkeypatch.setenv("OMAM_HTTP_POOL_SIZE", env_value)
+        assert connection_pool.get_pool_size() == size
+
+    def test_get_ssl_context_is_shared(self):
+        ctx = connection_pool.get_ssl_context(validate_certs=False)
+        assert ctx is connection_pool.get_ssl_context(validate_certs=False)
+        assert ctx.check_hostname is False
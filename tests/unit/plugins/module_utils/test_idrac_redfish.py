@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.3.0
-# Copyright (C) 2023 Dell Inc.
+# Version 9.10.0
+# Copyright (C) 2023-2025 Dell Inc.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 # All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
@@ -17,8 +17,10 @@ __metaclass__ = type
 import pytest
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
-from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, OpenURLResponse, \
+    JobEventListener, run_on_idrac_hosts, exit_idrac_hosts
 from mock import MagicMock
+import io
 import json
 import os
 
@@ -28,7 +30,7 @@ TEST_PATH = "/testpath"
 INVOKE_REQUEST = 'idrac_redfish.iDRACRedfishAPI.invoke_request'
 JOB_COMPLETE = 'idrac_redfish.iDRACRedfishAPI.wait_for_job_complete'
 API_TASK = '/api/tasks'
-SLEEP_TIME = 'idrac_redfish.time.sleep'
+SLEEP_TIME = 'perf.time.sleep'
 
 
 class TestIdracRedfishRest(object):
@@ -116,6 +118,41 @@ class TestIdracRedfishRest(object):
             with iDRACRedfishAPI(module_params, req_session) as obj:
                 obj.invoke_request(TEST_PATH, "GET")
 
+    def test_invoke_request_session_cache(self, module_params, tmp_path, monkeypatch, mocker):
+        monkeypatch.setenv("OMAM_SESSION_CACHE_DIR", str(tmp_path))
+        calls, alive = [], set()
+
+        def open_url(url, data=None, **kwargs):
+            token = kwargs["headers"].get("X-Auth-Token")
+            calls.append((kwargs["method"], url.split(":443")[-1]))
+            resp = MagicMock()
+            resp.getcode.return_value = 200
+            resp.headers = {}
+            resp.read.return_value = json.dumps({})
+            if kwargs["method"] == "POST":
+                resp.headers = {"X-Auth-Token": "token"}
+                resp.read.return_value = json.dumps({"Id": "1"})
+                alive.add("token")
+            elif token not in alive:
+                raise HTTPError(url, 401, "Unauthorized", {}, None)
+            return resp
+
+        mocker.patch(MODULE_UTIL_PATH + OPEN_URL, side_effect=open_url)
+        for dummy in range(2):
+            with iDRACRedfishAPI(module_params, True) as obj:
+                obj.invoke_request(TEST_PATH, "GET")
+        assert calls == [("POST", "/redfish/v1/Sessions"), ("GET", TEST_PATH),
+                         ("GET", "/redfish/v1/Sessions/1"), ("GET", TEST_PATH)]
+        alive.clear()
+        with pytest.raises(HTTPError):
+            with iDRACRedfishAPI(module_params, True) as obj:
+                obj.invoke_request(TEST_PATH, "GET")
+                alive.clear()
+                obj.invoke_request(TEST_PATH, "GET")
+                alive.clear()
+                obj.invoke_request(TEST_PATH, "GET")
+        assert calls.count(("POST", "/redfish/v1/Sessions")) == 3
+
     @pytest.mark.parametrize("query_params", [
         {"inp": {"$filter": "UserName eq 'admin'"},
             "out": "%24filter=UserName+eq+%27admin%27"},
@@ -161,6 +198,20 @@ class TestIdracRedfishRest(object):
         reason_ret = ourl.reason
         assert reason_ret == "returning reason"
 
+    def test_download_to(self, tmp_path):
+        resp = MagicMock()
+        resp.read.side_effect = [b"PK\x03", b"\x04", b""]
+        resp.headers = {"Content-Length": "4"}
+        ourl = OpenURLResponse(resp, lazy=True)
+        resp.read.assert_not_called()
+        ourl.download_to(str(tmp_path / "sa.zip"), chunk_size=3)
+        assert (tmp_path / "sa.zip").read_bytes() == b"PK\x03\x04"
+        assert resp.read.call_args_list[0][0] == (3,)
+        assert ourl.body is None
+        buffered = OpenURLResponse(MagicMock(read=MagicMock(return_value=b"a\r\nb")))
+        buffered.download_to(str(tmp_path / "diagnostics.txt"), strip_cr=True)
+        assert (tmp_path / "diagnostics.txt").read_bytes() == b"a\nb"
+
     @pytest.mark.parametrize("task_inp", [{"job_wait": True, "job_status": {"TaskState": "Completed"}}])
     def test_wait_for_job_complete(self, mocker, mock_response, task_inp, idrac_redfish_object):
         mock_response.json_data = task_inp.get("job_status")
@@ -219,6 +270,32 @@ class TestIdracRedfishRest(object):
             "job_wait"), inp_data.get("reboot"), inp_data.get("apply_update"))
         assert ret_resp.json_data is mock_response.json_data
 
+    def test_open_job_events(self, mocker, monkeypatch, idrac_redfish_object):
+        stream = io.BytesIO(b'id: 1\ndata: {"Events": [{"MessageArgs": ["JID_123"]}]}\n\n')
+        open_url_mock = mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.urls.open_url', return_value=stream)
+        monkeypatch.delenv("OMAM_JOB_WAIT_MODE", raising=False)
+        assert idrac_redfish_object.open_job_events([API_TASK]) is None
+        monkeypatch.setenv("OMAM_JOB_WAIT_MODE", "sse")
+        listener = idrac_redfish_object.open_job_events(["/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123"])
+        assert listener.event.wait(5) is True
+        listener.close()
+        assert open_url_mock.call_args[0][0].endswith("/redfish/v1/SSE")
+        assert open_url_mock.call_args[1]["headers"]["Accept"] == "text/event-stream"
+        assert idrac_redfish_object._headers["Accept"] == "application/json"
+        open_url_mock.side_effect = HTTPError(API_TASK, 404, "Not Found", {}, None)
+        assert idrac_redfish_object.open_job_events([API_TASK]) is None
+
+    def test_wait_for_job_completion_with_events(self, mocker, mock_response, idrac_redfish_object):
+        running, completed = MagicMock(), MagicMock()
+        running.json_data = {"PercentComplete": 50, "JobState": "Running"}
+        completed.json_data = {"PercentComplete": 100, "JobState": "Completed"}
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=[running, completed])
+        mocker.patch(MODULE_UTIL_PATH + SLEEP_TIME, return_value=None)
+        listener = JobEventListener(io.BytesIO(b'data: {"MessageArgs": ["JID_123"]}\n'), ["JID_123"])
+        mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.iDRACRedfishAPI.open_job_events', return_value=listener)
+        ret_resp = idrac_redfish_object.wait_for_job_completion("/redfish/v1/JobService/Jobs/JID_123", True)
+        assert ret_resp is completed
+
     @pytest.mark.parametrize("share_inp", [
         {"share_ip": "share_ip", "share_name": "share_name", "share_type": "share_type",
          "file_name": "file_name", "username": "username", "password": "password",
@@ -343,3 +420,51 @@ class TestIdracRedfishRest(object):
                      return_value=mock_response)
         result = idrac_redfish_object._get_omam_ca_env()
         assert result is None
+
+    def test_run_on_idrac_hosts(self, mocker, module_params):
+        module_params.update({"validate_certs": False, "max_workers": 4, "hosts": [
+            {"idrac_ip": "192.168.0.1", "idrac_user": None, "idrac_password": None, "idrac_port": None, "timeout": None},
+            {"idrac_ip": "192.168.0.2", "idrac_user": "admin", "idrac_password": "pwd", "idrac_port": 8443, "timeout": 5},
+            {"idrac_ip": "192.168.0.3"},
+            {"idrac_ip": "192.168.0.4"}]})
+        module = MagicMock(params=module_params)
+
+        def fetch(idrac, params):
+            if params["idrac_ip"] == "192.168.0.3":
+                raise HTTPError("https://192.168.0.3", 400, "Bad Request", {}, io.StringIO('{"error": "out"}'))
+            if params["idrac_ip"] == "192.168.0.4":
+                raise URLError("unreachable")
+            return {"params": (params["idrac_user"], params["idrac_port"], params.get("timeout"), params["validate_certs"])}
+
+        mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.iDRACRedfishAPI')
+        results = run_on_idrac_hosts(module, fetch)
+        assert [result["idrac_ip"] for result in results] == ["192.168.0.1", "192.168.0.2", "192.168.0.3", "192.168.0.4"]
+        assert results[0] == {"idrac_ip": "192.168.0.1", "failed": False, "params": ("username", "443", None, False)}
+        assert results[1]["params"] == ("admin", 8443, 5, False)
+        assert results[2]["failed"] is True and results[2]["error_info"] == {"error": "out"}
+        assert results[3]["failed"] is True and results[3]["unreachable"] is True
+
+    def test_run_on_idrac_hosts_missing_credentials(self, mocker):
+        module = MagicMock(params={"idrac_user": None, "idrac_password": None, "max_workers": 4, "hosts": [
+            {"idrac_ip": "192.168.0.1", "idrac_user": "admin", "idrac_password": "pwd"},
+            {"idrac_ip": "192.168.0.2", "idrac_user": "admin", "idrac_password": None},
+            {"idrac_ip": "192.168.0.3"}]})
+        module.fail_json.side_effect = Exception("fail_json")
+        idrac_mock = mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.iDRACRedfishAPI')
+        with pytest.raises(Exception):
+            run_on_idrac_hosts(module, MagicMock())
+        assert module.fail_json.call_args[1]["msg"] == "The credentials of the host(s) '192.168.0.2,192.168.0.3' are " \
+                                                       "not provided. Provide idrac_user and idrac_password for each " \
+                                                       "of these hosts or at the top level."
+        idrac_mock.assert_not_called()
+
+    @pytest.mark.parametrize("results, failed", [
+        ([{"idrac_ip": "192.168.0.1", "failed": False}, {"idrac_ip": "192.168.0.2", "failed": True}], False),
+        ([{"idrac_ip": "192.168.0.1", "failed": True}], True)])
+    def test_exit_idrac_hosts(self, results, failed, mocker):
+        mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.run_on_idrac_hosts', return_value=results)
+        module = MagicMock()
+        exit_idrac_hosts(module, MagicMock())
+        kwargs = module.exit_json.call_args_list[0][1]
+        assert kwargs["hosts"] == results
+        assert kwargs.get("failed", False) is failed
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.0.0
-# Copyright (C) 2019-2023 Dell Inc.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 # All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
@@ -18,6 +18,7 @@ import pytest
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_page_links, build_or_filters
 from mock import MagicMock
 import json
 
@@ -122,6 +123,43 @@ class TestOMERest(object):
             with RestOME(module_params, req_session) as obj:
                 obj.invoke_request(TEST_PATH, "GET")
 
+    def test_invoke_request_session_cache(self, module_params, tmp_path, monkeypatch, mocker):
+        monkeypatch.setenv("OMAM_SESSION_CACHE_DIR", str(tmp_path))
+        calls, alive = [], set()
+
+        def open_url(url, data=None, **kwargs):
+            token = kwargs["headers"].get("X-Auth-Token")
+            calls.append((kwargs["method"], url.split("/api/")[-1]))
+            resp = MagicMock()
+            resp.getcode.return_value = 200
+            resp.headers = {}
+            resp.read.return_value = json.dumps({})
+            if kwargs["method"] == "POST":
+                session_id = len(alive) + 1
+                resp.headers = {"X-Auth-Token": "token{0}".format(session_id)}
+                resp.read.return_value = json.dumps({"Id": session_id})
+                alive.add(resp.headers["X-Auth-Token"])
+            elif token not in alive:
+                raise HTTPError(url, 401, "Unauthorized", {}, None)
+            return resp
+
+        mocker.patch(MODULE_UTIL_PATH + OME_OPENURL, side_effect=open_url)
+        for dummy in range(2):
+            with RestOME(module_params, True) as obj:
+                obj.invoke_request("GET", DEVICE_API)
+        assert calls == [("POST", "SessionService/Sessions"), ("GET", DEVICE_API),
+                         ("GET", "SessionService/Sessions('1')"), ("GET", DEVICE_API)]
+        del calls[:]
+        alive.clear()
+        with RestOME(module_params, True) as obj:
+            obj.invoke_request("GET", DEVICE_API)
+            alive.clear()
+            obj.invoke_request("GET", DEVICE_API)
+        assert calls == [("GET", "SessionService/Sessions('1')"), ("POST", "SessionService/Sessions"),
+                         ("GET", DEVICE_API), ("GET", DEVICE_API), ("POST", "SessionService/Sessions"),
+                         ("GET", DEVICE_API)]
+        assert obj.session_id is None
+
     def test_get_all_report_details(self, mock_response, mocker, module_params):
         mock_response.success = True
         mock_response.status_code = 200
@@ -133,6 +171,50 @@ class TestOMERest(object):
         assert reports == {"resp_obj": mock_response,
                            "report_list": list(range(50)) + (list(range(50)))}
 
+    def test_get_all_report_details_parallel_pages(self, mocker, ome_object):
+        def mock_invoke_request(method, uri, query_param=None):
+            resp = MagicMock()
+            skip = (query_param or {}).get("$skip", 0)
+            top = (query_param or {}).get("$top", 10)
+            resp.json_data = {ODATA_COUNT: 45, "value": list(range(skip, min(skip + top, 45)))}
+            return resp
+
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=mock_invoke_request)
+        reports = ome_object.get_all_report_details(DEVICE_API, max_workers=4)
+        assert reports["report_list"] == list(range(45))
+        assert invoke_mock.call_count == 5
+        assert invoke_mock.call_args_list[0][1] == {"query_param": None}
+
+        invoke_mock.reset_mock()
+        reports = ome_object.get_all_report_details(DEVICE_API, page_size=20, max_workers=4)
+        assert reports["report_list"] == list(range(45))
+        assert invoke_mock.call_args_list[0][1] == {"query_param": {"$top": 20}}
+        assert sorted(call[1]["query_param"]["$skip"] for call in invoke_mock.call_args_list[1:]) == [20, 40]
+
+        invoke_mock.reset_mock()
+        reports = ome_object.get_all_report_details(DEVICE_API, query_param={"$expand": "Detail"})
+        assert reports["report_list"] == list(range(45))
+        assert all(call[1]["query_param"]["$expand"] == "Detail" for call in invoke_mock.call_args_list)
+
+    def test_get_all_report_details_capped_pages(self, mocker, ome_object):
+        def mock_invoke_request(method, uri, query_param=None):
+            resp = MagicMock()
+            skip = (query_param or {}).get("$skip", 0)
+            # the appliance returns at most 4 reports for a page requested with $top
+            top = min((query_param or {}).get("$top", 10), 4) if query_param else 10
+            resp.json_data = {ODATA_COUNT: 45, "value": list(range(skip, min(skip + top, 45)))}
+            return resp
+
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=mock_invoke_request)
+        reports = ome_object.get_all_report_details(DEVICE_API, max_workers=4)
+        assert reports["report_list"] == list(range(45))
+
+        invoke_mock.reset_mock()
+        reports = ome_object.get_all_report_details(DEVICE_API, page_size=10, max_workers=4)
+        assert reports["report_list"] == list(range(45))
+        assert invoke_mock.call_args_list[0][1] == {"query_param": {"$top": 10}}
+        assert invoke_mock.call_count == 12
+
     def test_get_report_list_error_case(self, mock_response, mocker, ome_object):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -226,6 +308,79 @@ class TestOMERest(object):
         reports = ome_object.get_all_items_with_pagination(DEVICE_API)
         assert reports == {"total_count": 100, "value": list(range(100))}
 
+    def test_get_all_items_with_pagination_parallel_pages(self, mocker, ome_object):
+        def mock_invoke_request(method, uri, query_param=None):
+            resp = MagicMock()
+            skip = int(uri.split("$skip=")[-1]) if "$skip=" in uri else 0
+            data = {ODATA_COUNT: 25, "value": list(range(skip, min(skip + 10, 25)))}
+            if skip + 10 < 25:
+                data["@odata.nextLink"] = "/api/DeviceService/Devices?$top=10&$skip={0}".format(skip + 10)
+            resp.json_data = data
+            return resp
+
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=mock_invoke_request)
+        reports = ome_object.get_all_items_with_pagination(DEVICE_API, max_workers=4)
+        assert reports == {"total_count": 25, "value": list(range(25))}
+        assert [each[0][1] for each in invoke_mock.call_args_list] == [
+            DEVICE_API, "/DeviceService/Devices?$top=10&$skip=10", "/DeviceService/Devices?$top=10&$skip=20"]
+
+    @pytest.mark.parametrize("params", [
+        {"link": "/api/DeviceService/Devices?$skip=50&$top=50", "count": 160,
+         "out": ["/api/DeviceService/Devices?$skip=50&$top=50", "/api/DeviceService/Devices?$skip=100&$top=50",
+                 "/api/DeviceService/Devices?$skip=150&$top=50"]},
+        {"link": "/api/JobService/Jobs?$top=20&%24skip=20&$filter=x", "count": 40,
+         "out": ["/api/JobService/Jobs?$top=20&%24skip=20&$filter=x"]},
+        {"link": "/api/DeviceService/Devices2", "count": 100, "out": []},
+        {"link": "/api/DeviceService/Devices?$skip=50&$top=50", "count": None, "out": []},
+    ])
+    def test_get_page_links(self, params):
+        assert get_page_links(params["link"], params["count"]) == params["out"]
+
+    def test_iter_items(self, mocker, ome_object):
+        pages = {None: {"value": [1, 2], "@odata.nextLink": "/api/DeviceService/Devices?$skip=2&$top=2"},
+                 "2": {"value": [3, 4], "@odata.nextLink": "/api/DeviceService/Devices?$skip=4&$top=2"},
+                 "4": {"value": [5]}}
+
+        def mock_invoke_request(method, uri, query_param=None):
+            resp = MagicMock()
+            resp.json_data = pages[query_param.get("$skip")]
+            return resp
+
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=mock_invoke_request)
+        query = {"$filter": "Type eq 1000"}
+        assert list(ome_object.iter_items(DEVICE_API, query_param=query)) == [1, 2, 3, 4, 5]
+        assert invoke_mock.call_args_list[1][1]["query_param"] == {"$skip": "2", "$top": "2", "$filter": "Type eq 1000"}
+        invoke_mock.reset_mock()
+        items = ome_object.iter_items(DEVICE_API, query_param=query)
+        assert next(items) == 1
+        assert invoke_mock.call_count == 1
+
+    def test_build_or_filters(self):
+        assert build_or_filters("DeviceServiceTag", ["ABC", "O'K", "ABC"]) == [
+            "DeviceServiceTag eq 'ABC' or DeviceServiceTag eq 'O''K'"]
+        assert build_or_filters("Id", [10, 11]) == ["Id eq 10 or Id eq 11"]
+        assert build_or_filters("Id", [10, 11, 12], max_length=40) == ["Id eq 10 or Id eq 11", "Id eq 12"]
+        assert build_or_filters("Id", []) == []
+
+    def test_get_items_by_filter(self, mocker, ome_object):
+        iter_mock = mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.iter_items', side_effect=[
+            iter([{"Id": 10}]), iter([{"Id": 12}])])
+        mocker.patch(MODULE_UTIL_PATH + 'ome.build_or_filters', return_value=["Id eq 10", "Id eq 12"])
+        items = ome_object.get_items_by_filter(DEVICE_API, "Id", [10, 12], select=["Id", "DeviceServiceTag"],
+                                               max_workers=1)
+        assert items == [{"Id": 10}, {"Id": 12}]
+        assert iter_mock.call_args_list[0][1]["query_param"] == {"$filter": "Id eq 10",
+                                                                 "$select": "Id,DeviceServiceTag"}
+
+    def test_get_items_by_filter_select_unsupported(self, mocker, ome_object):
+        iter_mock = mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.iter_items', side_effect=[
+            HTTPError(TEST_HOST, 400, BAD_REQUEST, {}, None), iter([{"Id": 10}])])
+        assert ome_object.get_items_by_filter(DEVICE_API, "Id", [10], select=["Id"]) == [{"Id": 10}]
+        assert iter_mock.call_args_list[1][1]["query_param"] == {"$filter": "Id eq 10"}
+        iter_mock.side_effect = HTTPError(TEST_HOST, 500, BAD_REQUEST, {}, None)
+        with pytest.raises(HTTPError):
+            ome_object.get_items_by_filter(DEVICE_API, "Id", [10], select=["Id"])
+
     def test_get_all_items_with_pagination_error_case(self, mock_response, mocker, ome_object):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -286,6 +441,20 @@ class TestOMERest(object):
             obj.json_data
         assert e.value.args[0] == "Unable to parse json"
 
+    @pytest.mark.parametrize("strip_odata, expected", [
+        (False, {"@odata.count": 1, "@odata.context": "/api/$metadata",
+                 "value": [{"@odata.id": "/api/DeviceService/Devices(10)", "Id": 10}]}),
+        (True, {"@odata.count": 1, "value": [{"Id": 10}]})])
+    def test_openurlresp_json_data(self, strip_odata, expected, mocker):
+        resp = MagicMock()
+        resp.read.return_value = json.dumps({"@odata.count": 1, "@odata.context": "/api/$metadata",
+                                             "value": [{"@odata.id": "/api/DeviceService/Devices(10)", "Id": 10}]})
+        obj = OpenURLResponse(resp, strip_odata=strip_odata)
+        loads_mock = mocker.patch(MODULE_UTIL_PATH + 'utils.json.loads', wraps=json.loads)
+        assert obj.json_data == expected
+        assert obj.json_data is obj.json_data
+        loads_mock.assert_called_once()
+
     @pytest.mark.parametrize("status_assert", [
         {'id': 2060, 'exist_poll': True, 'job_failed': False,
             'message': "Job Completed successfully."},
@@ -319,7 +488,7 @@ class TestOMERest(object):
         (True, False, "My Message"),
         (False, True, "The job is not complete after 2 seconds.")])
     def test_job_tracking(self, mocker, mock_response, ret_val, ome_object):
-        mocker.patch(MODULE_UTIL_PATH + 'ome.time.sleep',
+        mocker.patch(MODULE_UTIL_PATH + 'perf.time.sleep',
                      return_value=())
         mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST,
                      return_value=mock_response)
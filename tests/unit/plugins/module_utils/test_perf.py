@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from io import BytesIO
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import perf
+from ansible_collections.dellemc.openmanage.plugins.module_utils.connection_pool import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf import PerfRecorder, PerfResultMixin, \
+    path_template, percentile, perf_sleep
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+
+
+@pytest.fixture
+def recorder(tmp_path, monkeypatch):
+    recorder = PerfRecorder(trace_file=str(tmp_path / "trace.jsonl"))
+    monkeypatch.setattr(perf, "_RECORDER", recorder)
+    return recorder
+
+
+def read_trace(recorder):
+    with open(recorder.trace_file) as trace:
+        return [json.loads(line) for line in trace]
+
+
+class TestPerf(object):
+
+    @pytest.mark.parametrize("url, template", [
+        ("https://192.168.0.1:443/api/DeviceService/Devices", "/api/DeviceService/Devices"),
+        ("https://192.168.0.1:443/api/JobService/Jobs(10)/LastExecutionDetail?$top=50&$skip=100",
+         "/api/JobService/Jobs({id})/LastExecutionDetail?$skip&$top"),
+        ("https://192.168.0.1:443/api/SessionService/Sessions('a1b2')", "/api/SessionService/Sessions({id})"),
+        ("https://192.168.0.1/redfish/v1/JobService/Jobs/JID_123456789012", "/redfish/v1/JobService/Jobs/{id}"),
+        ("https://192.168.0.1/redfish/v1/Systems/System.Embedded.1/Storage/RAID.SL.1-1/Drives/Disk.Bay.0:Enclosure.Internal.0-1",
+         "/redfish/v1/Systems/System.Embedded.1/Storage/RAID.SL.1-1/Drives/{id}"),
+        ("https://192.168.0.1/redfish/v1/Sessions/12", "/redfish/v1/Sessions/{id}"),
+        ("https://192.168.0.1/omevv/GatewayService/v1/Consoles/0d8e2c5a-3b6f-4c1e-9a7d-2f4b6e8c0a1b/Profiles",
+         "/omevv/GatewayService/v1/Consoles/{id}/Profiles"),
+    ])
+    def test_path_template(self, url, template):
+        assert path_template(url) == template
+
+    def test_percentile(self):
+        values = list(range(1, 21))
+        assert percentile(values, 50) == 10
+        assert percentile(values, 95) == 19
+        assert percentile([3], 95) == 3
+        assert percentile([], 50) == 0
+
+    @pytest.mark.parametrize("env, enabled, trace_file", [
+        ({}, False, None),
+        ({"OMAM_PERF": "true"}, True, None),
+        ({"OMAM_PERF": "0", "OMAM_PERF_TRACE": "/tmp/trace.jsonl"}, True, "/tmp/trace.jsonl"),
+    ])
+    def test_from_env(self, env, enabled, trace_file, monkeypatch):
+        for name in ("OMAM_PERF", "OMAM_PERF_TRACE"):
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        recorder = PerfRecorder.from_env()
+        assert (recorder.enabled, recorder.trace_file) == (enabled, trace_file)
+
+    def test_disabled_recorder(self):
+        recorder = PerfRecorder()
+        recorder.record_request("GET", "https://192.168.0.1/api/DeviceService/Devices", 200, 0.1)
+        recorder.record_sleep("JobTracker.wait", 10)
+        assert recorder.summary()["requests"] == 0
+        assert recorder.summary()["sleeps"] == []
+
+    def test_summary_and_trace(self, recorder):
+        for latency in (0.1, 0.3, 0.2):
+            recorder.record_request("GET", "https://192.168.0.1/api/JobService/Jobs(1)", 200, latency,
+                                    bytes_received=100)
+        recorder.record_request("POST", "https://192.168.0.1/api/JobService/Jobs", 400, 0.05, bytes_sent=20, retries=1)
+        recorder.record_sleep("JobTracker.wait", 5)
+        recorder.record_sleep("JobTracker.wait", 10)
+        summary = recorder.summary()
+        assert summary["requests"] == 4
+        assert summary["request_time"] == 0.65
+        assert (summary["bytes_sent"], summary["bytes_received"], summary["retries"]) == (20, 300, 1)
+        assert summary["sleep_time"] == 15
+        assert summary["endpoints"][0] == {"method": "GET", "path": "/api/JobService/Jobs({id})", "count": 3,
+                                           "time": 0.6, "max": 0.3, "p50": 0.2, "p95": 0.3, "status": {"200": 3},
+                                           "bytes_sent": 0, "bytes_received": 300, "retries": 0}
+        assert summary["endpoints"][1]["status"] == {"400": 1}
+        assert summary["sleeps"] == [{"label": "JobTracker.wait", "count": 2, "time": 15}]
+        events = read_trace(recorder)
+        assert [event["type"] for event in events] == ["request"] * 4 + ["sleep"] * 2
+        assert events[3]["path"] == "/api/JobService/Jobs" and events[3]["retries"] == 1
+        assert all("ts" in event and "pid" in event and "thread" in event for event in events)
+
+    def test_trace_file_not_writable(self, tmp_path):
+        recorder = PerfRecorder(trace_file=str(tmp_path / "missing" / "trace.jsonl"))
+        recorder.record_sleep("JobTracker.wait", 1)
+        assert recorder.trace_file is None
+        assert recorder.summary()["sleep_time"] == 1
+
+    def test_perf_sleep(self, recorder, mocker):
+        sleep_mock = mocker.patch(MODULE_UTIL_PATH + 'perf.time.sleep')
+        perf_sleep(10, "wait_for_job_completion")
+        sleep_mock.assert_called_once_with(10)
+        assert recorder.summary()["sleeps"] == [{"label": "wait_for_job_completion", "count": 1, "time": 10}]
+
+    @pytest.mark.parametrize("method", ["exit_json", "fail_json"])
+    def test_perf_result_mixin(self, method, recorder):
+        class BaseModule(object):
+            _name = "ome_job_info"
+
+            def exit_json(self, **kwargs):
+                self.result = kwargs
+
+            def fail_json(self, msg, **kwargs):
+                self.result = dict(kwargs, msg=msg)
+
+        class Module(PerfResultMixin, BaseModule):
+            pass
+
+        recorder.record_request("GET", "https://192.168.0.1/api/JobService/Jobs", 200, 0.1)
+        module = Module()
+        getattr(module, method)(msg="Successfully fetched the job info")
+        assert module.result["msg"] == "Successfully fetched the job info"
+        assert module.result["perf"]["requests"] == 1
+        assert read_trace(recorder)[-1]["module"] == "ome_job_info"
+
+    def test_perf_result_mixin_disabled(self, monkeypatch):
+        monkeypatch.setattr(perf, "_RECORDER", PerfRecorder())
+
+        class BaseModule(object):
+            def exit_json(self, **kwargs):
+                self.result = kwargs
+
+        class Module(PerfResultMixin, BaseModule):
+            pass
+
+        module = Module()
+        module.exit_json(msg="done")
+        assert module.result == {"msg": "done"}
+
+    def test_open_url_recorded(self, recorder, mocker):
+        headers = {"Content-Length": "512"}
+        mocker.patch(MODULE_UTIL_PATH + 'connection_pool.urls.open_url',
+                     side_effect=[MagicMock(status=200, headers=headers, retries=0),
+                                  HTTPError("https://192.168.0.1/api", 404, "Not Found", {"Content-Length": "10"},
+                                            BytesIO(b"not found!"))])
+        open_url("https://192.168.0.1:443/api/DeviceService/Devices(10)", use_proxy=True, unix_socket="/tmp/sock")
+        with pytest.raises(HTTPError):
+            open_url("https://192.168.0.1:443/api/DeviceService/Devices(11)", data='{"Id": 1}', method="PATCH",
+                     unix_socket="/tmp/sock")
+        endpoints = dict(((endpoint["method"], endpoint["path"]), endpoint) for endpoint in recorder.summary()["endpoints"])
+        assert endpoints[("GET", "/api/DeviceService/Devices({id})")]["bytes_received"] == 512
+        assert endpoints[("PATCH", "/api/DeviceService/Devices({id})")]["status"] == {"404": 1}
+        assert endpoints[("PATCH", "/api/DeviceService/Devices({id})")]["bytes_sent"] == 9
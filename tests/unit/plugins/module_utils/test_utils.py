@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import threading
+import pytest
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import JobTracker, job_getter, \
+    job_tracking, idrac_redfish_job_tracking, MultipartFileBody, RedfishResourceLoader, parse_json, remove_key, run_concurrently, \
+    write_file_atomically
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+SLEEP_PATH = MODULE_UTIL_PATH + 'utils.time.sleep'
+JOB_URI = "JobService/Jobs(1234)"
+
+
+def job_response(data, etag=None, status_code=200):
+    resp = MagicMock()
+    resp.json_data = data
+    resp.body = str(data)
+    resp.status_code = status_code
+    resp.resp.headers = {"ETag": etag} if etag else {}
+    return resp
+
+
+class TestJobTracker(object):
+
+    @pytest.fixture
+    def sleep_mock(self, mocker):
+        return mocker.patch(SLEEP_PATH, return_value=None)
+
+    def test_job_tracker_backoff(self, sleep_mock):
+        running, completed = job_response({"State": "Running"}), job_response({"State": "Completed"})
+        fetch = MagicMock(side_effect=[running, running, running, running, running, completed])
+        tracker = JobTracker(fetch, lambda resp: resp.json_data["State"] == "Completed", max_interval=4)
+        result = tracker.wait([JOB_URI])[JOB_URI]
+        assert result["terminal"] is True
+        assert result["resp"] is completed
+        assert result["polls"] == 6
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [0.5, 1, 2, 4, 4]
+        assert tracker.wait_time == 11.5
+
+    def test_job_tracker_resets_interval_on_change(self, sleep_mock):
+        responses = [job_response({"JobState": "New"}), job_response({"JobState": "New"}),
+                     job_response({"JobState": "Running"}), job_response({"JobState": "Completed"})]
+        tracker = JobTracker(MagicMock(side_effect=responses), lambda resp: resp.json_data["JobState"] == "Completed")
+        assert tracker.wait([JOB_URI])[JOB_URI]["terminal"] is True
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [0.5, 1, 0.5]
+
+    def test_job_tracker_ignores_progress_changes(self, sleep_mock):
+        responses = [job_response({"JobState": "Running", "PercentComplete": percent}) for percent in range(0, 100, 20)]
+        responses.append(job_response({"JobState": "Completed", "PercentComplete": 100}))
+        tracker = JobTracker(MagicMock(side_effect=responses), lambda resp: resp.json_data["JobState"] == "Completed",
+                             max_interval=4)
+        assert tracker.wait([JOB_URI])[JOB_URI]["terminal"] is True
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [0.5, 1, 2, 4, 4]
+
+    def test_job_tracker_state_key(self, sleep_mock):
+        responses = [job_response({"Status": "Queued"}), job_response({"Status": "Queued"}),
+                     job_response({"Status": "Running"}), job_response({"Status": "Done"})]
+        tracker = JobTracker(MagicMock(side_effect=responses), lambda resp: resp.json_data["Status"] == "Done",
+                             state_key=lambda resp: resp.json_data["Status"])
+        assert tracker.wait([JOB_URI])[JOB_URI]["terminal"] is True
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [0.5, 1, 0.5]
+
+    def test_job_tracker_timeout(self, sleep_mock):
+        tracker = JobTracker(MagicMock(return_value=job_response({"State": "Running"})), lambda resp: False,
+                             max_wait_sec=20, max_interval=10)
+        result = tracker.wait([JOB_URI])[JOB_URI]
+        assert result["terminal"] is False
+        assert tracker.wait_time == 20
+
+    def test_job_tracker_multiple_jobs(self, sleep_mock):
+        states = {"job1": iter(["Running", "Completed"]), "job2": iter(["Completed"])}
+        tracker = JobTracker(lambda job: job_response({"State": next(states[job])}),
+                             lambda resp: resp.json_data["State"] == "Completed")
+        results = tracker.wait(["job1", "job2", "job1"])
+        assert list(results) == ["job1", "job2"]
+        assert results["job1"]["polls"] == 2 and results["job2"]["polls"] == 1
+        assert all(result["terminal"] for result in results.values())
+
+    def test_job_tracker_unresponsive(self, sleep_mock):
+        error = URLError("unreachable")
+        fetch = MagicMock(side_effect=[error, error, job_response({"State": "Completed"})])
+        tracker = JobTracker(fetch, lambda resp: True, max_interval=10, max_unresponsive_wait=20)
+        assert tracker.wait([JOB_URI])[JOB_URI]["terminal"] is True
+        fetch.side_effect = [error, error, error]
+        result = tracker.wait([JOB_URI])[JOB_URI]
+        assert result["error"] is error
+        assert result["terminal"] is False
+
+    def test_job_tracker_conditional_get(self, sleep_mock):
+        running = job_response({"State": "Running"}, etag='"1"')
+        not_modified = HTTPError(JOB_URI, 304, "Not Modified", {}, None)
+        fetch = MagicMock(side_effect=[running, not_modified, job_response({}, status_code=304),
+                                       job_response({"State": "Completed"})])
+        tracker = JobTracker(fetch, lambda resp: resp.json_data["State"] == "Completed", conditional=True)
+        result = tracker.wait([JOB_URI])[JOB_URI]
+        assert result["terminal"] is True
+        assert fetch.call_args_list[1][1] == {"headers": {"If-None-Match": '"1"'}}
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [0.5, 1, 2]
+
+    def test_job_tracker_conditional_multiple_jobs(self, sleep_mock):
+        fetch = MagicMock(return_value=job_response({"State": "Completed"}, etag='"1"'))
+        tracker = JobTracker(fetch, lambda resp: resp.json_data["State"] == "Completed", conditional=True)
+        with pytest.raises(ValueError):
+            tracker.wait([JOB_URI, JOB_URI + "1"])
+        fetch.assert_not_called()
+        tracker = JobTracker(fetch, lambda resp: resp.json_data["State"] == "Completed", conditional=True,
+                             max_workers=1)
+        results = tracker.wait([JOB_URI, JOB_URI + "1"])
+        assert all(result["terminal"] for result in results.values())
+
+    def test_job_tracker_wake_event(self, sleep_mock):
+        wake_event = threading.Event()
+        wake_event.set()
+        fetch = MagicMock(side_effect=[job_response({"State": "Running"}), job_response({"State": "Completed"})])
+        tracker = JobTracker(fetch, lambda resp: resp.json_data["State"] == "Completed", max_interval=60,
+                             min_interval=60, wake_event=wake_event)
+        assert tracker.wait([JOB_URI])[JOB_URI]["terminal"] is True
+        assert tracker.wait_time < 60
+        assert not wake_event.is_set()
+        sleep_mock.assert_not_called()
+
+    def test_job_getter_drops_conditional_header(self):
+        rest_obj = MagicMock()
+        rest_obj._headers = {"Accept": "application/json"}
+        rest_obj.invoke_request.side_effect = lambda *args, **kwargs: rest_obj._headers.update(kwargs["headers"])
+        job_getter(rest_obj, uri_first=True)(JOB_URI, headers={"If-None-Match": '"1"'})
+        rest_obj.invoke_request.assert_called_once_with(JOB_URI, 'GET', headers={"If-None-Match": '"1"'})
+        assert rest_obj._headers == {"Accept": "application/json"}
+
+    @pytest.mark.parametrize("params", [
+        {"state": 2060, "failed": False, "msg": "Job tracking completed."},
+        {"state": 2070, "failed": True, "msg": "Job is in Failed state."}])
+    def test_job_tracking(self, params, sleep_mock):
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.side_effect = [job_response({"LastRunStatus": {"Id": 2050}}),
+                                               job_response({"LastRunStatus": {"Id": params["state"]}})]
+        job_failed, msg, job_dict, wait_time = job_tracking(rest_obj, JOB_URI)
+        assert (job_failed, msg) == (params["failed"], params["msg"])
+        assert job_dict == {"LastRunStatus": {"Id": params["state"]}}
+        assert wait_time == 0.5
+        rest_obj.invoke_request.assert_called_with('GET', JOB_URI)
+
+    def test_idrac_redfish_job_tracking_timeout(self, sleep_mock):
+        idrac = MagicMock()
+        idrac.invoke_request.return_value = job_response({"JobState": "Running"})
+        job_failed, msg, job_dict, wait_time = idrac_redfish_job_tracking(idrac, JOB_URI, max_job_wait_sec=30)
+        assert job_failed is True
+        assert msg == "Job tracking started."
+        assert wait_time == 30
+        idrac.invoke_request.assert_called_with(JOB_URI, 'GET')
+
+
+class TestRedfishResourceLoader(object):
+    COLLECTION_URI = "/redfish/v1/Systems/System.Embedded.1/Storage/RAID.SL.5-1/Volumes"
+
+    def _idrac(self, collection):
+        idrac = MagicMock()
+
+        def invoke_request(uri, method):
+            if uri.startswith(self.COLLECTION_URI + "?"):
+                if collection is None:
+                    raise HTTPError(uri, 400, "Bad Request", {}, None)
+                return MagicMock(json_data=collection)
+            if uri == self.COLLECTION_URI:
+                return MagicMock(json_data={"Members": [{"@odata.id": "{0}/{1}".format(uri, i)} for i in range(3)]})
+            return MagicMock(json_data={"@odata.id": uri, "Id": uri.split("/")[-1]})
+        idrac.invoke_request.side_effect = invoke_request
+        return idrac
+
+    def test_get_members_expanded(self):
+        members = [{"@odata.id": "{0}/{1}".format(self.COLLECTION_URI, i), "Id": str(i)} for i in range(2)]
+        members.append({"@odata.id": "{0}/2".format(self.COLLECTION_URI)})
+        idrac = self._idrac({"Members": members})
+        loader = RedfishResourceLoader(idrac)
+        assert [member["Id"] for member in loader.get_members(self.COLLECTION_URI)] == ["0", "1", "2"]
+        assert idrac.invoke_request.call_count == 2
+        idrac.invoke_request.assert_any_call(self.COLLECTION_URI + "?$expand=.($levels=1)", "GET")
+        assert loader.get(members[0]["@odata.id"]) is members[0]
+        assert loader.get_members(self.COLLECTION_URI)[1] is members[1]
+        assert idrac.invoke_request.call_count == 2
+
+    def test_get_members_without_expand(self):
+        idrac = self._idrac(None)
+        loader = RedfishResourceLoader(idrac, max_workers=2)
+        assert [member["Id"] for member in loader.get_members(self.COLLECTION_URI)] == ["0", "1", "2"]
+        assert loader.expand is False
+        assert idrac.invoke_request.call_count == 5
+        uri = "{0}/1".format(self.COLLECTION_URI)
+        assert loader.get_all([{"@odata.id": uri}, uri]) == [{"@odata.id": uri, "Id": "1"}] * 2
+        assert idrac.invoke_request.call_count == 5
+
+    def test_get_all_members(self, mocker):
+        idrac = self._idrac(None)
+        other_uri = self.COLLECTION_URI.replace("RAID.SL.5-1", "AHCI.Embedded.1-1")
+        fetch = idrac.invoke_request.side_effect
+        idrac.invoke_request.side_effect = lambda uri, method: \
+            MagicMock(json_data={"Members": []}) if uri.startswith(other_uri) else fetch(uri, method)
+        run_mock = mocker.patch(MODULE_UTIL_PATH + 'utils.run_concurrently', side_effect=run_concurrently)
+        loader = RedfishResourceLoader(idrac)
+        members, others = loader.get_all_members([self.COLLECTION_URI, other_uri])
+        assert [member["Id"] for member in members] == ["0", "1", "2"] and others == []
+        assert loader.expand is False
+        assert run_mock.call_count == 2
+        assert [len(call[0][1]) for call in run_mock.call_args_list] == [2, 3]
+
+    def test_get_members_shared_by_threads(self):
+        idrac = self._idrac(None)
+        fetch, lock, counts = idrac.invoke_request.side_effect, threading.Lock(), {"active": 0, "max": 0}
+
+        def invoke_request(uri, method):
+            with lock:
+                counts["active"] += 1
+                counts["max"] = max(counts["max"], counts["active"])
+            threading.Event().wait(0.05)
+            with lock:
+                counts["active"] -= 1
+            return fetch(uri, method)
+        idrac.invoke_request.side_effect = invoke_request
+        loader = RedfishResourceLoader(idrac, max_workers=2)
+        results = run_concurrently(lambda index: loader.get_members(self.COLLECTION_URI), range(6), max_workers=6)
+        assert all([member["Id"] for member in result] == ["0", "1", "2"] for result in results)
+        uris = [call[0][0] for call in idrac.invoke_request.call_args_list]
+        assert len(uris) == len(set(uris)) == 5
+        assert counts["max"] == 2
+
+    def test_get_members_error(self):
+        idrac = MagicMock()
+        idrac.invoke_request.side_effect = HTTPError(self.COLLECTION_URI, 404, "Not Found", {}, None)
+        with pytest.raises(HTTPError):
+            RedfishResourceLoader(idrac).get_members(self.COLLECTION_URI)
+
+
+class TestMultipartFileBody(object):
+
+    def test_multipart_file_body(self, tmp_path):
+        image = tmp_path / "component.exe"
+        image.write_bytes(b"0123456789")
+        progress = MagicMock()
+        body = MultipartFileBody(str(image), chunk_size=4, progress=progress)
+        data = b"".join(body)
+        assert len(data) == len(body) == int(body.headers["Content-Length"])
+        assert body.headers["Content-Type"] == "multipart/form-data; boundary={0}".format(body.boundary)
+        assert data.startswith("--{0}\r\n".format(body.boundary).encode())
+        assert b'name="file"; filename="component.exe"' in data
+        assert data.endswith("\r\n0123456789\r\n--{0}--\r\n".format(body.boundary).encode())
+        assert [c[0] for c in progress.call_args_list] == [(4, 10), (8, 10), (10, 10)]
+        assert b"".join(body) == data
+
+
+class TestWriteFileAtomically(object):
+
+    def test_write_file_atomically(self, tmp_path):
+        file_path = str(tmp_path / "diagnostics.txt")
+        digest = write_file_atomically(file_path, [b"line 1\r", b"\nline 2\r\n"], strip_cr=True, size=16)
+        assert open(file_path, "rb").read() == b"line 1\nline 2\n"
+        assert digest == hashlib.sha256(b"line 1\nline 2\n").hexdigest()
+        assert write_file_atomically(file_path, [b"new"], checksum=hashlib.sha256(b"new").hexdigest().upper())
+        assert os.listdir(str(tmp_path)) == ["diagnostics.txt"]
+
+    @pytest.mark.parametrize("kwargs, msg", [
+        ({"size": 10}, "Incomplete download of '{0}', received 3 of 10 bytes."),
+        ({"checksum": "0" * 64}, "Checksum mismatch for '{0}'."),
+    ])
+    def test_write_file_atomically_failure(self, kwargs, msg, tmp_path):
+        file_path = str(tmp_path / "sa.zip")
+        (tmp_path / "sa.zip").write_bytes(b"previous")
+        with pytest.raises(ValueError) as err:
+            write_file_atomically(file_path, [b"new"], **kwargs)
+        assert str(err.value) == msg.format(file_path)
+        assert open(file_path, "rb").read() == b"previous"
+        assert os.listdir(str(tmp_path)) == ["sa.zip"]
+
+
+class TestParseJson(object):
+
+    def test_parse_json_strip_odata(self):
+        document = {"@odata.context": "/api/$metadata", "@odata.count": 2, "@odata.nextLink": "/api/Items?$skip=1",
+                    "value": [{"@odata.type": "#Item", "@odata.id": "/api/Items(1)", "Id": 1,
+                               "Members@odata.count": 1, "Detail": {"@odata.id": "/api/Details(1)"}}]}
+        parsed = parse_json(json.dumps(document), strip_odata=True)
+        assert parsed == {"@odata.count": 2, "@odata.nextLink": "/api/Items?$skip=1",
+                          "value": remove_key(json.loads(json.dumps(document["value"])))}
+        assert parse_json(json.dumps(document)) == document
+
+    def test_parse_json_invalid(self):
+        with pytest.raises(ValueError) as err:
+            parse_json("invalid json", strip_odata=True)
+        assert err.value.args[0] == "Unable to parse json"
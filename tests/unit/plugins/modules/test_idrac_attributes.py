@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.1.0
-# Copyright (C) 2022-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -19,6 +19,7 @@ import pytest
 from ansible.module_utils._text import to_text
 from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible_collections.dellemc.openmanage.plugins.modules import idrac_attributes
+from ansible_collections.dellemc.openmanage.plugins.module_utils.cache import build_registry_index, load_registry_index
 from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule
 from mock import MagicMock
 
@@ -275,6 +276,7 @@ class TestIdracAttributes(FakeAnsibleModule):
         idrac_default_args.update({'idrac_attributes': idrac_json})
         f_module = self.get_module_mock(params=idrac_default_args)
         response_obj = MagicMock()
+        idrac_redfish_mock_for_attr.invoke_request.side_effect = HTTPError("https://testhost.com", 404, "Not Found", {}, None)
         idrac_redfish_mock_for_attr.export_scp.return_value = response_obj
         response_obj.json_data = {
             "SystemConfiguration": {"Components": [
@@ -323,6 +325,22 @@ class TestIdracAttributes(FakeAnsibleModule):
             self.module.get_check_mode(f_module, idrac_redfish_mock_for_attr, {}, {}, lc_json)
         assert exc.value.args[0] == "Changes found to be applied."
 
+    def test_get_check_mode_attribute_resources(self, idrac_redfish_mock_for_attr, idrac_default_args):
+        idrac_json = {"SNMP.1#AgentCommunity": "public", "SNMP.1#AlertPort": "162"}
+        f_module = self.get_module_mock(params=idrac_default_args)
+        f_module.check_mode = True
+        idrac_redfish_mock_for_attr.invoke_request.return_value.json_data = {
+            "Attributes": {"SNMP.1.AgentCommunity": "public", "SNMP.1.AlertPort": 162, "SNMP.1.AgentEnable": None}}
+        with pytest.raises(Exception) as exc:
+            self.module.get_check_mode(f_module, idrac_redfish_mock_for_attr, idrac_json, {}, {})
+        assert exc.value.args[0] == "No changes found to be applied."
+        idrac_redfish_mock_for_attr.invoke_request.assert_called_once_with(
+            "/redfish/v1/Managers/iDRAC.Embedded.1/Attributes", "GET")
+        idrac_redfish_mock_for_attr.export_scp.assert_not_called()
+        with pytest.raises(Exception) as exc:
+            self.module.get_check_mode(f_module, idrac_redfish_mock_for_attr, dict(idrac_json, **{"SNMP.1#AlertPort": "163"}), {}, {})
+        assert exc.value.args[0] == "Changes found to be applied."
+
     def test_fetch_idrac_uri_attr(self, idrac_redfish_mock_for_attr, redfish_response_mock, idrac_default_args, mocker):
         idrac_json = {SNMP_ADDRESS: "XX.XX.XX.XX"}
         idrac_default_args.update({'idrac_attributes': idrac_json})
@@ -369,9 +387,10 @@ class TestIdracAttributes(FakeAnsibleModule):
     def test_validate_vs_registry(self, idrac_redfish_mock_for_attr, redfish_response_mock, idrac_default_args):
         idrac_default_args.update({"resource_id": "System.Embedded.1", "idrac_attributes": {"Attr": "Value"}})
         attr_dict = {"attr": "value", "attr1": "value1", "attr2": 3}
-        registry = {"attr": {"Readonly": True},
-                    "attr1": {"Type": "Enumeration", "Value": [{"ValueDisplayName": "Attr"}]},
-                    "attr2": {"Type": "Integer", "LowerBound": 1, "UpperBound": 2}}
+        registry = load_registry_index(build_registry_index([
+            {"AttributeName": "attr", "Readonly": True},
+            {"AttributeName": "attr1", "Type": "Enumeration", "Value": [{"ValueDisplayName": "Attr"}]},
+            {"AttributeName": "attr2", "Type": "Integer", "LowerBound": 1, "UpperBound": 2}], "ValueDisplayName"))
         result = self.module.validate_vs_registry(registry, attr_dict)
         assert result["attr"] == "Read only Attribute cannot be modified."
         assert result["attr1"] == "Invalid value for Enumeration."
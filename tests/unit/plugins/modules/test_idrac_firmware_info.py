@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.8.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -149,3 +149,31 @@ class TestFirmware(FakeAnsibleModule):
             result = self._run_module(idrac_default_args)
             assert result['changed'] is False
         assert 'msg' in result
+
+    def test_idrac_get_firmware_info_hosts(self, mocker, idrac_default_args):
+        mocker.patch('ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish.iDRACRedfishAPI')
+        firmware_mock = mocker.patch(MODULE_PATH + 'idrac_firmware_info.get_idrac_firmware_info',
+                                     side_effect=[{"Firmware": []}, URLError('idrac-mock-url')])
+        idrac_default_args.pop("idrac_ip")
+        idrac_default_args.update({"hosts": [{"idrac_ip": "192.168.0.1"}, {"idrac_ip": "192.168.0.2"}], "max_workers": 1})
+        result = self._run_module(idrac_default_args)
+        assert result["msg"] == "Successfully fetched the details of 1 out of 2 host(s)."
+        assert result["hosts"][0] == {"idrac_ip": "192.168.0.1", "failed": False, "firmware_info": {"Firmware": []}}
+        assert result["hosts"][1]["unreachable"] is True
+        assert firmware_mock.call_args_list[1][0][1]["idrac_ip"] == "192.168.0.2"
+
+    def test_idrac_get_firmware_info_hosts_credentials(self, mocker, idrac_default_args):
+        mocker.patch('ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish.iDRACRedfishAPI')
+        mocker.patch(MODULE_PATH + 'idrac_firmware_info.get_idrac_firmware_info', return_value={"Firmware": []})
+        for key in ("idrac_ip", "idrac_user", "idrac_password"):
+            idrac_default_args.pop(key)
+        idrac_default_args["hosts"] = [{"idrac_ip": "192.168.0.1", "idrac_user": "root", "idrac_password": "pwd"}]
+        result = self._run_module(idrac_default_args)
+        assert result["msg"] == "Successfully fetched the details of 1 out of 1 host(s)."
+        idrac_default_args["hosts"].append({"idrac_ip": "192.168.0.2"})
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result["msg"].startswith("The credentials of the host(s) '192.168.0.2' are not provided.")
+        idrac_default_args.pop("hosts")
+        idrac_default_args["idrac_ip"] = "192.168.0.1"
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result["msg"] == "missing parameter(s) required by 'idrac_ip': idrac_user, idrac_password"
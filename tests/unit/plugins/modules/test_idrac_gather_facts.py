@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import threading
+from io import StringIO
+import pytest
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible.module_utils._text import to_text
+from ansible_collections.dellemc.openmanage.plugins.modules import idrac_gather_facts
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule
+
+MODULE_PATH = 'ansible_collections.dellemc.openmanage.plugins.modules.idrac_gather_facts.'
+SYSTEM = "/redfish/v1/Systems/System.Embedded.1"
+MANAGER = "/redfish/v1/Managers/iDRAC.Embedded.1"
+CHASSIS = "/redfish/v1/Chassis/System.Embedded.1"
+STORAGE = SYSTEM + "/Storage/RAID.SL.1-1"
+DRIVE = STORAGE + "/Drives/Disk.Bay.0"
+MEMORY = SYSTEM + "/Memory/DIMM.Socket.A1"
+
+
+def collection(uri, members):
+    return {"@odata.id": uri, "Members": [{"@odata.id": member} for member in members]}
+
+
+RESOURCES = {
+    "/redfish/v1/Systems": collection("/redfish/v1/Systems", [SYSTEM]),
+    "/redfish/v1/Managers": collection("/redfish/v1/Managers", [MANAGER]),
+    "/redfish/v1/Chassis": collection("/redfish/v1/Chassis", [CHASSIS]),
+    SYSTEM: {"@odata.id": SYSTEM, "Oem": {"Dell": {"DellSystem": {"@odata.type": "#DellSystem", "BIOSVersion": "2.14.2"}}}},
+    "/redfish/v1/Managers/System.Embedded.1/Attributes?$select=ServerOS.*": {"Attributes": {"ServerOS.1.HostName": "host"}},
+    SYSTEM + "/Processors": collection(SYSTEM + "/Processors", [SYSTEM + "/Processors/CPU.Socket.1"]),
+    SYSTEM + "/Processors/CPU.Socket.1": {"@odata.id": SYSTEM + "/Processors/CPU.Socket.1", "Id": "CPU.Socket.1",
+                                          "Links": {"Chassis": {}}, "Assembly": {}, "TotalCores": 6},
+    SYSTEM + "/Storage": collection(SYSTEM + "/Storage", [STORAGE]),
+    STORAGE: {"@odata.id": STORAGE, "Id": "RAID.SL.1-1", "Drives": [{"@odata.id": DRIVE}],
+              "Controllers": {"@odata.id": STORAGE + "/Controllers"}},
+    STORAGE + "/Controllers": collection(STORAGE + "/Controllers", [STORAGE + "/Controllers/RAID.SL.1-1"]),
+    STORAGE + "/Controllers/RAID.SL.1-1": {"@odata.id": STORAGE + "/Controllers/RAID.SL.1-1", "Id": "RAID.SL.1-1",
+                                           "Ports@odata.count": 2},
+    STORAGE + "/Volumes": collection(STORAGE + "/Volumes", [STORAGE + "/Volumes/Disk.Virtual.0"]),
+    STORAGE + "/Volumes/Disk.Virtual.0": {"@odata.id": STORAGE + "/Volumes/Disk.Virtual.0", "Id": "Disk.Virtual.0",
+                                          "Actions": {}, "Links": {}},
+    DRIVE: {"@odata.id": DRIVE, "Id": "Disk.Bay.0", "Links": {}, "CapacityBytes": 1024},
+    SYSTEM + "/Memory": collection(SYSTEM + "/Memory", [MEMORY]),
+    MEMORY: {"@odata.id": MEMORY, "Id": "DIMM.Socket.A1", "Metrics": {"@odata.id": MEMORY + "/MemoryMetrics"},
+             "CPUAffinity@odata.count": 1},
+    MEMORY + "/MemoryMetrics": {"@odata.id": MEMORY + "/MemoryMetrics", "Id": "MemoryMetrics",
+                                "DataSourceUri": MEMORY},
+    CHASSIS + "/Power": {"@odata.id": CHASSIS + "/Power", "Voltages": [{"@odata.id": "voltage", "Name": "PS1 Voltage 1"}]},
+    MANAGER + "/Oem/Dell/DellAttributes/System.Embedded.1": {"Attributes": {"ServerPwr.1.PSRedPolicy": "A/B Grid Redundant"}},
+    MANAGER + "/Oem/Dell/DellAttributes/iDRAC.Embedded.1": {"Attributes": {"IPv4.1.Enable": "Enabled"}},
+    MANAGER + "/Oem/Dell/DellAttributes/LifecycleController.Embedded.1": {"Attributes": {"LCAttributes.1.CollectSystemInventoryOnRestart": "Enabled"}},
+}
+
+
+class TestIdracGatherFacts(FakeAnsibleModule):
+    module = idrac_gather_facts
+
+    @pytest.fixture
+    def idrac_mock(self):
+        idrac = MagicMock()
+
+        def invoke_request(uri, method):
+            if "?$expand=*($levels=1)" in uri:
+                uri = uri.split("?")[0]
+                if uri not in RESOURCES:
+                    raise HTTPError(uri, 404, "Not Found", {}, None)
+                members = [RESOURCES[member["@odata.id"]] for member in RESOURCES[uri]["Members"]]
+                return MagicMock(json_data=dict(RESOURCES[uri], Members=members))
+            if uri not in RESOURCES:
+                raise HTTPError(uri, 404, "Not Found", {}, None)
+            return MagicMock(json_data=RESOURCES[uri])
+        idrac.invoke_request.side_effect = invoke_request
+        return idrac
+
+    @pytest.fixture
+    def idrac_connection_mock(self, mocker, idrac_mock):
+        idrac_conn_mock = mocker.patch(MODULE_PATH + 'iDRACRedfishAPI', return_value=idrac_mock)
+        idrac_conn_mock.return_value.__enter__.return_value = idrac_mock
+        return idrac_conn_mock
+
+    def test_remove_keys(self):
+        data = {"@odata.id": "1", "Links": {}, "Items": [{"@odata.type": "a", "Id": 1}], "Status@odata.count": 1}
+        assert idrac_gather_facts.remove_keys(data, ["@odata.id", "@odata.type", "Links"]) == \
+            {"Items": [{"Id": 1}], "Status@odata.count": 1}
+        assert idrac_gather_facts.remove_keys(data, regex=r"^.*@odata.*$") == {"Links": {}, "Items": [{"Id": 1}]}
+        assert data["@odata.id"] == "1"
+
+    def test_collect_facts(self, idrac_mock):
+        collector = idrac_gather_facts.IdracFactsCollector(idrac_mock, {"max_workers": 4})
+        assert collector.resolve_resources() == {"api_system": SYSTEM, "api_manager": MANAGER, "api_chassis": CHASSIS,
+                                                 "computer_system_id": "System.Embedded.1"}
+        facts = collector.collect(["IDRAC", "System", "CPU", "Controller", "VirtualDisk", "PhysicalDisk",
+                                   "SystemMetrics", "Sensors_Voltage", "Fan"])
+        assert set(facts) == set(idrac_gather_facts.DEFAULT_FACTS)
+        assert facts["system"] == {"BIOSVersion": "2.14.2", "ServerOS.1.HostName": "host"}
+        assert facts["cpu"] == [{"Id": "CPU.Socket.1", "TotalCores": 6}]
+        assert facts["controller"] == [{"Id": "RAID.SL.1-1"}]
+        assert facts["virtual_disk"] == [{"Id": "Disk.Virtual.0"}]
+        assert facts["physical_disk"] == [{"Id": "Disk.Bay.0", "CapacityBytes": 1024}]
+        assert facts["memory_metrics"] == [{"Id": "MemoryMetrics"}]
+        assert facts["voltages"] == [{"Name": "PS1 Voltage 1"}]
+        assert facts["idrac"]["manager_attributes"] == {"IPv4.1.Enable": "Enabled"}
+        assert facts["fan"] == [] and facts["power_metrics"] == [] and facts["thermal_metrics"] == []
+        assert facts["memory"] == []
+        storage_requests = [call for call in idrac_mock.invoke_request.call_args_list
+                            if call[0][0].startswith(SYSTEM + "/Storage?")]
+        assert len(storage_requests) == 1
+        assert RESOURCES[SYSTEM]["Oem"]["Dell"]["DellSystem"]["@odata.type"] == "#DellSystem"
+
+    def test_collect_facts_shared_resources(self, idrac_mock, mocker):
+        psu = CHASSIS + "/PowerSubsystem/PowerSupplies/PSU.Slot.1"
+        mocker.patch.dict(RESOURCES, {
+            CHASSIS + "/PowerSubsystem/PowerSupplies": collection(CHASSIS + "/PowerSubsystem/PowerSupplies", [psu]),
+            psu: {"@odata.id": psu, "Id": "PSU.Slot.1", "Metrics": {"@odata.id": psu + "/Metrics"}},
+            psu + "/Metrics": {"@odata.id": psu + "/Metrics", "Id": "PowerSupplyMetrics"}})
+        fetch, lock, counts = idrac_mock.invoke_request.side_effect, threading.Lock(), {"active": 0, "max": 0}
+
+        def invoke_request(uri, method):
+            with lock:
+                counts["active"] += 1
+                counts["max"] = max(counts["max"], counts["active"])
+            threading.Event().wait(0.05)
+            with lock:
+                counts["active"] -= 1
+            return fetch(uri, method)
+        idrac_mock.invoke_request.side_effect = invoke_request
+        collector = idrac_gather_facts.IdracFactsCollector(idrac_mock, {"max_workers": 3})
+        collector.resolve_resources()
+        facts = collector.collect(["Controller", "VirtualDisk", "PhysicalDisk", "Memory", "SystemMetrics", "PowerSupply"])
+        assert facts["virtual_disk"] == [{"Id": "Disk.Virtual.0"}]
+        assert facts["power_metrics"] == [{"Id": "PowerSupplyMetrics"}]
+        uris = [call[0][0] for call in idrac_mock.invoke_request.call_args_list]
+        assert len(uris) == len(set(uris))
+        assert counts["max"] <= 3
+
+    @pytest.mark.parametrize("params, msg", [
+        ({"computer_system_id": "System.Embedded.2"},
+         "Invalid computer system id : System.Embedded.2, valid values are System.Embedded.1"),
+        ({"manager_id": "iDRAC.Embedded.2"},
+         "Invalid computer manager id : iDRAC.Embedded.2, valid values are iDRAC.Embedded.1"),
+    ])
+    def test_resolve_resources_invalid_id(self, params, msg, idrac_mock):
+        with pytest.raises(ValueError) as err:
+            idrac_gather_facts.IdracFactsCollector(idrac_mock, params).resolve_resources()
+        assert str(err.value) == msg
+
+    def test_main_success(self, idrac_default_args, idrac_connection_mock):
+        idrac_default_args.update({"target": ["CPU", "Sensors_Battery"]})
+        result = self._run_module(idrac_default_args)
+        assert result["msg"] == "Successfully gathered the facts."
+        assert result["facts"]["cpu"] == [{"Id": "CPU.Socket.1", "TotalCores": 6}]
+        assert result["facts"]["sensor_battery"] == {}
+        assert result["resources"]["api_chassis"] == CHASSIS
+        assert idrac_connection_mock.call_args[1] == {"req_session": True}
+
+    @pytest.mark.parametrize("exc_type", [HTTPError, URLError, ValueError])
+    def test_main_exception(self, exc_type, idrac_default_args, idrac_connection_mock, mocker):
+        json_str = to_text(json.dumps({"error": {"message": "Unable to process the request."}}))
+        if exc_type == HTTPError:
+            error = exc_type('https://testhost.com', 401, 'http error message', {"accept-type": "application/json"},
+                             StringIO(json_str))
+        else:
+            error = exc_type('error message')
+        mocker.patch(MODULE_PATH + 'IdracFactsCollector.resolve_resources', side_effect=error)
+        result = self._run_module(idrac_default_args)
+        if exc_type == URLError:
+            assert result["unreachable"] is True
+        else:
+            assert result["failed"] is True
+        if exc_type == HTTPError:
+            assert result["error_info"] == {"error": {"message": "Unable to process the request."}}
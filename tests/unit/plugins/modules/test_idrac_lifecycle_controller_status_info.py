@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.0.0
-# Copyright (C) 2020-2022 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2020-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -80,3 +80,11 @@ class TestLcStatus(FakeAnsibleModule):
             result = self._run_module_with_fail_json(idrac_default_args)
             assert result['failed'] is True
             assert 'msg' in result
+
+    @pytest.mark.parametrize("lc_status, lc_ready", [("Ready", True), ("NotReady", False)])
+    def test_get_lc_status(self, lc_status, lc_ready):
+        idrac = MagicMock()
+        idrac.invoke_request.return_value.json_data = {"LCStatus": lc_status, "Status": "Ready"}
+        result = self.module.get_lc_status(idrac, {})
+        assert result == {"lc_status_info": {"LCReady": lc_ready, "LCStatus": lc_status}}
+        assert idrac.invoke_request.call_args[0][1] == "POST"
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.4.0
-# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -379,6 +379,11 @@ class TestIDRACNetworkAttributes(FakeAnsibleModule):
         data = idr_obj.get_current_server_registry()
         assert data == {'Qwerty': False}
 
+        # Scenario 4a: When Firmware version is less than 6.0 and the DellNetworkAttributes resource is available
+        idr_obj.oem_uri = "/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/NIC.Mezzanine.1A/Oem/Dell/DellNetworkAttributes"
+        data = idr_obj.get_current_server_registry()
+        assert data == {'abc': False}
+
         # Scenario 5: When network_attributes is given
         firm_ver = '7.0'
         mocker.patch(MODULE_PATH + "idrac_network_attributes.get_idrac_firmware_version",
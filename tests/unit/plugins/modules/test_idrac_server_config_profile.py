@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.4.0
-# Copyright (C) 2020-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2020-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -102,13 +102,16 @@ class TestServerConfigProfile(FakeAnsibleModule):
         idrac_default_args.update({"share_user": "sharename", "command": "export",
                                    "export_use": "Default", "include_in_export": "default"})
         idrac_default_args.update(params['mparams'])
-        mocker.patch(OPEN_KEY, mocker.mock_open())
+        write_mock = mocker.patch(MODULE_PATH + 'idrac_server_config_profile.write_file_atomically')
         idrac_redfish_job_tracking_mock.status_code = 202
         idrac_redfish_job_tracking_mock.success = True
         mocker.patch(MODULE_PATH + REDFISH_JOB_TRACKING,
                      return_value=(False, False, {"Status": "Completed"}, {}))
         result = self._run_module(idrac_default_args, check_mode=params.get('check_mode', False))
         assert params['message'] in result['msg']
+        if params['mparams']['share_name'] == "/share":
+            assert write_mock.call_args[0][0] == "/share/scp_file.json"
+            assert write_mock.call_args[0][1] == [idrac_scp_redfish_mock.wait_for_job_complete.return_value]
 
     @pytest.mark.parametrize("params", [
         {"message": CHANGES_FOUND,
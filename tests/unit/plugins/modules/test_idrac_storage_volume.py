@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -452,31 +452,41 @@ class TestStorageData(FakeAnsibleModule):
             idr_obj.fetch_controllers_uri()
         assert exc.value.args[0] == "Error"
 
-    def test_fetch_api_data(self, idrac_default_args, idrac_connection_storage_volume_mock, mocker):
-        key = "Storage"
-        obj = MagicMock()
-        mocker.patch(MODULE_PATH + API_INVOKE_MOCKER, return_value=obj)
-        f_module = self.get_module_mock(params=idrac_default_args, check_mode=True)
-        idr_obj = self.module.StorageData(idrac_connection_storage_volume_mock, f_module)
-        key_out, uri_data_out = idr_obj.fetch_api_data(self.storage_controllers[ODATA_ID], -1)
-        assert key == key_out
-        assert obj == uri_data_out
-
-    def test_all_storage_data(self, idrac_default_args, idrac_connection_storage_volume_mock, mocker):
-        def mock_get_dynamic_uri_request(*args, **kwargs):
-            if len(args) == 3 and args[2] == "Members":
-                return self.volumes_list
-            else:
-                return self.controllers_list
+    def test_resource_key(self):
+        assert self.module.StorageData.resource_key(self.storage_controllers[ODATA_ID]) == "Storage"
+
+    @pytest.mark.parametrize("expand", [True, False])
+    def test_all_storage_data(self, expand, idrac_default_args, idrac_connection_storage_volume_mock, mocker):
+        requested = []
+
+        def invoke_request(uri, method):
+            requested.append(uri)
+            if "$expand" in uri:
+                if not expand:
+                    raise HTTPError(uri, 400, "Bad Request", {}, None)
+                return MagicMock(json_data={"Members": [dict(volume, Id=volume[ODATA_ID].split("/")[-1])
+                                                        for volume in self.volumes_list]})
+            if uri.endswith("Volumes"):
+                return MagicMock(json_data={"Members": self.volumes_list})
+            return MagicMock(json_data={ODATA_ID: uri, "Id": uri.split("/")[-1]})
+        idrac_connection_storage_volume_mock.invoke_request.side_effect = invoke_request
         mocker.patch(MODULE_PATH + "StorageData.fetch_controllers_uri",
                      return_value=self.storage_controllers)
-        mocker.patch(MODULE_PATH + "get_dynamic_uri",
-                     side_effect=mock_get_dynamic_uri_request)
+        mocker.patch(MODULE_PATH + "get_dynamic_uri", return_value=self.controllers_list)
         f_module = self.get_module_mock(params=idrac_default_args, check_mode=True)
         idr_obj = self.module.StorageData(idrac_connection_storage_volume_mock, f_module)
         storage_info = idr_obj.all_storage_data()
         assert set(storage_info.keys()) == {'Controllers'}
         assert set(storage_info["Controllers"].keys()) == {CONTROLLER_ID_FIRST, CONTROLLER_ID_FOURTH}
+        controller = storage_info["Controllers"][CONTROLLER_ID_FOURTH]
+        assert controller["Drives"][PHYSICAL_DISK_FIRST]["Id"] == PHYSICAL_DISK_FIRST
+        assert controller["Links"]["Enclosures"]["Enclosure.Internal.0-1:RAID.SL.5-1"]["Id"] == \
+            "Enclosure.Internal.0-1:RAID.SL.5-1"
+        assert set(controller["Volumes"].keys()) == {VIRTUAL_DISK_FIRST, VIRTUAL_DISK_SECOND}
+        assert controller["Volumes"][VIRTUAL_DISK_FIRST]["Id"] == VIRTUAL_DISK_FIRST
+        fetched = [uri for uri in requested if "$expand" not in uri]
+        assert len(fetched) == len(set(fetched))
+        assert (self.volumes_list[0][ODATA_ID] in requested) is not expand
 
     def test_fetch_storage_data(self, idrac_default_args, idrac_connection_storage_volume_mock, mocker):
         mocker.patch(MODULE_PATH + ALL_STORAGE_DATA_METHOD,
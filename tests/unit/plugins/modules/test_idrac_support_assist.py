@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.6.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -865,6 +865,7 @@ class TestRunSupportAssist(FakeAnsibleModule):
             idrac_connection_support_assist_mock, f_module)
         job_dict = run_support_assist_obj.file_download(job_tracking_uri, local_share)
         assert job_dict is None
+        assert obj.download_to.call_args[0][0].startswith(tempfile.gettempdir())
 
     def test_expand_ipv6(self, idrac_default_args, idrac_connection_support_assist_mock, mocker):
         f_module = self.get_module_mock(
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.2.0
-# Copyright (C) 2020-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2020-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -195,6 +195,45 @@ class TestIDRACUser(FakeAnsibleModule):
         assert response[2] == 3
         assert response[1] == "/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/3"
 
+    @pytest.mark.parametrize("params", [
+        {"user_name": "test", "state": "present", "slot_id": 3, "empty_slot": None,
+         "user_attr": {"Users.3#UserName": "test", "Users.3#Privilege": "511", "Users.3#Enable": "Enabled"}},
+        {"user_name": "test", "state": "absent", "slot_id": 3, "empty_slot": None, "user_attr": {}},
+        {"user_name": "new_user", "state": "present", "slot_id": None, "empty_slot": 4, "user_attr": {}},
+    ])
+    def test_get_user_account_from_accounts(self, params, idrac_default_args, mocker):
+        accounts = [{"Id": "1", "UserName": ""}, {"Id": "2", "UserName": "root"}, {"Id": "3", "UserName": "test"},
+                    {"Id": "4", "UserName": ""}, {"Id": "5", "UserName": ""}]
+        attributes = {"Users.3.UserName": "test", "Users.3.Privilege": 511, "Users.3.Enable": "Enabled",
+                      "Users.2.UserName": "root", "Users.3.IpmiLanPrivilege": None, "Lockdown.1.SystemLockdown": "Disabled"}
+        idrac = MagicMock()
+
+        def invoke_request(uri, method):
+            if uri.startswith(self.module.ACCOUNT_URI.rstrip("/")):
+                return MagicMock(json_data={"Members": [dict(account, **{"@odata.id": SLOT_API.format(account["Id"])})
+                                                        for account in accounts]})
+            return MagicMock(json_data={"Attributes": attributes})
+        idrac.invoke_request.side_effect = invoke_request
+        idrac_default_args.update({"user_name": params["user_name"], "state": params["state"]})
+        f_module = self.get_module_mock(params=idrac_default_args, check_mode=False)
+        user_attr, slot_uri, slot_id, empty_slot, empty_slot_uri = self.module.get_user_account(f_module, idrac)
+        assert user_attr == params["user_attr"]
+        assert slot_id == params["slot_id"]
+        assert empty_slot == params["empty_slot"]
+        assert slot_uri == (self.module.ACCOUNT_URI + str(slot_id) if slot_id else None)
+        assert empty_slot_uri == (self.module.ACCOUNT_URI + str(empty_slot) if empty_slot else None)
+        idrac.export_scp.assert_not_called()
+
+    def test_get_user_account_scp_fallback(self, idrac_default_args, mocker):
+        idrac = MagicMock()
+        idrac.invoke_request.side_effect = HTTPError(self.module.ACCOUNT_URI, 404, "Not Found", {}, None)
+        idrac.get_idrac_local_account_attr.return_value = {USERNAME2: "test"}
+        idrac_default_args.update({"user_name": "test", "state": "present"})
+        f_module = self.get_module_mock(params=idrac_default_args, check_mode=False)
+        response = self.module.get_user_account(f_module, idrac)
+        assert response == ({USERNAME2: "test"}, self.module.ACCOUNT_URI + "2", 2, None, None)
+        idrac.export_scp.assert_called_once()
+
     def test_get_user_account_invalid_name(self, idrac_connection_user_mock, idrac_default_args, mocker):
         idrac_default_args.update({"state": "present", "new_user_name": "new_user_name",
                                    "user_name": "", "user_password": "password",
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.0.0
-# Copyright (C) 2022 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -229,3 +229,36 @@ class TestIDRACUserInfo(FakeAnsibleModule):
         else:
             result = self._run_module(idrac_default_args)
         assert 'msg' in result
+
+    @pytest.mark.parametrize("params, user_names, msg", [
+        ({}, ["root", "test"], None),
+        ({"user_id": 3}, ["test"], None),
+        ({"username": "root"}, ["root"], None),
+        ({"user_id": 4}, [], "'user_id' is not valid."),
+        ({"username": "admin"}, [], "'username' is not valid."),
+    ])
+    def test_get_host_user_info(self, params, user_names, msg, mocker):
+        mocker.patch(MODULE_PATH + "idrac_user_info.get_accounts_uri", return_value="/redfish/v1/AccountService/Accounts")
+        mocker.patch(MODULE_PATH + "idrac_user_info.fetch_all_accounts",
+                     return_value=[{"Id": "1", "UserName": ""}, {"Id": "2", "UserName": "root"},
+                                   {"Id": "3", "UserName": "test", "Links": {}}])
+        if msg:
+            with pytest.raises(ValueError) as exc:
+                self.module.get_host_user_info(MagicMock(), params)
+            assert exc.value.args[0] == msg
+        else:
+            result = self.module.get_host_user_info(MagicMock(), params)
+            assert [user["UserName"] for user in result["user_info"]] == user_names
+
+    def test_user_info_hosts_credentials(self, idrac_default_args, mocker):
+        mocker.patch('ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish.iDRACRedfishAPI')
+        mocker.patch(MODULE_PATH + "idrac_user_info.get_host_user_info", return_value={"user_info": []})
+        for key in ("idrac_ip", "idrac_user", "idrac_password"):
+            idrac_default_args.pop(key)
+        idrac_default_args["hosts"] = [{"idrac_ip": "192.168.0.1", "idrac_user": "root", "idrac_password": "pwd"}]
+        result = self._run_module(idrac_default_args)
+        assert result["msg"] == "Successfully fetched the details of 1 out of 1 host(s)."
+        idrac_default_args.pop("hosts")
+        idrac_default_args["idrac_ip"] = "192.168.0.1"
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result["msg"] == "one of the following is required: idrac_user, x_auth_token, hosts"
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.2.0
-# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -20,6 +20,7 @@ from ansible.module_utils._text import to_text
 from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible.module_utils.urls import SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.modules import ome_alert_policies_category_info
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import parse_json
 from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule
 
 MODULE_PATH = 'ansible_collections.dellemc.openmanage.plugins.modules.ome_alert_policies_category_info.'
@@ -2633,8 +2634,11 @@ class TestOmeAlertCategoryInfo(FakeAnsibleModule):
                 ]}}])
     def test_ome_alert_policies_category_info(self, params, ome_connection_mock_for_alert_category, ome_response_mock,
                                               ome_default_args, module_mock, mocker):
+        def invoke_request(method, uri, query_param=None, strip_odata=False):
+            ome_response_mock.json_data = parse_json(json.dumps(params['json_data']), strip_odata=strip_odata)
+            return ome_response_mock
         ome_response_mock.success = params.get("success", True)
-        ome_response_mock.json_data = params['json_data']
+        ome_connection_mock_for_alert_category.invoke_request.side_effect = invoke_request
         result = self._run_module(
             ome_default_args, check_mode=params.get('check_mode', False))
         assert isinstance(result['categories'], list)
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.2.0
-# Copyright (C) 2021-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -16,6 +16,7 @@ import json
 from io import StringIO
 
 import pytest
+from mock import MagicMock
 from ansible.module_utils._text import to_text
 from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible.module_utils.urls import SSLValidationError
@@ -117,6 +118,37 @@ class TestBaselineComplianceInfo(FakeAnsibleModule):
         assert report == [
             {'Id': 25011, 'ComplianceAttributeGroups': None, 'TemplateId': 1}]
 
+    def test_compliance_report_non_compliant_only(self, ome_connection_mock_for_compliance_info, mocker):
+        value_list = [{"Id": device_id, "ComplianceStatus": "COMPLIANT" if device_id % 3 else "NONCOMPLIANT"}
+                      for device_id in range(1, 31)]
+        ome_connection_mock_for_compliance_info.get_all_items_with_pagination.return_value = {"value": value_list}
+        mocker.patch(MODULE_PATH + 'get_baseline_id', return_value=(1, 1))
+
+        def invoke_request(method, uri):
+            return MagicMock(json_data={"ComplianceAttributeGroups": [{"Uri": uri}]})
+        ome_connection_mock_for_compliance_info.invoke_request.side_effect = invoke_request
+        f_module = self.get_module_mock(params={'baseline': "baseline_one", "non_compliant_only": True})
+        report = self.module.compliance_report(f_module, ome_connection_mock_for_compliance_info)
+        assert [each["Id"] for each in report] == list(range(3, 31, 3))
+        assert report[0]["ComplianceAttributeGroups"] == [
+            {"Uri": "TemplateService/Baselines(1)/DeviceConfigComplianceReports(3)/DeviceComplianceDetails"}]
+        assert ome_connection_mock_for_compliance_info.invoke_request.call_count == 10
+
+    def test_get_compliance_details_retry(self, ome_connection_mock_for_compliance_info, ome_response_mock, mocker):
+        sleep_mock = mocker.patch(MODULE_PATH + 'time.sleep')
+        ome_response_mock.json_data = {"ComplianceAttributeGroups": [{"DisplayName": "BIOS"}]}
+        ome_connection_mock_for_compliance_info.invoke_request.side_effect = [
+            HTTPError('https://testhost.com', 503, 'Service Unavailable', {}, None), URLError("timed out"),
+            ome_response_mock]
+        assert self.module.get_compliance_details(ome_connection_mock_for_compliance_info, 1, 25011) == \
+            [{"DisplayName": "BIOS"}]
+        assert [each[0][0] for each in sleep_mock.call_args_list] == [2, 4]
+        ome_connection_mock_for_compliance_info.invoke_request.side_effect = HTTPError(
+            'https://testhost.com', 404, 'Not Found', {}, None)
+        with pytest.raises(HTTPError):
+            self.module.get_compliance_details(ome_connection_mock_for_compliance_info, 1, 25011)
+        assert sleep_mock.call_count == 2
+
     @pytest.mark.parametrize("exc_type",
                              [SSLValidationError, ConnectionError, TypeError, ValueError, OSError, HTTPError, URLError])
     def test_main_exception(self, exc_type, ome_connection_mock_for_compliance_info, mocker,
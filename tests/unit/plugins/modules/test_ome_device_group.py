@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 6.1.0
-# Copyright (C) 2022 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -85,12 +85,16 @@ class TestOMEDeviceGroup(FakeAnsibleModule):
 
     def test_ome_device_group_get_device_id(self, ome_connection_mock_for_device_group):
         report_list = [{"Id": 25011, "DeviceServiceTag": "SEFRG2"}, {"Id": 25012, "DeviceServiceTag": "SEFRG3"}]
-        ome_connection_mock_for_device_group.get_all_report_details.return_value = {"report_list": report_list}
+        ome_connection_mock_for_device_group.get_items_by_filter.side_effect = \
+            lambda uri, key, values, select=None: [device for device in report_list if device[key] in values]
         f_module = self.get_module_mock(params={"name": "Storage Services",
                                                 "device_ids": [25011, 25012]})
         device_list, key = self.module.get_device_id(ome_connection_mock_for_device_group, f_module)
         assert device_list == [25011, 25012]
         assert key == "Id"
+        ome_connection_mock_for_device_group.get_items_by_filter.assert_called_with(
+            "DeviceService/Devices", "Id", [25011, 25012], select=["Id", "DeviceServiceTag"])
+        ome_connection_mock_for_device_group.get_all_report_details.assert_not_called()
         f_module = self.get_module_mock(params={"name": "Storage Services",
                                                 "device_service_tags": ["SEFRG2", "SEFRG3"]})
         device_list, key = self.module.get_device_id(ome_connection_mock_for_device_group, f_module)
@@ -403,6 +407,20 @@ class TestOMEDeviceGroup(FakeAnsibleModule):
         res = self.module.get_device_id_from_ip(ip_addresses, device_list, f_module)
         assert res == output
 
+    def test_get_device_ip_index(self):
+        device_list = [{"Id": 1, "DeviceManagement": [{"NetworkAddress": "192.168.4.10"}]},
+                       {"Id": 2, "DeviceManagement": [{"NetworkAddress": "[fe80::10]"}]},
+                       {"Id": 3, "DeviceManagement": [{"NetworkAddress": "192.168.2.10"}]},
+                       {"Id": 4, "DeviceManagement": []}]
+        keys, devices = self.module.get_device_ip_index(device_list)
+        assert keys == [(4, int(IPAddress("192.168.2.10"))), (4, int(IPAddress("192.168.4.10"))),
+                        (6, int(IPAddress("fe80::10")))]
+        assert [device_id for device_id, ome_ip in devices] == [3, 1, 2]
+        f_module = self.get_module_mock(params={"name": "group1"})
+        res = self.module.get_device_id_from_ip([IPRange("fe80::1", "fe80::ff"), IPAddress("192.168.4.10"),
+                                                 IPNetwork("192.168.2.0/24")], device_list, f_module)
+        assert res == {1: "192.168.4.10", 2: "fe80::10", 3: "192.168.2.10"}
+
     def test_get_device_id_from_ip_failure_case(self):
         device_list = [
             {
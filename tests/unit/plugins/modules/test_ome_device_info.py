@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.1.0
-# Copyright (C) 2019-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -13,6 +13,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import pytest
+from mock import MagicMock
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible_collections.dellemc.openmanage.plugins.modules import ome_device_info
 from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule, Constants
@@ -192,46 +193,39 @@ class TestOmeDeviceInfo(FakeAnsibleModule):
         actual_res = self.module.is_int(val)
         assert actual_res == expected_res
 
-    def test_get_device_id_from_service_tags(self, ome_connection_mock, ome_response_mock, mocker):
-        mocker.patch(MODULE_PATH + 'ome_device_info.update_device_details_with_filtering')
-        ome_response_mock.json_data.update({"@odata.context": "/api/$metadata#Collection(DeviceService.Device)"})
-        ome_response_mock.json_data.update({"@odata.count": 1})
-        ome_connection_mock.get_all_report_details.return_value = {"resp_obj": ome_response_mock, "report_list": [
-            {"DeviceServiceTag": Constants.service_tag1,
-             "Id": Constants.device_id1}]}
-        self.module._get_device_id_from_service_tags([Constants.service_tag1, "INVALID"], ome_connection_mock)
+    def test_get_device_id_from_service_tags(self, ome_connection_mock):
+        ome_connection_mock.get_items_by_filter.return_value = [
+            {"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1}]
+        self.module.device_fact_error_report.clear()
+        result = self.module._get_device_id_from_service_tags([Constants.service_tag1, "INVALID"], ome_connection_mock)
+        assert result == {Constants.device_id1: Constants.service_tag1}
+        assert self.module.device_fact_error_report == {"INVALID": "HTTP Error 404: Not Found"}
+        ome_connection_mock.get_items_by_filter.assert_called_once_with(
+            "DeviceService/Devices", "DeviceServiceTag", [Constants.service_tag1, "INVALID"],
+            select=["Id", "DeviceServiceTag"])
+        ome_connection_mock.get_all_report_details.assert_not_called()
 
     def test_get_device_id_from_service_tags_error_case(self, ome_connection_mock, ome_response_mock):
-        ome_connection_mock.get_all_report_details.side_effect = HTTPError(HTTPS_ADDRESS, 400, '', {}, None)
+        ome_connection_mock.get_items_by_filter.side_effect = HTTPError(HTTPS_ADDRESS, 400, '', {}, None)
         with pytest.raises(HTTPError) as ex:
             self.module._get_device_id_from_service_tags(["INVALID"], ome_connection_mock)
 
-    def test_update_device_details_with_filtering_success_case_01(self, ome_connection_mock, ome_response_mock):
-        non_available_tags = [Constants.service_tag2]
-        service_tag_dict = {Constants.device_id1: Constants.service_tag1}
-        ome_response_mock.json_data = {
-            "value": [{"DeviceServiceTag": Constants.service_tag2, "Id": Constants.device_id2}]}
-        self.module.update_device_details_with_filtering(non_available_tags, service_tag_dict, ome_connection_mock)
-        assert service_tag_dict[Constants.device_id1] == Constants.service_tag1
-        assert service_tag_dict[Constants.device_id2] == Constants.service_tag2
-        assert len(non_available_tags) == 0
-
-    def test_update_device_details_with_filtering_success_case_02(self, ome_connection_mock, ome_response_mock):
-        non_available_tags = ["MX700"]
-        service_tag_dict = {Constants.device_id1: Constants.service_tag1}
-        ome_response_mock.json_data = {"value": [{"DeviceServiceTag": "MX7000", "Id": Constants.device_id2}]}
-        self.module.update_device_details_with_filtering(non_available_tags, service_tag_dict, ome_connection_mock)
-        assert service_tag_dict[Constants.device_id1] == Constants.service_tag1
-        assert Constants.device_id2 not in service_tag_dict
-        assert len(non_available_tags) == 1
-
-    def test_update_device_details_with_filtering_failure_case_01(self, ome_connection_mock, ome_response_mock):
-        error_msg = '400: Bad Request'
-        service_tag_dict = {}
-        non_available_tags = [Constants.service_tag2]
-        ome_connection_mock.invoke_request.side_effect = HTTPError(HTTPS_ADDRESS, 400, error_msg, {}, None)
-        with pytest.raises(HTTPError, match=error_msg) as ex:
-            self.module.update_device_details_with_filtering(non_available_tags, service_tag_dict, ome_connection_mock)
+    def test_fetch_device_facts(self, ome_connection_mock, ome_response_mock):
+        def invoke_request(method, path):
+            if path == "DeviceService/Devices(1)/SubSystemHealth":
+                raise HTTPError(HTTPS_ADDRESS, 404, 'Not Found', {}, None)
+            return MagicMock(json_data={"path": path}, status_code=200)
+        ome_connection_mock.invoke_request.side_effect = invoke_request
+        path_dict = {"device_id": dict((device_id, "DeviceService/Devices({0})/SubSystemHealth".format(device_id))
+                                       for device_id in range(1, 21)),
+                     "device_service_tag": {Constants.service_tag1: "DeviceService/Devices(4321)/SubSystemHealth"}}
+        resp_status = self.module._fetch_device_facts(ome_connection_mock, path_dict, max_workers=4)
+        assert resp_status == [200] * 20
+        assert path_dict["device_id"][1] == "HTTP Error 404: Not Found"
+        assert path_dict["device_id"][20] == {"path": "DeviceService/Devices(20)/SubSystemHealth"}
+        assert path_dict["device_service_tag"][Constants.service_tag1] == {
+            "path": "DeviceService/Devices(4321)/SubSystemHealth"}
+        assert ome_connection_mock.invoke_request.call_count == 21
 
     def test_main_detailed_inventory_device_fact_error_report_case_01(self, ome_default_args, module_mock,
                                                                       validate_device_inputs_mock, ome_connection_mock,
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.0.0
-# Copyright (C) 2021-2022 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -61,22 +61,22 @@ class TestOMEDiagnostics(FakeAnsibleModule):
         assert err.value.args[0] == "The requested group 'Servers' does not contain devices that support export log."
 
     def test_device_validation(self, ome_conn_mock_diagnostics, ome_response_mock, ome_default_args, mocker):
-        resp = {"report_list": [{"Id": 25014, "DeviceServiceTag": "ZXCVB1", "Type": 1000}]}
+        resp = [{"Id": 25014, "DeviceServiceTag": "ZXCVB1", "Type": 1000}]
         f_module = self.get_module_mock(params={"device_ids": [25011]})
-        ome_conn_mock_diagnostics.get_all_report_details.return_value = resp
+        ome_conn_mock_diagnostics.get_items_by_filter.return_value = resp
         with pytest.raises(Exception) as err:
             self.module.device_validation(f_module, ome_conn_mock_diagnostics)
         assert err.value.args[0] == "Unable to complete the operation because the entered target device " \
                                     "id(s) '25011' are invalid."
-        resp = {"report_list": [{"Id": 25011, "DeviceServiceTag": "ZXCVB1", "Type": 1000}]}
-        ome_conn_mock_diagnostics.get_all_report_details.return_value = resp
+        resp = [{"Id": 25011, "DeviceServiceTag": "ZXCVB1", "Type": 1000}]
+        ome_conn_mock_diagnostics.get_items_by_filter.return_value = resp
         result = self.module.device_validation(f_module, ome_conn_mock_diagnostics)
         assert result == [25011]
         f_module = self.get_module_mock(params={"device_service_tags": ["ZXCVB1"]})
         result = self.module.device_validation(f_module, ome_conn_mock_diagnostics)
         assert result == [25011]
-        resp = {"report_list": [{"Id": 25019, "DeviceServiceTag": "ZXCVB1", "Type": 8000}]}
-        ome_conn_mock_diagnostics.get_all_report_details.return_value = resp
+        resp = [{"Id": 25019, "DeviceServiceTag": "ZXCVB1", "Type": 8000}]
+        ome_conn_mock_diagnostics.get_items_by_filter.return_value = resp
         with pytest.raises(Exception) as err:
             self.module.device_validation(f_module, ome_conn_mock_diagnostics)
         assert err.value.args[0] == "The requested device service tag(s) 'ZXCVB1' " \
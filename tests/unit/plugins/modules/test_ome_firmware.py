@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.0.0
-# Copyright (C) 2019-2022 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -12,7 +12,7 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
-from mock import patch, mock_open
+from mock import MagicMock, patch, mock_open
 
 import pytest
 import json
@@ -494,7 +494,7 @@ class TestOmeFirmware(FakeAnsibleModule):
                                     " the entered target baseline name does not exist."
 
     def test_baseline_based_update_exception_case_01(self, ome_connection_firmware_mock):
-        ome_connection_firmware_mock.get_all_report_details.return_value = {"report_list": []}
+        ome_connection_firmware_mock.iter_items.return_value = iter([])
         f_module = self.get_module_mock()
         dev_comp_map = {}
         with pytest.raises(Exception) as exc:
@@ -506,7 +506,7 @@ class TestOmeFirmware(FakeAnsibleModule):
         response = {"report_list": [
             {"DeviceId": "1111", "DeviceTypeId": 2000, "DeviceName": "MX-111", "DeviceTypeName": "CHASSIS",
              "ComponentComplianceReports": [{"UpdateAction": "UPGRADE", "SourceName": "SAS.xx.x2"}]}]}
-        ome_connection_firmware_mock.get_all_report_details.return_value = response
+        ome_connection_firmware_mock.iter_items.return_value = iter(response["report_list"])
         dev_comp_map = {}
         compliance_report_list = self.module.baseline_based_update(ome_connection_firmware_mock, f_module,
                                                                    {"baseline_id": 1}, dev_comp_map)
@@ -518,11 +518,148 @@ class TestOmeFirmware(FakeAnsibleModule):
         response = {"report_list": [
             {"DeviceId": 1111, "DeviceTypeId": 2000, "DeviceName": "MX-111", "DeviceTypeName": "CHASSIS",
              "ComponentComplianceReports": []}]}
-        ome_connection_firmware_mock.get_all_report_details.return_value = response
+        ome_connection_firmware_mock.iter_items.return_value = iter(response["report_list"])
         dev_comp_map = {}
         with pytest.raises(Exception, match=NO_CHANGES_MSG) as exc:
             self.module.baseline_based_update(ome_connection_firmware_mock, f_module, {"baseline_id": 1}, dev_comp_map)
 
+    def test_baseline_based_update_device_components(self, ome_connection_firmware_mock):
+        f_module = self.get_module_mock(params={'components': ["BIOS"]})
+        reports = [
+            {"DeviceId": device_id, "DeviceTypeId": 1000, "DeviceTypeName": "SERVER",
+             "ComponentComplianceReports": [
+                 {"UpdateAction": "UPGRADE", "SourceName": "BIOS.Setup.1-1", "Name": "BIOS"},
+                 {"UpdateAction": "DOWNGRADE", "SourceName": "iDRAC.Embedded.1-1", "Name": "iDRAC"},
+                 {"UpdateAction": "EQUAL", "SourceName": "NIC.Mezzanine.1A-1-1", "Name": "NIC"}]}
+            for device_id in (1111, 2222, 3333)]
+        ome_connection_firmware_mock.iter_items.return_value = iter(reports)
+        dev_comp_map = {"1111": ["iDRAC", "NIC"], "2222": []}
+        compliance_report_list = self.module.baseline_based_update(ome_connection_firmware_mock, f_module,
+                                                                   {"baseline_id": 1}, dev_comp_map)
+        assert compliance_report_list == [
+            {'Id': 1111, 'Data': 'iDRAC.Embedded.1-1', 'TargetType': {'Id': 1000, 'Name': 'SERVER'}},
+            {'Id': 2222, 'Data': 'BIOS.Setup.1-1;iDRAC.Embedded.1-1', 'TargetType': {'Id': 1000, 'Name': 'SERVER'}}]
+        ome_connection_firmware_mock.iter_items.return_value = iter(reports)
+        compliance_report_list = self.module.baseline_based_update(ome_connection_firmware_mock, f_module,
+                                                                   {"baseline_id": 1}, {})
+        assert [target["Data"] for target in compliance_report_list] == ["BIOS.Setup.1-1"] * 3
+
+    def test_get_device_component_map_without_devices(self, ome_connection_firmware_mock):
+        f_module = self.get_module_mock(params={'components': []})
+        assert self.module.get_device_component_map(ome_connection_firmware_mock, f_module) == {}
+        ome_connection_firmware_mock.get_all_report_details.assert_not_called()
+
+    def test_get_device_component_map_service_tags(self, ome_connection_firmware_mock):
+        ome_connection_firmware_mock.get_all_report_details.return_value = {
+            "report_list": [{'Id': 1111, 'DeviceServiceTag': "ABC1111"}, {'Id': 2222, 'DeviceServiceTag': "ABC2222"}]}
+        f_module = self.get_module_mock(params={'components': [],
+                                                'devices': [{'service_tag': "ABC2222", 'components': ["BIOS"]}]})
+        assert self.module.get_device_component_map(ome_connection_firmware_mock, f_module) == {"2222": ["BIOS"]}
+
+    def batch_module_mock(self, **params):
+        params = dict({"batch_size": 2, "max_parallel_jobs": None, "job_wait_timeout": 3600}, **params)
+        return self.get_module_mock(params=params)
+
+    @pytest.fixture
+    def batch_jobs_mock(self, mocker, ome_connection_firmware_mock):
+        mocker.patch(MODULE_PATH + 'ome_firmware.job_payload_for_update',
+                     return_value={"JobName": "Firmware Update Task", "Targets": []})
+        submitted = []
+
+        def spawn_job(rest_obj, job_payload):
+            submitted.append(job_payload)
+            return {"Id": int(job_payload["JobName"].split()[-3]), "JobName": job_payload["JobName"]}
+        mocker.patch(MODULE_PATH + 'ome_firmware.spawn_update_job', side_effect=spawn_job)
+        return submitted
+
+    def job_responses(self, ome_connection_firmware_mock, failed_job=None):
+        def get_job(method, uri, **kwargs):
+            job_id = int(uri.split("(")[-1].rstrip(")"))
+            return MagicMock(json_data={"Id": job_id, "LastRunStatus": {"Id": 2070 if job_id == failed_job else 2060}})
+        ome_connection_firmware_mock.invoke_request.side_effect = get_job
+
+    def test_batch_update_jobs_submitted(self, ome_connection_firmware_mock, batch_jobs_mock):
+        f_module = self.batch_module_mock()
+        target_data = [{"Id": device_id} for device_id in range(5)]
+        update_jobs = self.module.batch_update_jobs(ome_connection_firmware_mock, f_module, target_data, {})
+        assert [job["Id"] for job in update_jobs] == [1, 2, 3]
+        assert [payload["JobName"] for payload in batch_jobs_mock] == [
+            "Firmware Update Task - Batch 1 of 3", "Firmware Update Task - Batch 2 of 3",
+            "Firmware Update Task - Batch 3 of 3"]
+        assert [len(payload["Targets"]) for payload in batch_jobs_mock] == [2, 2, 1]
+        ome_connection_firmware_mock.invoke_request.assert_not_called()
+
+    @pytest.mark.parametrize("max_parallel_jobs, workers", [(None, [8]), (3, [3, 3, 3, 3, 3, 3, 3]), (20, [8])])
+    def test_batch_update_jobs_workers(self, max_parallel_jobs, workers, ome_connection_firmware_mock,
+                                       batch_jobs_mock, mocker):
+        run_mock = mocker.patch(MODULE_PATH + 'ome_firmware.run_concurrently',
+                                side_effect=lambda func, items, max_workers: [func(item) for item in items])
+        f_module = self.batch_module_mock(batch_size=1, max_parallel_jobs=max_parallel_jobs)
+        self.job_responses(ome_connection_firmware_mock)
+        target_data = [{"Id": device_id} for device_id in range(20)]
+        update_jobs = self.module.batch_update_jobs(ome_connection_firmware_mock, f_module, target_data, {})
+        assert len(update_jobs) == 20
+        assert [call[0][2] for call in run_mock.call_args_list] == workers
+
+    def test_batch_update_jobs_waves(self, ome_connection_firmware_mock, batch_jobs_mock):
+        f_module = self.batch_module_mock(batch_size=1, max_parallel_jobs=2)
+        self.job_responses(ome_connection_firmware_mock)
+        target_data = [{"Id": device_id} for device_id in range(5)]
+        update_jobs = self.module.batch_update_jobs(ome_connection_firmware_mock, f_module, target_data, {})
+        assert [job["LastRunStatus"]["Id"] for job in update_jobs] == [2060] * 5
+        assert ome_connection_firmware_mock.invoke_request.call_count == 5
+
+    def test_batch_update_jobs_failed_wave(self, ome_connection_firmware_mock, batch_jobs_mock):
+        f_module = self.batch_module_mock(batch_size=1, max_parallel_jobs=2)
+        self.job_responses(ome_connection_firmware_mock, failed_job=2)
+        target_data = [{"Id": device_id} for device_id in range(5)]
+        with pytest.raises(Exception) as exc:
+            self.module.batch_update_jobs(ome_connection_firmware_mock, f_module, target_data, {})
+        assert exc.value.args[0] == "Unable to complete the firmware update jobs of the batch(es) '2'." \
+                                    " The remaining 3 batch(es) are not submitted."
+        assert len(exc.value.fail_kwargs["update_jobs"]) == 2
+        assert len(batch_jobs_mock) == 2
+
+    def test_batch_update_jobs_submit_error(self, ome_connection_firmware_mock, batch_jobs_mock, mocker):
+        f_module = self.batch_module_mock(batch_size=1, max_parallel_jobs=3)
+        self.job_responses(ome_connection_firmware_mock)
+        spawn_job = self.module.spawn_update_job.side_effect
+
+        def spawn_or_fail(rest_obj, job_payload):
+            if job_payload["JobName"].startswith("Firmware Update Task - Batch 5 "):
+                raise HTTPError('https://testhost.com', 400, 'Bad Request', {}, None)
+            return spawn_job(rest_obj, job_payload)
+        self.module.spawn_update_job.side_effect = spawn_or_fail
+        target_data = [{"Id": device_id} for device_id in range(7)]
+        with pytest.raises(Exception) as exc:
+            self.module.batch_update_jobs(ome_connection_firmware_mock, f_module, target_data, {})
+        assert exc.value.args[0] == "Unable to complete the firmware update jobs of the batch(es) '5'." \
+                                    " The remaining 1 batch(es) are not submitted."
+        update_jobs = exc.value.fail_kwargs["update_jobs"]
+        assert [job.get("Id") for job in update_jobs] == [1, 2, 3, 4, None, 6]
+        assert len(batch_jobs_mock) == 5
+
+    def test_main_firmware_batch_update(self, ome_default_args, mocker, ome_connection_firmware_mock):
+        ome_default_args.update({"baseline_name": "baseline_name", "batch_size": 50, "max_parallel_jobs": 4})
+        mocker.patch(MODULE_PATH + 'ome_firmware.get_baseline_ids', return_value={"baseline_id": 1})
+        mocker.patch(MODULE_PATH + 'ome_firmware.baseline_based_update', return_value=[{"Id": 1111}])
+        mocker.patch(MODULE_PATH + 'ome_firmware.batch_update_jobs', return_value=[{"Id": 1}])
+        data = self._run_module(ome_default_args)
+        assert data['changed'] is True
+        assert data['msg'] == "Successfully completed the firmware update jobs."
+        assert data['update_jobs'] == [{"Id": 1}]
+
+    @pytest.mark.parametrize("params, msg", [
+        ({"dup_file": "/path/file.exe", "batch_size": 10}, "parameters are mutually exclusive: dup_file|batch_size"),
+        ({"baseline_name": "baseline_name", "max_parallel_jobs": 2},
+         "missing parameter(s) required by 'max_parallel_jobs': batch_size"),
+        ({"baseline_name": "baseline_name", "batch_size": 0}, "The value of 'batch_size' must be greater than zero."),
+    ])
+    def test_main_firmware_batch_options(self, params, msg, ome_default_args, ome_connection_firmware_mock):
+        ome_default_args.update(params)
+        data = self._run_module_with_fail_json(ome_default_args)
+        assert data['msg'] == msg
+
     def test_validate_inputs(self):
         f_module = self.get_module_mock(params={"dup_file": "/path/file.exe"})
         msg = "Parameter 'dup_file' to be provided along with 'device_id'|'device_service_tag'|'device_group_names'"
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.0.0
-# Copyright (C) 2019-2022 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -39,18 +39,32 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
 
     def test__get_device_id_from_service_tags_for_baseline_success_case(self, ome_response_mock,
                                                                         ome_connection_mock_for_firmware_baseline_compliance_info):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": [{"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1}]}
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.return_value = [
+            {"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1}]
         f_module = self.get_module_mock()
         data = self.module._get_device_id_from_service_tags([Constants.service_tag1],
                                                             ome_connection_mock_for_firmware_baseline_compliance_info,
                                                             f_module)
         assert data == {Constants.device_id1: Constants.service_tag1}
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.assert_called_once_with(
+            "DeviceService/Devices", "DeviceServiceTag", [Constants.service_tag1], select=["Id", "DeviceServiceTag"])
+        ome_connection_mock_for_firmware_baseline_compliance_info.invoke_request.assert_not_called()
+
+    def test__get_device_id_from_service_tags_not_found_case(self, ome_response_mock,
+                                                             ome_connection_mock_for_firmware_baseline_compliance_info):
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.return_value = []
+        ome_response_mock.json_data = {"value": [{"DeviceServiceTag": Constants.service_tag2,
+                                                  "Id": Constants.device_id2}]}
+        f_module = self.get_module_mock()
+        data = self.module._get_device_id_from_service_tags([Constants.service_tag1],
+                                                            ome_connection_mock_for_firmware_baseline_compliance_info,
+                                                            f_module)
+        assert data == {}
 
     def test__get_device_id_from_service_tags_empty_case(self, ome_response_mock,
                                                          ome_connection_mock_for_firmware_baseline_compliance_info):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": []}
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.return_value = []
+        ome_response_mock.json_data = {"value": []}
         f_module = self.get_module_mock()
         with pytest.raises(Exception) as exc:
             data = self.module._get_device_id_from_service_tags([Constants.service_tag1],
@@ -61,7 +75,7 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_device_id_from_service_tags_for_baseline_error_case(self,
                                                                      ome_connection_mock_for_firmware_baseline_compliance_info,
                                                                      ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.side_effect = HTTPError(
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.side_effect = HTTPError(
             HTTP_ADDRESS, 400, '', {}, None)
         f_module = self.get_module_mock()
         with pytest.raises(HTTPError) as ex:
@@ -72,8 +86,8 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_device_id_from_service_tags_for_baseline_value_error_case(self,
                                                                            ome_connection_mock_for_firmware_baseline_compliance_info,
                                                                            ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": []}
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.return_value = []
+        ome_response_mock.json_data = {"value": []}
         f_module = self.get_module_mock()
         with pytest.raises(Exception) as exc:
             self.module._get_device_id_from_service_tags(["#$%^&"],
@@ -121,8 +135,8 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
 
     def test_get_device_ids_from_group_names_success_case(self, mocker, ome_response_mock,
                                                           ome_connection_mock_for_firmware_baseline_compliance_info):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": [{"Name": "group1", "Id": 123}]}
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.return_value = [
+            {"Name": "group1", "Id": 123}]
         mocker.patch(
             'ansible_collections.dellemc.openmanage.plugins.modules.ome_firmware_baseline_compliance_info.get_device_ids_from_group_ids',
             return_value=[Constants.device_id1, Constants.device_id2])
@@ -133,8 +147,8 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
 
     def test_get_device_ids_from_group_names_empty_case(self, mocker, ome_response_mock,
                                                         ome_connection_mock_for_firmware_baseline_compliance_info):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": []}
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.return_value = []
+        ome_response_mock.json_data = {"value": []}
         mocker.patch(
             'ansible_collections.dellemc.openmanage.plugins.modules.ome_firmware_baseline_compliance_info.get_device_ids_from_group_ids',
             return_value=[])
@@ -146,7 +160,7 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
 
     def test_get_device_ids_from_group_names_error_case(self, ome_connection_mock_for_firmware_baseline_compliance_info,
                                                         ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.side_effect = HTTPError(
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.side_effect = HTTPError(
             HTTP_ADDRESS, 400, '', {}, None)
         f_module = self.get_module_mock(params={"device_group_names": ["abc", "xyz"]})
         with pytest.raises(HTTPError) as ex:
@@ -156,8 +170,8 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_device_ids_from_group_names_value_error_case(self,
                                                               ome_connection_mock_for_firmware_baseline_compliance_info,
                                                               ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": []}
+        ome_connection_mock_for_firmware_baseline_compliance_info.get_items_by_filter.return_value = []
+        ome_response_mock.json_data = {"value": []}
         f_module = self.get_module_mock(params={"device_group_names": ["abc", "xyz"]})
         with pytest.raises(Exception) as exc:
             self.module.get_device_ids_from_group_names(f_module,
@@ -213,9 +227,8 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_baseline_id_from_name_success_case(self, default_ome_args,
                                                     ome_connection_mock_for_firmware_baseline_compliance_info,
                                                     module_mock, ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.return_value = {
-            "value": [{"Name": "baseline_name1", "Id": 111}, {"Name": "baseline_name2",
-                                                              "Id": 222}]}
+        ome_connection_mock_for_firmware_baseline_compliance_info.iter_items.return_value = iter([
+            {"Name": "baseline_name1", "Id": 111}, {"Name": "baseline_name2", "Id": 222}])
         f_module = self.get_module_mock(params={"baseline_name": "baseline_name1"})
         baseline_id = self.module.get_baseline_id_from_name(ome_connection_mock_for_firmware_baseline_compliance_info,
                                                             f_module)
@@ -224,8 +237,8 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_baseline_id_from_name_when_name_not_exists(self, default_ome_args,
                                                             ome_connection_mock_for_firmware_baseline_compliance_info,
                                                             ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.return_value = {
-            "value": [{"Name": "baseline_name1", "Id": 111}]}
+        ome_connection_mock_for_firmware_baseline_compliance_info.iter_items.return_value = iter([
+            {"Name": "baseline_name1", "Id": 111}])
         f_module = self.get_module_mock(params={"baseline_name": "not_exits"})
         with pytest.raises(AnsibleFailJSonException) as exc:
             self.module.get_baseline_id_from_name(ome_connection_mock_for_firmware_baseline_compliance_info, f_module)
@@ -234,8 +247,7 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_baseline_id_from_name_when_baseline_is_empty(self, default_ome_args,
                                                               ome_connection_mock_for_firmware_baseline_compliance_info,
                                                               ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.return_value = {
-            "value": []}
+        ome_connection_mock_for_firmware_baseline_compliance_info.iter_items.return_value = iter([])
         f_module = self.get_module_mock(params={"baseline_name": "baseline_name1"})
         with pytest.raises(AnsibleFailJSonException) as exc:
             self.module.get_baseline_id_from_name(ome_connection_mock_for_firmware_baseline_compliance_info, f_module)
@@ -244,8 +256,7 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_baseline_id_from_name_when_baselinename_is_none(self, default_ome_args,
                                                                  ome_connection_mock_for_firmware_baseline_compliance_info,
                                                                  ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.return_value = {
-            "value": []}
+        ome_connection_mock_for_firmware_baseline_compliance_info.iter_items.return_value = iter([])
         f_module = self.get_module_mock(params={"baseline_notexist": "data"})
         with pytest.raises(AnsibleFailJSonException) as exc:
             self.module.get_baseline_id_from_name(ome_connection_mock_for_firmware_baseline_compliance_info, f_module)
@@ -254,7 +265,7 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_baseline_id_from_name_with_http_error_handlin_case(self,
                                                                     ome_connection_mock_for_firmware_baseline_compliance_info,
                                                                     ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.side_effect = HTTPError(
+        ome_connection_mock_for_firmware_baseline_compliance_info.iter_items.side_effect = HTTPError(
             HTTP_ADDRESS, 400, '', {}, None)
         f_module = self.get_module_mock(params={"baseline_name": "baseline_name1"})
         with pytest.raises(HTTPError) as ex:
@@ -266,10 +277,10 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
                                                        ome_connection_mock_for_firmware_baseline_compliance_info,
                                                        ome_response_mock):
         if exc_type not in [HTTPError, SSLValidationError]:
-            ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.side_effect = exc_type(
+            ome_connection_mock_for_firmware_baseline_compliance_info.iter_items.side_effect = exc_type(
                 'test')
         else:
-            ome_connection_mock_for_firmware_baseline_compliance_info.get_all_items_with_pagination.side_effect = exc_type(
+            ome_connection_mock_for_firmware_baseline_compliance_info.iter_items.side_effect = exc_type(
                 HTTP_ADDRESS, 400, '', {}, None)
         ome_response_mock.status_code = 400
         ome_response_mock.success = False
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.0.0
-# Copyright (C) 2019-2020 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -20,6 +20,7 @@ from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from io import StringIO
 from ansible.module_utils._text import to_text
+from mock import MagicMock
 
 
 MODULE_PATH = 'ansible_collections.dellemc.openmanage.plugins.modules.'
@@ -89,6 +90,57 @@ class TestOmeJobInfo(FakeAnsibleModule):
         assert result['changed'] is False
         assert 'job_info' in result
 
+    @pytest.mark.parametrize("query", [None, {"filter": "JobType/Id eq 8"}])
+    def test_get_jobs_expand_fallback(self, query, ome_default_args, ome_connection_job_info_mock,
+                                      ome_response_mock):
+        jobs = [{"Id": 1, "LastExecutionDetail": {"@odata.id": "/api/JobService/Jobs(1)/LastExecutionDetail"}},
+                {"Id": 2, "LastExecutionDetail": {"@odata.id": "/api/JobService/Jobs(2)/LastExecutionDetail",
+                                                  "Id": 22, "Value": "Completed"}}]
+        expand_error = HTTPError('https://testhost.com', 400, 'Bad Request', {}, None)
+        ome_connection_job_info_mock.get_all_report_details.side_effect = [expand_error, {"report_list": jobs}]
+        ome_connection_job_info_mock.invoke_request.side_effect = [expand_error, MagicMock(
+            json_data={"value": jobs}, status_code=200)]
+        query_param = self.module._get_query_parameters({"system_query_options": query})
+        job_facts, resp_status = self.module.get_jobs(ome_connection_job_info_mock, query_param)
+        assert resp_status == [200]
+        assert job_facts["value"][0]["LastExecutionDetail"] == {}
+        assert job_facts["value"][1]["LastExecutionDetail"] == {"Id": 22, "Value": "Completed"}
+        if query:
+            calls = ome_connection_job_info_mock.invoke_request.call_args_list
+            assert calls[0][1]["query_param"] == {"$filter": "JobType/Id eq 8", "$expand": "LastExecutionDetail"}
+            assert calls[1][1]["query_param"] == {"$filter": "JobType/Id eq 8"}
+        else:
+            calls = ome_connection_job_info_mock.get_all_report_details.call_args_list
+            assert calls[0][1]["query_param"] == {"$expand": "LastExecutionDetail"}
+            assert calls[1][1]["query_param"] is None
+
+    def test_add_last_execution_details(self, ome_connection_job_info_mock, mocker):
+        detail_mock = mocker.patch(MODULE_PATH + "ome_job_info.last_execution_detail_of_a_job",
+                                   side_effect=lambda rest_obj, job_id: {"JobId": job_id})
+        jobs = [{"Id": 1, "LastExecutionDetail": {"Id": 11}}, {"Id": 2, "LastExecutionDetail": {}}, {"Id": 3}]
+        self.module.add_last_execution_details(ome_connection_job_info_mock, jobs, max_workers=2)
+        assert [job["LastExecutionDetail"] for job in jobs] == [{"Id": 11}, {"JobId": 2}, {"JobId": 3}]
+        assert all(job["ExecutionHistories"] == [] for job in jobs)
+        assert detail_mock.call_count == 2
+
+    def test_last_execution_detail_expanded_and_retrieved(self, ome_connection_job_info_mock):
+        def detail():
+            return {"@odata.type": "#JobService.ExecutionHistory", "@odata.id": "/api/JobService/Jobs(1)/LastExecutionDetail",
+                    "Id": 11, "JobName": "Inventory Task", "Progress": "100",
+                    "JobStatus": {"@odata.type": "#JobService.JobStatus", "Id": 2060, "Name": "Completed"},
+                    "ExecutionHistoryDetails@odata.navigationLink": "/api/JobService/Jobs(1)/ExecutionHistories(11)/ExecutionHistoryDetails"}
+        ome_connection_job_info_mock.get_all_report_details.return_value = {"report_list": [
+            {"Id": 1, "LastExecutionDetail": detail()}]}
+        expanded, resp_status = self.module.get_jobs(ome_connection_job_info_mock, {})
+        self.module.add_last_execution_details(ome_connection_job_info_mock, expanded["value"])
+        ome_connection_job_info_mock.get_all_report_details.return_value = {"report_list": [{"Id": 1}]}
+        ome_connection_job_info_mock.invoke_request.return_value = MagicMock(json_data=detail())
+        retrieved, resp_status = self.module.get_jobs(ome_connection_job_info_mock, {})
+        self.module.add_last_execution_details(ome_connection_job_info_mock, retrieved["value"])
+        assert expanded == retrieved
+        assert expanded["value"][0]["LastExecutionDetail"] == {"Id": 11, "JobName": "Inventory Task", "Progress": "100",
+                                                               "JobStatus": {"Id": 2060, "Name": "Completed"}}
+
     def test_job_info_failure_case(self, ome_default_args, ome_connection_job_info_mock,
                                    ome_response_mock):
         ome_response_mock.status_code = 500
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.2.0
-# Copyright (C) 2020-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.10.0
+# Copyright (C) 2020-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -279,3 +279,40 @@ class TestRedfishFirmware(FakeAnsibleModule):
         with patch("{0}.open".format(builtin_module_name), mock_open(read_data="data")) as mock_file:
             result = self.module.firmware_update(redfish_firmware_connection_mock, f_module)
         assert result == redfish_response_mock
+
+    def test_upload_image_retry(self, redfish_default_args, redfish_response_mock, tmp_path, mocker):
+        sleep_mock = mocker.patch(MODULE_PATH + "redfish_firmware.time.sleep")
+        image = tmp_path / "component.exe"
+        image.write_bytes(b"firmware")
+        obj = MagicMock()
+        obj._headers = {"Content-Type": "application/json"}
+        sent = []
+
+        def invoke_request(method, uri, data=None, headers=None, **kwargs):
+            obj._headers.update(headers)
+            sent.append(b"".join(data))
+            if len(sent) == 1:
+                raise URLError("Connection reset by peer")
+            return redfish_response_mock
+        obj.invoke_request.side_effect = invoke_request
+        redfish_default_args.update({"image_uri": str(image), "timeout": 30})
+        f_module = self.get_module_mock(params=redfish_default_args)
+        result = self.module._upload_image(obj, f_module, "/redfish/v1/UpdateService/FirmwareInventory",
+                                           str(image), "etag")
+        assert result == redfish_response_mock
+        assert len(sent) == 2 and sent[0] == sent[1] and b"\r\nfirmware\r\n" in sent[0]
+        assert obj.invoke_request.call_args[1]["headers"]["If-Match"] == "etag"
+        assert obj.invoke_request.call_args[1]["headers"]["Content-Length"] == str(len(sent[0]))
+        assert obj._headers == {"Content-Type": "application/json"}
+        sleep_mock.assert_called_once_with(self.module.UPLOAD_RETRY_INTERVAL)
+
+    def test_upload_image_http_error(self, redfish_default_args, tmp_path, mocker):
+        image = tmp_path / "component.exe"
+        image.write_bytes(b"firmware")
+        obj = MagicMock()
+        obj._headers = {}
+        obj.invoke_request.side_effect = HTTPError(HTTPS_ADDRESS_DELL, 412, "Precondition Failed", {}, None)
+        f_module = self.get_module_mock(params=dict(redfish_default_args, timeout=30))
+        with pytest.raises(HTTPError):
+            self.module._upload_image(obj, f_module, "/push", str(image), "etag")
+        obj.invoke_request.assert_called_once()
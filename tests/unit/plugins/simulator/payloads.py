@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+"""
+Recorded Redfish, OpenManage Enterprise and OMEVV payloads, trimmed to the properties the modules read,
+and builders which register a fleet of them on a DeviceSimulator.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import copy
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.simulator.server import SimulatorResponse
+
+OME_DEVICE = {
+    "@odata.type": "#DeviceService.Device",
+    "Actions": None,
+    "AssetTag": None,
+    "ChassisServiceTag": None,
+    "ConnectionState": True,
+    "DeviceManagement": [{"DnsName": "dnsname.host.com", "InstrumentationName": "MX-12345",
+                          "MacAddress": "11:10:11:10:11:10", "ManagementId": 12345,
+                          "ManagementProfile": [{"HasCreds": 0, "ManagementId": 12345, "ManagementProfileId": 12345,
+                                                 "ManagementURL": "https://192.168.0.1:443", "Status": 1000,
+                                                 "StatusDateTime": "2019-01-21 06:30:08.501"}],
+                          "ManagementType": 2, "NetworkAddress": "192.168.0.1"}],
+    "DeviceName": "MX-0003I",
+    "LastInventoryTime": "2019-01-21 06:30:08.501",
+    "LastStatusTime": "2019-01-21 06:30:02.492",
+    "ManagedState": 3000,
+    "Model": "PowerEdge MX7000",
+    "PowerState": 17,
+    "SlotConfiguration": {},
+    "Status": 4000,
+    "SystemId": 2031,
+    "Type": 1000,
+}
+OME_INVENTORY_DETAILS = [
+    {"InventoryType": "serverDeviceCards",
+     "InventoryInfo": [{"Id": 1, "SlotNumber": "SMBus.Embedded.3-1", "Manufacturer": "Intel Corporation",
+                        "Description": "C620 Series Chipset Family SSATA Controller [AHCI mode]",
+                        "DatabusWidth": "Unknown", "SlotLength": "Unknown", "SlotType": "Unknown"}]},
+    {"InventoryType": "serverProcessors",
+     "InventoryInfo": [{"Id": 1, "Family": "Intel(R) Xeon(TM)", "MaxSpeed": 4000, "CurrentSpeed": 2600,
+                        "SlotNumber": "CPU.Socket.1", "NumberOfCores": 8, "ModelName": "Intel(R) Xeon(R) Gold 6132"}]},
+]
+OME_SUBSYSTEM_HEALTH = [
+    {"@odata.type": "#DeviceService.SubSystemHealthFaultModel", "Category": "Power", "SubSystem": "Power",
+     "RollupStatus": "1000", "FaultList": []},
+    {"@odata.type": "#DeviceService.SubSystemHealthFaultModel", "Category": "Storage", "SubSystem": "Storage",
+     "RollupStatus": "3000", "FaultList": [{"Fqdd": "Disk.Bay.0", "MessageId": "PDR1016", "Severity": "3000"}]},
+]
+OME_JOB = {
+    "@odata.type": "#JobService.Job",
+    "JobName": "Inventory Task",
+    "JobDescription": "Inventory Task",
+    "Schedule": "startnow",
+    "State": "Enabled",
+    "CreatedBy": "admin",
+    "UpdatedBy": None,
+    "Visible": True,
+    "Editable": True,
+    "Builtin": False,
+    "Targets": [],
+    "Params": [],
+    "LastRunStatus": {"@odata.type": "#JobService.JobStatus", "Id": 2060, "Name": "Completed"},
+    "JobType": {"@odata.type": "#JobService.JobType", "Id": 8, "Name": "Inventory_Task", "Internal": False},
+    "JobStatus": {"@odata.type": "#JobService.JobStatus", "Id": 2020, "Name": "Scheduled"},
+}
+OME_EXECUTION_DETAIL = {
+    "@odata.type": "#JobService.ExecutionHistoryDetail",
+    "Progress": "100",
+    "StartTime": "2020-05-18 09:52:42.116",
+    "EndTime": "2020-05-18 09:53:06.133",
+    "Key": "192.168.0.1",
+    "Value": "Running\nInventory: Loading modules for inventory\nCompleted",
+    "ExecutionHistoryId": 1230,
+    "Status": {"Id": 2060, "Name": "Completed"},
+}
+REDFISH_CONTROLLER = {
+    "@odata.type": "#Storage.v1_8_0.Storage",
+    "Description": "PERC H740P Mini",
+    "Name": "PERC H740P Mini",
+    "Status": {"Health": "OK", "HealthRollup": "OK", "State": "Enabled"},
+    "StorageControllers": [{"FirmwareVersion": "51.13.0-3485", "Manufacturer": "DELL",
+                            "SpeedGbps": 12, "SupportedRAIDTypes": ["RAID0", "RAID1", "RAID5", "RAID6", "RAID10"]}],
+    "Oem": {"Dell": {"DellController": {"CacheSizeInMB": 8192, "ControllerMode": "RAID"},
+                     "DellControllerBattery": {"Id": "Battery.Integrated.1:RAID.Integrated.1-1",
+                                               "PrimaryStatus": "OK", "RAIDState": "Ready"}}},
+}
+REDFISH_DRIVE = {
+    "@odata.type": "#Drive.v1_9_0.Drive",
+    "BlockSizeBytes": 512,
+    "CapableSpeedGbs": 12,
+    "CapacityBytes": 599550590976,
+    "Manufacturer": "SEAGATE",
+    "MediaType": "HDD",
+    "Model": "ST600MM0069",
+    "Protocol": "SAS",
+    "Revision": "LS0B",
+    "Status": {"Health": "OK", "State": "Enabled"},
+}
+REDFISH_VOLUME = {
+    "@odata.type": "#Volume.v1_5_0.Volume",
+    "BlockSizeBytes": 512,
+    "CapacityBytes": 599550590976,
+    "Encrypted": False,
+    "RAIDType": "RAID0",
+    "ReadCachePolicy": "Off",
+    "VolumeType": "NonRedundant",
+    "Status": {"Health": "OK", "State": "Enabled"},
+}
+REDFISH_JOB = {
+    "@odata.type": "#DellJob.v1_0_2.DellJob",
+    "JobType": "RepositoryUpdate",
+    "Message": "Job completed successfully.",
+    "MessageArgs": [],
+    "MessageId": "RED001",
+    "Name": "Repository Update",
+    "StartTime": "TIME_NOW",
+    "TargetSettingsURI": None,
+}
+FIRMWARE_PACKAGE = (
+    '<INSTANCENAME CLASSNAME="DCIM_RepoUpdateSWID">'
+    '<PROPERTY NAME="DisplayName" TYPE="string"><VALUE>{name}</VALUE></PROPERTY>'
+    '<PROPERTY NAME="JobID" TYPE="string"><VALUE>{job_id}</VALUE></PROPERTY>'
+    '<PROPERTY NAME="PackageVersion" TYPE="string"><VALUE>2.10.2</VALUE></PROPERTY>'
+    '<PROPERTY NAME="RebootType" TYPE="string"><VALUE>HOST</VALUE></PROPERTY>'
+    '</INSTANCENAME>'
+)
+OMEVV_CONSOLE = {
+    "registeredExtensions": ["PHM", "WEBCLIENT", "PHA", "VLCM"],
+    "consoleVersion": "8.0.3",
+    "state": "Registered",
+}
+
+
+def add_ome_devices(simulator, count):
+    """Registers count devices with their inventory details and sub system health."""
+    devices = []
+    for index in range(count):
+        device_id = 10000 + index
+        device = dict(copy.deepcopy(OME_DEVICE), Id=device_id, Identifier="SVC{0:04d}".format(index),
+                      DeviceServiceTag="SVC{0:04d}".format(index), DeviceName="server-{0}".format(index))
+        device["@odata.id"] = "/api/DeviceService/Devices({0})".format(device_id)
+        device["DeviceManagement"][0]["NetworkAddress"] = "10.0.{0}.{1}".format(index // 250, index % 250 + 1)
+        devices.append(device)
+        simulator.add("/api/DeviceService/Devices({0})/InventoryDetails".format(device_id),
+                      {"@odata.context": "/api/$metadata#Collection(DeviceService.InventoryDetail)",
+                       "value": copy.deepcopy(OME_INVENTORY_DETAILS)})
+        simulator.add("/api/DeviceService/Devices({0})/SubSystemHealth".format(device_id),
+                      {"@odata.context": "/api/$metadata#Collection(DeviceService.SubSystemHealthFaultModel)",
+                       "value": copy.deepcopy(OME_SUBSYSTEM_HEALTH)})
+    simulator.add("/api/DeviceService/Devices", {"@odata.context": "/api/$metadata#Collection(DeviceService.Device)",
+                                                 "value": devices})
+    return devices
+
+
+def add_ome_jobs(simulator, count):
+    """Registers count jobs, the last execution detail of each job is a navigation link."""
+    jobs = []
+    for index in range(count):
+        job_id = 20000 + index
+        job_path = "/api/JobService/Jobs({0})".format(job_id)
+        job = dict(copy.deepcopy(OME_JOB), Id=job_id, JobName="Inventory Task {0}".format(index))
+        job.update({"@odata.id": job_path,
+                    "LastExecutionDetail@odata.navigationLink": job_path + "/LastExecutionDetail",
+                    "ExecutionHistories@odata.navigationLink": job_path + "/ExecutionHistories"})
+        jobs.append(job)
+        simulator.add(job_path, job)
+        simulator.add(job_path + "/LastExecutionDetail", dict(copy.deepcopy(OME_EXECUTION_DETAIL), Id=job_id + 1))
+    simulator.add("/api/JobService/Jobs", {"@odata.context": "/api/$metadata#Collection(JobService.Job)",
+                                           "value": jobs})
+    return jobs
+
+
+def add_ome_groups(simulator, devices, sub_groups):
+    """
+    Registers the 'All Devices' group with the devices as leaf devices and sub_groups child groups,
+    the devices are split across the child groups.
+    """
+    def group(group_id, name, members, children):
+        path = "/api/GroupService/Groups({0})".format(group_id)
+        simulator.add(path + "/AllLeafDevices", {"value": members})
+        simulator.add(path + "/SubGroups", {"value": children})
+        return {"@odata.id": path, "Id": group_id, "Name": name, "Visible": True,
+                "AllLeafDevices@odata.navigationLink": path + "/AllLeafDevices",
+                "SubGroups@odata.navigationLink": path + "/SubGroups"}
+
+    children = [group(1000 + index, "Group {0}".format(index), devices[index::sub_groups], [])
+                for index in range(sub_groups)]
+    groups = [group(500, "All Devices", devices, children)] + children
+    simulator.add("/api/GroupService/Groups", {"value": groups})
+    return groups
+
+
+def add_idrac_manager(simulator, firmware_version="7.00.00.00"):
+    """Registers the system and the manager of an iDRAC."""
+    simulator.add_members("/redfish/v1/Systems", [{"@odata.id": "/redfish/v1/Systems/System.Embedded.1",
+                                                   "Id": "System.Embedded.1", "Model": "PowerEdge R750",
+                                                   "Storage": {"@odata.id": "/redfish/v1/Systems/System.Embedded.1/Storage"}}])
+    simulator.add_members("/redfish/v1/Managers", [{"@odata.id": "/redfish/v1/Managers/iDRAC.Embedded.1",
+                                                    "Id": "iDRAC.Embedded.1", "FirmwareVersion": firmware_version,
+                                                    "Model": "16G Monolithic"}])
+
+
+def add_idrac_storage(simulator, controllers, drives, volumes):
+    """Registers controllers, each with drives physical disks in one enclosure and volumes virtual disks."""
+    storage = "/redfish/v1/Systems/System.Embedded.1/Storage"
+    members = []
+    for index in range(controllers):
+        controller_id = "RAID.Integrated.{0}-1".format(index + 1)
+        controller_uri = "{0}/{1}".format(storage, controller_id)
+        enclosure_uri = "/redfish/v1/Chassis/Enclosure.Internal.0-1:{0}".format(controller_id)
+        drive_refs = []
+        for drive in range(drives):
+            drive_uri = "{0}/Drives/Disk.Bay.{1}:Enclosure.Internal.0-1:{2}".format(controller_uri, drive, controller_id)
+            simulator.add(drive_uri, dict(copy.deepcopy(REDFISH_DRIVE), Id=drive_uri.split("/")[-1],
+                                          **{"@odata.id": drive_uri}))
+            drive_refs.append({"@odata.id": drive_uri})
+        simulator.add(enclosure_uri, {"@odata.id": enclosure_uri, "Id": enclosure_uri.split("/")[-1],
+                                      "Links": {"Drives": drive_refs}})
+        simulator.add_members(controller_uri + "/Volumes", [
+            dict(copy.deepcopy(REDFISH_VOLUME), Id="Disk.Virtual.{0}:{1}".format(volume, controller_id),
+                 Links={"Drives": drive_refs[volume:volume + 1]},
+                 **{"@odata.id": "{0}/Volumes/Disk.Virtual.{1}:{2}".format(controller_uri, volume, controller_id)})
+            for volume in range(volumes)])
+        members.append(dict(copy.deepcopy(REDFISH_CONTROLLER), Id=controller_id, Drives=drive_refs,
+                            Volumes={"@odata.id": controller_uri + "/Volumes"},
+                            Links={"Enclosures": [{"@odata.id": enclosure_uri}]},
+                            **{"@odata.id": controller_uri}))
+    simulator.add_members(storage, members)
+
+
+def add_idrac_firmware_repository(simulator, components, running_polls=2):
+    """
+    Registers the repository update of an iDRAC, the repository job and the update job of each of the
+    components run for running_polls polls before they complete.
+    """
+    service = "/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService"
+    simulator.add(service, {"@odata.id": service, "Id": "DellSoftwareInstallationService"})
+
+    def job_states(job_id, job_type):
+        running = dict(copy.deepcopy(REDFISH_JOB), Id=job_id, JobType=job_type, JobState="Running",
+                       PercentComplete=50, Message="Job in progress.")
+        completed = dict(copy.deepcopy(REDFISH_JOB), Id=job_id, JobType=job_type, JobState="Completed",
+                         PercentComplete=100, JobStatus="OK",
+                         Messages=[{"Message": "Job completed successfully.", "MessageId": "RED001"}])
+        return [running] * running_polls + [completed]
+
+    repository_job = "/redfish/v1/JobService/Jobs/JID_000000000001"
+    simulator.add_action("POST", service + "/Actions/DellSoftwareInstallationService.InstallFromRepository",
+                         SimulatorResponse(202, headers={"Location": repository_job}),
+                         job=(repository_job, job_states("JID_000000000001", "RepositoryUpdate")))
+    packages = []
+    for index in range(components):
+        job_id = "JID_{0:012d}".format(index + 2)
+        simulator.add_job("/redfish/v1/JobService/Jobs/" + job_id, job_states(job_id, "FirmwareUpdate"))
+        packages.append(FIRMWARE_PACKAGE.format(name="Component {0}".format(index), job_id=job_id))
+    simulator.add_action("POST", service + "/Actions/DellSoftwareInstallationService.GetRepoBasedUpdateList",
+                         SimulatorResponse(200, {"PackageList": "<PackageList>{0}</PackageList>".format("".join(packages))}))
+
+
+def add_omevv_consoles(simulator, count):
+    """Registers count vCenters on OMEVV."""
+    consoles = [dict(copy.deepcopy(OMEVV_CONSOLE), uuid="{0:08d}-0000-0000-0000-000000000000".format(index),
+                     consoleId=str(index + 1), consoleAddress="vcenter{0}.example.com".format(index))
+                for index in range(count)]
+    simulator.add("/omevv/GatewayService/v1/Consoles", consoles)
+    return consoles
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.10.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import copy
+import datetime
+import json
+import os
+import re
+import ssl
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, quote, unquote, urlsplit
+
+OME_ROOT = "/api"
+OME_SESSIONS = "/api/SessionService/Sessions"
+OMEVV_ROOT = "/omevv/GatewayService/v1"
+REDFISH_SESSIONS = ("/redfish/v1/SessionService/Sessions", "/redfish/v1/Sessions")
+DEFAULT_PAGE_SIZE = 50
+EXPAND_REGEX = r"^[*.~]\(\$levels=\d+\)$"
+FILTER_CLAUSE_REGEX = r"^\s*(\w+)\s+eq\s+('(?:[^']|'')*'|-?\d+)\s*$"
+
+_CERTIFICATE = {}
+_CERTIFICATE_LOCK = threading.Lock()
+
+
+def get_certificate():
+    """
+    Returns the paths of a self-signed certificate and its key, generated once per process.
+    :return: tuple of the certificate file and the key file
+    """
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+    with _CERTIFICATE_LOCK:
+        if not _CERTIFICATE:
+            key = ec.generate_private_key(ec.SECP256R1())
+            name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, u"localhost")])
+            now = datetime.datetime.now(datetime.timezone.utc)
+            cert = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(
+                key.public_key()).serial_number(x509.random_serial_number()).not_valid_before(
+                now - datetime.timedelta(days=1)).not_valid_after(now + datetime.timedelta(days=1)).sign(
+                key, hashes.SHA256())
+            cert_dir = tempfile.mkdtemp(prefix="omam_simulator_")
+            cert_file, key_file = os.path.join(cert_dir, "cert.pem"), os.path.join(cert_dir, "key.pem")
+            with open(cert_file, "wb") as file_obj:
+                file_obj.write(cert.public_bytes(serialization.Encoding.PEM))
+            with open(key_file, "wb") as file_obj:
+                file_obj.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                                 serialization.NoEncryption()))
+            _CERTIFICATE.update(cert_file=cert_file, key_file=key_file)
+    return _CERTIFICATE["cert_file"], _CERTIFICATE["key_file"]
+
+
+def parse_or_filter(expression):
+    """
+    Parses an OData filter made of 'eq' comparisons joined with 'or', the form the modules send.
+    :return: list of (property, value) pairs
+    :raises ValueError: for any other expression
+    """
+    clauses = []
+    for clause in re.split(r"\s+or\s+", expression):
+        match = re.match(FILTER_CLAUSE_REGEX, clause)
+        if not match:
+            raise ValueError("Unsupported filter '{0}'.".format(expression))
+        value = match.group(2)
+        value = value[1:-1].replace("''", "'") if value.startswith("'") else int(value)
+        clauses.append((match.group(1), value))
+    return clauses
+
+
+class SimulatorResponse(object):
+    """Response of a request handled by the simulator."""
+
+    def __init__(self, status=200, body=None, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = dict(headers or {})
+
+    def encode(self):
+        if self.body is None:
+            return b""
+        if isinstance(self.body, bytes):
+            return self.body
+        if isinstance(self.body, str):
+            return self.body.encode("utf-8")
+        self.headers.setdefault("Content-Type", "application/json")
+        return json.dumps(self.body).encode("utf-8")
+
+
+class DeviceSimulator(object):
+    """
+    Offline HTTPS server which serves recorded Redfish, OpenManage Enterprise and OMEVV resources
+    to the REST clients of the collection.
+
+    * Resources are documents registered with their path, for example '/redfish/v1/Systems' or
+      '/api/DeviceService/Devices'.
+    * OpenManage Enterprise collections, documents with a 'value' list, are paginated with $top, $skip
+      and '@odata.nextLink', and support 'eq' filters joined with 'or', $select and $expand of
+      navigation links.
+    * Redfish collections, documents with a 'Members' list, support $expand with one level.
+    * Jobs return the next document of their progression on every GET and keep the last one.
+    * Actions respond to POST, PATCH, PUT and DELETE requests, a response can start a job.
+    * Sessions of OpenManage Enterprise and Redfish are created and deleted, OMEVV and Redfish
+      requests can also use basic authentication.
+    * Every request is recorded and can be delayed with latency seconds.
+    """
+
+    def __init__(self, latency=0, page_size=DEFAULT_PAGE_SIZE):
+        """
+        :param latency: seconds each request is delayed before it is answered
+        :param page_size: number of items of an OpenManage Enterprise collection returned without $top
+        """
+        self.latency = latency
+        self.page_size = page_size
+        self.resources = {}
+        self.actions = {}
+        self.jobs = {}
+        self.sessions = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def host(self):
+        return self._server.server_address[0]
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def add(self, path, document):
+        """Registers a document served for GET requests of path."""
+        self.resources[path] = document
+        return document
+
+    def add_members(self, path, members):
+        """Registers a Redfish collection and its members, members is a list of documents with '@odata.id'."""
+        for member in members:
+            self.add(member["@odata.id"], member)
+        return self.add(path, {"@odata.id": path, "Members": [{"@odata.id": member["@odata.id"]} for member in members],
+                               "Members@odata.count": len(members)})
+
+    def add_job(self, path, states):
+        """Registers a job, each GET request returns the next document of states and the last one is kept."""
+        self.jobs[path] = [copy.deepcopy(state) for state in states]
+
+    def add_action(self, method, path, response=None, job=None):
+        """
+        Registers the response of a request which is not a GET.
+        :param response: SimulatorResponse or a callable invoked with the request body returning one
+        :param job: (optional) tuple of the job path and its states, the job is started by the request
+        """
+        self.actions[(method, path)] = (response or SimulatorResponse(204), job)
+
+    def count(self, method=None, prefix=""):
+        """Returns the number of requests recorded for method and paths starting with prefix."""
+        with self._lock:
+            return len([req for req in self.requests
+                        if (method is None or req[0] == method) and req[1].startswith(prefix)])
+
+    def reset(self):
+        """Clears the recorded requests."""
+        with self._lock:
+            del self.requests[:]
+
+    def start(self):
+        cert_file, key_file = get_certificate()
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_file, key_file)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_class(self))
+        self._server.daemon_threads = True
+        self._server.socket = context.wrap_socket(self._server.socket, server_side=True,
+                                                  do_handshake_on_connect=False)
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05})
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def handle(self, method, raw_path, headers, body):
+        """Returns the SimulatorResponse of a request."""
+        split = urlsplit(raw_path)
+        path, query = unquote(split.path).rstrip("/"), dict(parse_qsl(split.query, keep_blank_values=True))
+        with self._lock:
+            self.requests.append((method, path, query))
+        if self.latency:
+            time.sleep(self.latency)
+        if method == "POST" and (path == OME_SESSIONS or path in REDFISH_SESSIONS):
+            return self._create_session(path, body)
+        if not self._is_authorized(headers):
+            return SimulatorResponse(401, {"error": {"message": "Unable to authenticate the request."}})
+        try:
+            if method == "GET":
+                return self._get(path, query)
+            if method == "DELETE" and path in self.sessions:
+                self.resources.pop(path, None)
+                self.sessions.pop(path, None)
+                return SimulatorResponse(204)
+            return self._action(method, path, body)
+        except ValueError as err:
+            return SimulatorResponse(400, {"error": {"message": str(err)}})
+
+    def _is_authorized(self, headers):
+        token = headers.get("X-Auth-Token")
+        if token is not None:
+            return token in self.sessions.values()
+        return headers.get("Authorization", "").startswith("Basic ")
+
+    def _create_session(self, path, body):
+        with self._lock:
+            session_id = str(len(self.sessions) + 1)
+        token = "token-{0}".format(session_id)
+        if path == OME_SESSIONS:
+            session_path = "{0}('{1}')".format(OME_SESSIONS, session_id)
+        else:
+            session_path = "{0}/{1}".format(path, session_id)
+        self.sessions[session_path] = token
+        document = self.add(session_path, {"@odata.id": session_path, "Id": session_id,
+                                           "UserName": json.loads(body or "{}").get("UserName")})
+        return SimulatorResponse(201, document, {"X-Auth-Token": token, "Location": session_path})
+
+    def _get(self, path, query):
+        if path in self.jobs:
+            with self._lock:
+                states = self.jobs[path]
+                state = states.pop(0) if len(states) > 1 else states[0]
+            return SimulatorResponse(200, copy.deepcopy(state))
+        if path not in self.resources:
+            return SimulatorResponse(404, {"error": {"message": "Resource {0} not found.".format(path)}})
+        document = self.resources[path]
+        if not isinstance(document, dict):
+            return SimulatorResponse(200, copy.deepcopy(document))
+        if isinstance(document.get("value"), list):
+            return SimulatorResponse(200, self._query_collection(path, document, query))
+        document = copy.deepcopy(document)
+        expand = query.get("$expand")
+        if expand and isinstance(document.get("Members"), list):
+            if not re.match(EXPAND_REGEX, expand):
+                raise ValueError("Unsupported expand '{0}'.".format(expand))
+            document["Members"] = [copy.deepcopy(self.resources.get(member["@odata.id"], member))
+                                   for member in document["Members"]]
+        return SimulatorResponse(200, document)
+
+    def _query_collection(self, path, document, query):
+        items = document["value"]
+        if "$filter" in query:
+            clauses = parse_or_filter(query["$filter"])
+            items = [item for item in items if any(item.get(key) == value for key, value in clauses)]
+        top = int(query.get("$top", self.page_size))
+        skip = int(query.get("$skip", 0))
+        page = copy.deepcopy(items[skip:skip + top])
+        if "$expand" in query:
+            for item in page:
+                for name in query["$expand"].split(","):
+                    link = item.get("{0}@odata.navigationLink".format(name))
+                    if link is None:
+                        raise ValueError("Unsupported expand '{0}'.".format(name))
+                    item[name] = copy.deepcopy(self.resources.get(link))
+        if "$select" in query:
+            names = query["$select"].split(",")
+            page = [dict((key, value) for key, value in item.items() if key in names or key == "@odata.id")
+                    for item in page]
+        result = dict((key, value) for key, value in document.items() if key != "value")
+        result.update({"@odata.count": len(items), "value": page})
+        if skip + top < len(items):
+            next_query = dict((key, value) for key, value in query.items() if key in ("$filter", "$select", "$expand"))
+            next_query.update({"$skip": skip + top, "$top": top})
+            result["@odata.nextLink"] = "{0}?{1}".format(path, "&".join(
+                "{0}={1}".format(key, quote(str(value), safe="'(),")) for key, value in next_query.items()))
+        return result
+
+    def _action(self, method, path, body):
+        if (method, path) not in self.actions:
+            return SimulatorResponse(405, {"error": {"message": "{0} is not supported for {1}.".format(method, path)}})
+        response, job = self.actions[(method, path)]
+        if callable(response):
+            response = response(json.loads(body) if body else None)
+        if job is not None:
+            self.add_job(*job)
+        return SimulatorResponse(response.status, copy.deepcopy(response.body), response.headers)
+
+
+def _handler_class(simulator):
+
+    class SimulatorRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _respond(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else None
+            response = simulator.handle(self.command, self.path, self.headers, body)
+            payload = response.encode()
+            self.send_response(response.status)
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _respond
+
+        def log_message(self, format, *args):
+            pass
+
+    return SimulatorRequestHandler